@@ -1,2575 +1,3522 @@
-from typing import Optional, Dict
-from lightstreamer.client import LightstreamerClient, Subscription, ItemUpdate
-from lightstreamer.client import SubscriptionListener
+import copy
+import math
+import os
+import stat
+import struct
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import compress
+from time import gmtime, monotonic, sleep, strftime, time
+from typing import Optional, Dict, List, NamedTuple
+
+
+def _lightstreamer():
+    """lightstreamer.client, imported on the first live connect() rather than with this module"""
+    from lightstreamer import client
+    return client
 
 
 class ISSStatusUpdater:
-    def __init__(self):
+    """connection status for one ISS object, several can listen to one client"""
+    def __init__(self, streaming: Optional[threading.Event] = None):
         self.status = "DISCONNECTED"
+        # set while the client is streaming, for connect(wait=True)
+        self.streaming = streaming if streaming is not None else threading.Event()
+        # more objects with onStatusChange(status), they follow this ISS
+        # object across reconnects rather than one client
+        self.listeners = ()
+        # status -> seconds spent in it before the current one, and how
+        # many times streaming started
+        self.since = monotonic()
+        self.durations = {}
+        self.streams = 0
 
     def onStatusChange(self,status):
+        now = monotonic()
+        self.durations[self.status] = self.durations.get(self.status, 0.0) + now - self.since
+        self.since = now
         self.status = status
         print(f"Connection Status: {self.status}")
         if status == "CONNECTED:WS-STREAMING" or status == "CONNECTED:HTTP-STREAMING":
-            ISS.is_connected = True
+            if not self.streaming.is_set():
+                self.streams += 1
+            self.streaming.set()
         else:
-            ISS.is_connected = False
-    
-
-
-class ISSNodeUpdateListener:
-    def __init__(self,data_store):
-        self.data = data_store
-
-
-    def onItemUpdate(self, update):
-        item = update.getItemName()
-        value = update.getValue("Value")
-        #value = round(float(value),2) add a float checker and add this rounder to all floats
-        self.data[item] = value
-        #print(self.data)
-
-
-class ISS:
-    """a wrapper to get the live nodes from the ISS lightstreamer"""
-    is_connected = False
-    def __init__(self):
-        self._data = {}
-        self._client = None
-
-        self._iss_telemetry_nodes = {
-
-    # Control Moment Gyroscope (CMG) - Attitude Control
-    'cmg_1_online': 'USLAB000001',
-    'cmg_2_online': 'USLAB000002',
-    'cmg_3_online': 'USLAB000003',
-    'cmg_4_online': 'USLAB000004',
-    'cmgs_online_count': 'USLAB000005',
-    'cmg_control_torque_roll': 'USLAB000006',
-    'cmg_control_torque_pitch': 'USLAB000007',
-    'cmg_control_torque_yaw': 'USLAB000008',
-    'cmg_active_momentum': 'USLAB000009',
-    'cmg_momentum_percentage': 'USLAB000010',
-    'desaturation_request': 'USLAB000011',
-    'gnc_mode': 'USLAB000012',
-    'attitude_source': 'USLAB000013',
-    'rate_source': 'USLAB000014',
-    'state_vector_source': 'USLAB000015',
-    'attitude_controller_type': 'USLAB000016',
-    'attitude_control_reference_frame': 'USLAB000017',
-    
-    # Attitude Quaternions
-    'lvlh_quaternion_0': 'USLAB000018',
-    'lvlh_quaternion_1': 'USLAB000019',
-    'lvlh_quaternion_2': 'USLAB000020',
-    'lvlh_quaternion_3': 'USLAB000021',
-    'attitude_roll_error': 'USLAB000022',
-    'attitude_pitch_error': 'USLAB000023',
-    'attitude_yaw_error': 'USLAB000024',
-    'commanded_quaternion_0': 'USLAB000025',
-    'commanded_quaternion_1': 'USLAB000026',
-    'commanded_quaternion_2': 'USLAB000027',
-    'commanded_quaternion_3': 'USLAB000028',
-    
-    # Position and Velocity State Vectors
-    'state_vector_x_pos': 'USLAB000032',
-    'state_vector_y_pos': 'USLAB000033',
-    'state_vector_z_pos': 'USLAB000034',
-    'state_vector_x_vel': 'USLAB000035',
-    'state_vector_y_vel': 'USLAB000036',
-    'state_vector_z_vel': 'USLAB000037',
-    
-    # Station and System Status
-    'cmg_capacity': 'USLAB000038',
-    'iss_total_mass': 'USLAB000039',
-    'solar_beta_angle': 'USLAB000040',
-    'loac_cmg_alarm': 'USLAB000041',
-    'loac_iss_alarm': 'USLAB000042',
-    'gps_1_status': 'USLAB000043',
-    'gps_2_status': 'USLAB000044',
-    
-    # CMG Temperatures
-    'cmg_1_spin_motor_temp': 'USLAB000045',
-    'cmg_2_spin_motor_temp': 'USLAB000046',
-    'cmg_3_spin_motor_temp': 'USLAB000047',
-    'cmg_4_spin_motor_temp': 'USLAB000048',
-    'cmg_1_hall_resolver_temp': 'USLAB000049',
-    'cmg_2_hall_resolver_temp': 'USLAB000050',
-    'cmg_3_hall_resolver_temp': 'USLAB000051',
-    'cmg_4_hall_resolver_temp': 'USLAB000052',
-    
-    # Environmental Control and Life Support
-    'lab_ppo2': 'USLAB000053',
-    'lab_ppn2': 'USLAB000054',
-    'lab_ppco2': 'USLAB000055',
-    'lab_coolant_lt': 'USLAB000056',
-    'lab_coolant_mt': 'USLAB000057',
-    'cabin_pressure': 'USLAB000058',
-    'cabin_temperature': 'USLAB000059',
-    'lab_avionics_temp': 'USLAB000060',
-    'lab_air_cooling_temp': 'USLAB000061',
-    'vacuum_resource_valve': 'USLAB000062',
-    'vacuum_exhaust_valve': 'USLAB000063',
-    'lab_port_ac_state': 'USLAB000064',
-    'lab_starboard_ac_state': 'USLAB000065',
-    
-    # Multiplexer/Demultiplexer Status
-    'cc_mdm_1_status': 'USLAB000066',
-    'cc_mdm_2_status': 'USLAB000067',
-    'cc_mdm_3_status': 'USLAB000068',
-    'icz_mdm_1_status': 'USLAB000069',
-    'icz_mdm_2_status': 'USLAB000070',
-    'pl_mdm_1_status': 'USLAB000071',
-    'pl_mdm_2_status': 'USLAB000072',
-    'gnc_mdm_1_status': 'USLAB000073',
-    'gnc_mdm_2_status': 'USLAB000074',
-    'pmcu_1_mdm_status': 'USLAB000075',
-    'pmcu_2_mdm_status': 'USLAB000076',
-    'lab_mdm_1_status': 'USLAB000077',
-    'lab_mdm_2_status': 'USLAB000078',
-    'lab_mdm_3_status': 'USLAB000079',
-    'pmm_power_status': 'USLAB000080',
-    
-    # Mission Control and Commands
-    'attitude_maneuver_in_progress': 'USLAB000081',
-    'standard_command_counter': 'USLAB000082',
-    'data_load_command_counter': 'USLAB000083',
-    'cc_mdm_time_coarse': 'USLAB000084',
-    'cc_mdm_time_fine': 'USLAB000085',
-    'station_mode': 'USLAB000086',
-    'laptops_active': 'USLAB000087',
-    
-    # Communications
-    'ku_video_ch1_activity': 'USLAB000088',
-    'ku_video_ch2_activity': 'USLAB000089',
-    'ku_video_ch3_activity': 'USLAB000090',
-    'ku_video_ch4_activity': 'USLAB000091',
-    'sband_active_string': 'USLAB000092',
-    'iac_1_status': 'USLAB000093',
-    'iac_2_status': 'USLAB000094',
-    'video_downlink_1': 'USLAB000095',
-    'video_downlink_2': 'USLAB000096',
-    'video_downlink_3': 'USLAB000097',
-    'video_downlink_4': 'USLAB000098',
-    'uhf_1_power': 'USLAB000099',
-    'uhf_2_power': 'USLAB000100',
-    'uhf_frame_sync': 'USLAB000101',
-    
-    # CMG Vibration and Performance (Z1000 series)
-    'cmg_1_vibration': 'Z1000001',
-    'cmg_2_vibration': 'Z1000002',
-    'cmg_3_vibration': 'Z1000003',
-    'cmg_4_vibration': 'Z1000004',
-    'cmg_1_spin_motor_current': 'Z1000005',
-    'cmg_2_spin_motor_current': 'Z1000006',
-    'cmg_3_spin_motor_current': 'Z1000007',
-    'cmg_4_spin_motor_current': 'Z1000008',
-    'cmg_1_wheel_speed': 'Z1000009',
-    'cmg_2_wheel_speed': 'Z1000010',
-    'cmg_3_wheel_speed': 'Z1000011',
-    'cmg_4_wheel_speed': 'Z1000012',
-    'ku_transmit': 'Z1000013',
-    'ku_sgant_elevation': 'Z1000014',
-    'ku_sgant_cross_elevation': 'Z1000015',
-    
-    # Node Systems
-    'airlock_mdm_status': 'AIRLOCK000058',
-    'node1_mdm_1_status': 'NODE1000001',
-    'node1_mdm_2_status': 'NODE1000002',
-    'node2_mdm_2_status': 'NODE2000004',
-    'node2_mdm_1_status': 'NODE2000005',
-    'node3_hcz_mdm_2_status': 'NODE3000014',
-    'node3_mdm_2_status': 'NODE3000015',
-    'node3_hcz_mdm_1_status': 'NODE3000016',
-    'node3_mdm_1_status': 'NODE3000020',
-    
-    # Truss Systems and Solar Arrays
-    'p1_mdm_1_status': 'P1000006',
-    'p1_str_mdm_status': 'P1000008',
-    'p1_mdm_2_status': 'P1000009',
-    'p3_mdm_1_status': 'P3000001',
-    'p3_mdm_2_status': 'P3000002',
-    's0_ecz_mdm_1_status': 'S0000010',
-    's0_mdm_1_status': 'S0000011',
-    's0_ecz_mdm_2_status': 'S0000012',
-    's0_mdm_2_status': 'S0000013',
-    's1_str_mdm_status': 'S1000006',
-    's1_mdm_1_status': 'S1000007',
-    's1_mdm_2_status': 'S1000008',
-    's3_mdm_1_status': 'S3000001',
-    's3_mdm_2_status': 'S3000002',
-    
-    # Solar Array Power Systems
-    'solar_array_2a_mdm_status': 'P4000003',
-    'solar_array_4a_mdm_status': 'P4000006',
-    'solar_array_4b_mdm_status': 'P6000003',
-    'solar_array_2b_mdm_status': 'P6000006',
-    'solar_array_1a_mdm_status': 'S4000003',
-    'solar_array_3a_mdm_status': 'S4000006',
-    'solar_array_3b_mdm_status': 'S6000003',
-    'solar_array_1b_mdm_status': 'S6000006',
-    
-    # Antenna Systems
-    'sband_rfg2_azimuth': 'P1000004',
-    'sband_rfg2_elevation': 'P1000005',
-    'sband_rfg2_status': 'P1000007',
-    'sband_rfg1_azimuth': 'S1000004',
-    'sband_rfg1_elevation': 'S1000005',
-    'sband_rfg1_status': 'S1000009',
-    
-    # Thermal Control Systems
-    'loop_b_pump_flowrate': 'P1000001',
-    'loop_b_pm_pressure': 'P1000002',
-    'loop_b_pm_temp': 'P1000003',
-    'loop_a_pump_flowrate': 'S1000001',
-    'loop_a_pm_pressure': 'S1000002',
-    'loop_a_pm_temp': 'S1000003',
-    
-    # Solar Array Drive Systems
-    'solar_2a_drive_voltage': 'P4000001',
-    'solar_2a_drive_current': 'P4000002',
-    'solar_4a_drive_voltage': 'P4000004',
-    'solar_4a_drive_current': 'P4000005',
-    'solar_2a_bga_position': 'P4000007',
-    'solar_4a_bga_position': 'P4000008',
-    'solar_4b_drive_voltage': 'P6000001',
-    'solar_4b_drive_current': 'P6000002',
-    'solar_2b_drive_voltage': 'P6000004',
-    'solar_2b_drive_current': 'P6000005',
-    'solar_4b_bga_position': 'P6000007',
-    'solar_2b_bga_position': 'P6000008',
-    'solar_1a_drive_voltage': 'S4000001',
-    'solar_1a_drive_current': 'S4000002',
-    'solar_3a_drive_voltage': 'S4000004',
-    'solar_3a_drive_current': 'S4000005',
-    'solar_1a_bga_position': 'S4000007',
-    'solar_3a_bga_position': 'S4000008',
-    'solar_3b_drive_voltage': 'S6000001',
-    'solar_3b_drive_current': 'S6000002',
-    'solar_1b_drive_voltage': 'S6000004',
-    'solar_1b_drive_current': 'S6000005',
-    'solar_3b_bga_position': 'S6000007',
-    'solar_1b_bga_position': 'S6000008',
-    
-    # Joint Positions
-    'starboard_trrj_position': 'S0000001',
-    'port_trrj_position': 'S0000002',
-    'starboard_sarj_position': 'S0000003',
-    'port_sarj_position': 'S0000004',
-    'port_sarj_commanded_position': 'S0000005',
-    'trrj_loop_b_mode': 'S0000006',
-    'trrj_loop_a_mode': 'S0000007',
-    'sarj_port_mode': 'S0000008',
-    'sarj_starboard_mode': 'S0000009',
-    
-    # Node Environmental Systems
-    'node2_coolant_mt': 'NODE2000001',
-    'node2_coolant_lt': 'NODE2000002',
-    'node2_ac_state': 'NODE2000003',
-    'node2_air_cooling_temp': 'NODE2000006',
-    'node2_avionics_temp': 'NODE2000007',
-    'node3_ppo2': 'NODE3000001',
-    'node3_ppn2': 'NODE3000002',
-    'node3_ppco2': 'NODE3000003',
-    'urine_processor_state': 'NODE3000004',
-    'urine_tank_qty': 'NODE3000005',
-    'water_processor_state': 'NODE3000006',
-    'water_processor_step': 'NODE3000007',
-    'waste_water_tank_qty': 'NODE3000008',
-    'clean_water_tank_qty': 'NODE3000009',
-    'oxygen_generator_state': 'NODE3000010',
-    'o2_production_rate': 'NODE3000011',
-    'node3_avionics_temp': 'NODE3000012',
-    'node3_air_cooling_temp': 'NODE3000013',
-    'node3_coolant_qty_1': 'NODE3000017',
-    'node3_ac_state': 'NODE3000018',
-    'node3_coolant_qty_2': 'NODE3000019',
-    
-    # Airlock Systems
-    'crewlock_pressure': 'AIRLOCK000049',
-    'hi_p_o2_valve_position': 'AIRLOCK000050',
-    'lo_p_o2_valve_position': 'AIRLOCK000051',
-    'n2_supply_valve_position': 'AIRLOCK000052',
-    'airlock_ac_state': 'AIRLOCK000053',
-    'airlock_pressure': 'AIRLOCK000054',
-    'airlock_hi_p_o2_pressure': 'AIRLOCK000055',
-    'airlock_lo_p_o2_pressure': 'AIRLOCK000056',
-    'airlock_n2_pressure': 'AIRLOCK000057',
-    
-    # Airlock Power Systems (EMU and BCA)
-    'emu_1_voltage': 'AIRLOCK000001',
-    'emu_1_current': 'AIRLOCK000002',
-    'emu_2_voltage': 'AIRLOCK000003',
-    'emu_2_current': 'AIRLOCK000004',
-    'iru_voltage': 'AIRLOCK000005',
-    'iru_current': 'AIRLOCK000006',
-    'eva_emu_1_voltage': 'AIRLOCK000007',
-    'eva_emu_1_current': 'AIRLOCK000008',
-    'eva_emu_2_voltage': 'AIRLOCK000009',
-    'eva_emu_2_current': 'AIRLOCK000010',
-    'bca_1_voltage': 'AIRLOCK000011',
-    'bca_1_current': 'AIRLOCK000012',
-    'bca_2_voltage': 'AIRLOCK000013',
-    'bca_2_current': 'AIRLOCK000014',
-    'bca_3_voltage': 'AIRLOCK000015',
-    'bca_3_current': 'AIRLOCK000016',
-    'bca_4_voltage': 'AIRLOCK000017',
-    'bca_4_current': 'AIRLOCK000018',
-    'bca_1_status': 'AIRLOCK000019',
-    'bca_2_status': 'AIRLOCK000020',
-    'bca_3_status': 'AIRLOCK000021',
-    'bca_4_status': 'AIRLOCK000022',
-    
-    # Battery Charger Channel Status (abbreviated - there are many more)
-    'bca_1_ch1_status': 'AIRLOCK000023',
-    'bca_1_ch2_status': 'AIRLOCK000024',
-    'bca_1_ch3_status': 'AIRLOCK000025',
-    'bca_1_ch4_status': 'AIRLOCK000026',
-    'bca_1_ch5_status': 'AIRLOCK000027',
-    'bca_1_ch6_status': 'AIRLOCK000028',
-    'depressurization_pump_voltage': 'AIRLOCK000047',
-    'depressurization_pump_switch': 'AIRLOCK000048',
-    
-    # Mobile Servicing System (MSS)
-    'mss_mt_position': 'CSAMT000001',
-    'ssrms_base_location': 'CSASSRMS002',
-    'ssrms_operating_base': 'CSASSRMS003',
-    'ssrms_sr_joint': 'CSASSRMS004',
-    'ssrms_sy_joint': 'CSASSRMS005',
-    'ssrms_sp_joint': 'CSASSRMS006',
-    'ssrms_ep_joint': 'CSASSRMS007',
-    'ssrms_wp_joint': 'CSASSRMS008',
-    'ssrms_wy_joint': 'CSASSRMS009',
-    'ssrms_wr_joint': 'CSASSRMS010',
-    'ssrms_tip_lee_status': 'CSASSRMS011',
-    
-    # SPDM (Special Purpose Dexterous Manipulator)
-    'spdm_base_location': 'CSASPDM0002',
-    'spdm_1_sr_joint': 'CSASPDM0003',
-    'spdm_1_sy_joint': 'CSASPDM0004',
-    'spdm_1_sp_joint': 'CSASPDM0005',
-    'spdm_1_ep_joint': 'CSASPDM0006',
-    'spdm_1_wp_joint': 'CSASPDM0007',
-    'spdm_1_wy_joint': 'CSASPDM0008',
-    'spdm_1_wr_joint': 'CSASPDM0009',
-    'spdm_1_otcm_status': 'CSASPDM0010',
-    'spdm_2_sr_joint': 'CSASPDM0011',
-    'spdm_2_sy_joint': 'CSASPDM0012',
-    'spdm_2_sp_joint': 'CSASPDM0013',
-    'spdm_2_ep_joint': 'CSASPDM0014',
-    'spdm_2_wp_joint': 'CSASPDM0015',
-    'spdm_2_wy_joint': 'CSASPDM0016',
-    'spdm_2_wr_joint': 'CSASPDM0017',
-    'spdm_2_otcm_status': 'CSASPDM0019',
-    'spdm_body_roll_joint': 'CSASPDM0020',
-    'spdm_body_status': 'CSASPDM0022',
-    
-    # MBS (Mobile Base System)
-    'mbs_mcas_status': 'CSAMBS00002',
-    'mbs_poa_status': 'CSAMBA00004',
-    
-    # Russian Segment
-    'russian_station_mode': 'RUSSEG000001',
-    'kurs_equipment_1': 'RUSSEG000002',
-    'kurs_equipment_2': 'RUSSEG000003',
-    'kurs_p1_p2_failure': 'RUSSEG000004',
-    'kurs_range': 'RUSSEG000005',
-    'kurs_range_rate': 'RUSSEG000006',
-    'kurs_test_mode': 'RUSSEG000007',
-    'kurs_capture_signal': 'RUSSEG000008',
-    'kurs_target_acquisition': 'RUSSEG000009',
-    'kurs_functional_mode': 'RUSSEG000010',
-    'kurs_standby_mode': 'RUSSEG000011',
-    'sm_docking_flag': 'RUSSEG000012',
-    'sm_forward_dock_engaged': 'RUSSEG000013',
-    'sm_aft_dock_engaged': 'RUSSEG000014',
-    'sm_nadir_dock_engaged': 'RUSSEG000015',
-    'fgb_nadir_dock_engaged': 'RUSSEG000016',
-    'sm_nadir_udm_dock_engaged': 'RUSSEG000017',
-    'mrm1_dock_engaged': 'RUSSEG000018',
-    'mrm2_dock_engaged': 'RUSSEG000019',
-    'sm_hooks_closed': 'RUSSEG000020', 
-    'russian_attitude_mode': 'RUSSEG000021',
-    'russian_motion_control': 'RUSSEG000022',
-    'russian_free_drift_prep': 'RUSSEG000023',
-    'russian_thruster_terminated': 'RUSSEG000024',
-    'russian_dynamic_mode': 'RUSSEG000025',
-    
-    # Time Systems
-    'gmt_time': 'TIME_000001',
-    'year': 'TIME_000002'
-}
-    
-
-
-    def _decode_status(self, value, mapping):
-        """decode the index to the map"""
-        if value is None:
+            self.streaming.clear()
+        for listener in self.listeners:
+            listener.onStatusChange(status)
+
+
+# (transport, server, adapter set) -> [client, number of ISS objects using it]
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _acquire_client(transport, server, adapter_set, shared):
+    """a client for server, and whether connect() still has to be called on it.
+
+    transport(server, adapter_set) makes the client. Shared clients are
+    reused across ISS objects and counted, so the one network connection
+    stays up until the last of them lets go.
+    """
+    if not shared:
+        return transport(server, adapter_set), True
+    key = (transport, server, adapter_set)
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is not None:
+            entry[1] += 1
+            return entry[0], False
+        client = transport(server, adapter_set)
+        _shared_clients[key] = [client, 1]
+        return client, True
+
+
+def _release_client(client, transport, server, adapter_set, shared):
+    """let go of a client from _acquire_client, disconnecting it once unused"""
+    if shared:
+        key = (transport, server, adapter_set)
+        with _shared_clients_lock:
+            entry = _shared_clients[key]
+            entry[1] -= 1
+            if entry[1]:
+                return
+            del _shared_clients[key]
+    client.disconnect()
+    
+
+
+class StatusMap(tuple):
+    """immutable code -> label table, labels are stored at their code's index"""
+    __slots__ = ()
+
+    def __new__(cls, mapping):
+        labels = [None] * (max(mapping) + 1)
+        for code, label in mapping.items():
+            labels[code] = label
+        return super().__new__(cls, labels)
+
+    def __reduce__(self):
+        return (type(self), (self.codes(),))
+
+    def codes(self):
+        return {code: label for code, label in enumerate(self) if label is not None}
+
+    def get(self, code):
+        """same contract as dict.get: None for a missing or unknown code"""
+        if code is None or code < 0:
             return None
         try:
-            return mapping.get(int(value))
-        except (ValueError, TypeError):
-            return str(value)
-        
-    
-     
-    def connect(self):
-        self._client = LightstreamerClient("https://push.lightstreamer.com", "ISSLIVE")
-
-        #sub = Subscription("MERGE",["item1","item2","item3"],["stock_name","last_price"])
-
-        sub = Subscription(
-            mode="MERGE",
-            items=list(self._iss_telemetry_nodes.values()),
-            fields=['Value'])
-
-
-        sub.addListener(ISSNodeUpdateListener(self._data))
-        self._client.addListener(ISSStatusUpdater())
-
-        self._client.connect()
-        self._client.subscribe(sub)
-
-    def _get_value(self, name: str):
-        if name in self._iss_telemetry_nodes:
-            return self._data.get(self._iss_telemetry_nodes[name])
-        else:
-            print("Node name not found")
+            return self[code]
+        except IndexError:
             return None
 
 
-    def get_node(self,name:str):
-        return self._get_value(name)
-    
-    def get_dets(self):
-        return self._client.connectionDetails
-    
-    
-        
-    @property
-    def waste_water_tank(self) -> Optional[float]:
-        """Waste Water Tank Quantity"""
-        val = self._get_value("waste_water_tank_qty")
-        return None if val is None else float(val)
-
-    @property
-    def gmt_time(self) -> Optional[str]:
-        """Greenwich Mean Time"""
-        val = self._get_value("gmt_time")
-        return None if val is None else str(val)
-
-    @property
-    def cabin_pressure(self) -> Optional[str]:
-        """Cabin Atmospheric Pressure"""
-        val = self._get_value("cabin_pressure")
-        return None if val is None else str(val)
-    
-    @property
-    def hi_p_o2_valve_position(self) -> Optional[str]:
-        """High Pressure Oxygen Valve Position"""
-        value = self._get_value("hi_p_o2_valve_position")
-        mapping = {0: "CLOSED", 1: "OPEN", 2: "IN-TRANSIT", 3: "FAILED"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def cmg_1_online(self) -> Optional[str]:
-        """Control Moment Gyroscope 1 Online Status"""
-        value = self._get_value("cmg_1_online")
-        mapping = {0: "NOT IN USE", 1: "IN USE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def cmg_2_online(self) -> Optional[str]:
-        """Control Moment Gyroscope 2 Online Status"""
-        value = self._get_value("cmg_2_online")
-        mapping = {0: "NOT IN USE", 1: "IN USE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def cmg_3_online(self) -> Optional[str]:
-        """Control Moment Gyroscope 3 Online Status"""
-        value = self._get_value("cmg_3_online")
-        mapping = {0: "NOT IN USE", 1: "IN USE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def cmg_4_online(self) -> Optional[str]:
-        """Control Moment Gyroscope 4 Online Status"""
-        value = self._get_value("cmg_4_online")
-        mapping = {0: "NOT IN USE", 1: "IN USE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def cmgs_online_count(self) -> Optional[int]:
-        """Control Moment Gyroscopes Online Count"""
-        val = self._get_value("cmgs_online_count")
-        return None if val is None else int(val)
-    
-    @property
-    def cmg_control_torque_roll(self) -> Optional[float]:
-        """Control Moment Gyroscope Control Torque Roll"""
-        val = self._get_value("cmg_control_torque_roll")
-        return None if val is None else float(val)
-    
-    @property
-    def cmg_control_torque_pitch(self) -> Optional[float]:
-        """Control Moment Gyroscope Control Torque Pitch"""
-        val = self._get_value("cmg_control_torque_pitch")
-        return None if val == None else float(val)
-    
-    @property
-    def cmg_control_torque_yaw(self) -> Optional[float]:
-        """Control Moment Gyroscope Control Torque Yaw"""
-        val = (self._get_value("cmg_control_torque_yaw"))
-        return None if val == None else float(val)
-
-    
-    @property
-    def cmg_active_momentum(self) -> Optional[float]:
-        """Control Moment Gyroscope Active Momentum"""
-        val = self._get_value("cmg_active_momentum")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_momentum_percentage(self) -> Optional[float]:
-        """Control Moment Gyroscope Momentum Percentage"""
-        val = self._get_value("cmg_momentum_percentage")
-        return None if val is None else float(val)
-        
-    @property
-    def desaturation_request(self) -> Optional[str]:
-        """CMG Desaturation Request Status"""
-        value = self._get_value("desaturation_request")
-        mapping = {0: "ENABLED", 1: "INHIBITED"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def gnc_mode(self) -> Optional[str]:
-        """Guidance Navigation and Control Mode"""
-        val = self._get_value("gnc_mode")
-        return None if val is None else str(val)
-    
-    @property
-    def attitude_source(self) -> Optional[str]:
-        """Attitude Determination Source"""
-        value = self._get_value("attitude_source")
-        mapping = {0: "NONE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def rate_source(self) -> Optional[str]:
-        """Angular Rate Source"""
-        value = self._get_value("rate_source")
-        mapping = {0: "NONE", 1: "RGA1", 2: "RGA2", 3: "RUSSIAN"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def state_vector_source(self) -> Optional[str]:
-        """State Vector Source"""
-        value = self._get_value("state_vector_source")
-        mapping = {
-            0: "NO_SOURCE", 1: "Unused", 2: "Unused", 3: "RUSSIAN", 
-            4: "GPS1_DETERMINISTIC", 5: "GPS2_DETERMINISTIC", 6: "GROUND"
-        }
-        return self._decode_status(value, mapping)
-    
-    @property
-    def attitude_controller_type(self) -> Optional[str]:
-        """Attitude Controller Type"""
-        value = self._get_value("attitude_controller_type")
-        mapping = {0: "ATTITUDE HOLD", 1: "TEA"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def attitude_control_reference_frame(self) -> Optional[str]:
-        """Attitude Control Reference Frame"""
-        value = self._get_value("attitude_control_reference_frame")
-        mapping = {0: "LVLH", 1: "Inertial", 2: "XPOP"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def lvlh_quaternion_0(self) -> Optional[float]:
-        """Local Vertical Local Horizontal Quaternion 0"""
-        val = self._get_value("lvlh_quaternion_0")
-        return None if val is None else float(val)
-
-    @property
-    def lvlh_quaternion_1(self) -> Optional[float]:
-        """Local Vertical Local Horizontal Quaternion 1"""
-        val = self._get_value("lvlh_quaternion_1")
-        return None if val is None else float(val)
-
-    @property
-    def lvlh_quaternion_2(self) -> Optional[float]:
-        """Local Vertical Local Horizontal Quaternion 2"""
-        val = self._get_value("lvlh_quaternion_2")
-        return None if val is None else float(val)
-
-    @property
-    def lvlh_quaternion_3(self) -> Optional[float]:
-        """Local Vertical Local Horizontal Quaternion 3"""
-        val = self._get_value("lvlh_quaternion_3")
-        return None if val is None else float(val)
-
-    @property
-    def attitude_roll_error(self) -> Optional[float]:
-        """Attitude Roll Error (degrees)"""
-        val = self._get_value("attitude_roll_error")
-        return None if val is None else float(val)
-
-    @property
-    def attitude_pitch_error(self) -> Optional[float]:
-        """Attitude Pitch Error (degrees)"""
-        val = self._get_value("attitude_pitch_error")
-        return None if val is None else float(val)
+# shared status tables, built once at import and looked up by name
+STATUS_MAPS: Dict[str, StatusMap] = {}
+
+
+def _status_map(name, mapping):
+    table = StatusMap(mapping)
+    STATUS_MAPS[name] = table
+    return table
+
+
+_VALVE_POSITION = _status_map("valve_position", {
+    0: 'CLOSED', 1: 'OPEN', 2: 'IN-TRANSIT', 3: 'FAILED'
+})
+_CMG_ONLINE = _status_map("cmg_online", {0: 'NOT IN USE', 1: 'IN USE'})
+_DESATURATION_REQUEST = _status_map("desaturation_request", {0: 'ENABLED', 1: 'INHIBITED'})
+_ATTITUDE_SOURCE = _status_map("attitude_source", {0: 'NONE'})
+_RATE_SOURCE = _status_map("rate_source", {0: 'NONE', 1: 'RGA1', 2: 'RGA2', 3: 'RUSSIAN'})
+_STATE_VECTOR_SOURCE = _status_map("state_vector_source", {
+    0: 'NO_SOURCE', 1: 'Unused', 2: 'Unused', 3: 'RUSSIAN', 4: 'GPS1_DETERMINISTIC',
+    5: 'GPS2_DETERMINISTIC', 6: 'GROUND'
+})
+_ATTITUDE_CONTROLLER = _status_map("attitude_controller", {0: 'ATTITUDE HOLD', 1: 'TEA'})
+_REFERENCE_FRAME = _status_map("reference_frame", {0: 'LVLH', 1: 'Inertial', 2: 'XPOP'})
+_TRUE_FALSE = _status_map("true_false", {0: 'FALSE', 1: 'TRUE'})
+_GPS_STATUS = _status_map("gps_status", {
+    0: 'DOING POSITION FIXES', 1: 'SV TIMING', 2: 'APPROXIMATE TIMING', 3: 'GPS TIME',
+    4: 'NEED INITIALIZATION', 5: 'GDOP NEEDED', 6: 'BAD TIMING', 7: 'NO USABLE SV',
+    8: 'ONLY 1 USABLE SVs', 9: 'ONLY 2 USABLE SVs', 10: 'ONLY 3 USABLE SVs',
+    11: 'BAD INTEGRITY', 12: 'NO VEL AVAIL', 13: 'UNUSABLE FIX'
+})
+_VACUUM_VALVE = _status_map("vacuum_valve", {0: 'FAIL', 1: 'OPEN', 2: 'CLSD', 3: 'TRNS'})
+_AC_STATE = _status_map("ac_state", {
+    0: 'RESET', 1: 'DRAIN', 2: 'DRYOUT', 3: 'EIB OFF', 4: 'OFF', 5: 'ON', 6: 'STARTUP',
+    7: 'TEST'
+})
+_POWER_STATUS = _status_map("power_status", {0: 'Off-Ok', 1: 'Not-Off Ok', 3: 'Not-Off Failed'})
+_ACTIVITY = _status_map("activity", {0: 'INACTIVE', 1: 'ACTIVE'})
+_SBAND_STRING = _status_map("sband_string", {1: 'String 1', 2: 'String 2'})
+_IAC_STATUS = _status_map("iac_status", {0: 'Backup', 1: 'Active'})
+_VIDEO_SOURCE = _status_map("video_source", {
+    0: '-', 1: 'S3AFT', 2: 'S1UPOB', 3: 'SCU1 Mux', 4: 'S1LOOB', 5: 'JPM a', 6: 'JPM b',
+    7: 'S1UPIB', 8: 'S1LOIB', 9: 'COL 1', 10: 'COL 2', 11: 'P1UPIB', 12: 'SCU2 Mux',
+    13: 'NOD3S', 14: 'P1LOIB', 15: 'SCU1 Test', 16: 'WETA112', 17: 'ORB1', 18: 'ORB2',
+    19: 'P1LOOB', 20: 'SCU2 Test', 21: 'P3AFT', 22: 'Payload Rack', 23: 'VTR1', 24: 'VTR2',
+    25: 'NOD2LO', 26: 'WETA115', 28: 'LAB S', 31: 'POA PL3', 32: 'POA', 33: 'SPDMS1',
+    34: 'SPDMS2', 35: 'MBS CLPA', 36: 'SPDMLEE', 37: 'MAST', 40: 'BLEE', 43: 'BELB',
+    48: 'TELB', 50: 'MSS PL3', 51: 'TLEE', 52: 'Lab AVU1', 53: 'Lab AVU2', 54: 'Cup AVU1',
+    55: 'Cup AVU2', 56: 'OTCM1', 57: 'BODY1', 58: 'OTCM2', 59: 'BODY2', 60: 'SSRMS PL1',
+    61: 'SSRMS PL2', 62: 'SSRMS PL3', 63: 'MSS PL1', 64: 'MSS PL2', 65: 'LAB1D3', 66: 'LAB1P2',
+    67: 'LAB1P4', 68: 'LABCAM', 69: 'LAB1O5', 70: 'LAB1O4', 71: 'LAB1O3', 72: 'LAB1O2',
+    73: 'LAB1O1', 74: 'LAB1S1', 75: 'LAB1S2', 76: 'LAB1S3', 77: 'A/L CAM', 78: 'LAB1S4',
+    79: 'N1 CAM', 80: 'N3 CAM'
+})
+_FRAME_SYNC = _status_map("frame_sync", {0: 'Frame Sync unlocked', 1: 'Frame Sync locked'})
+_KU_TRANSMIT = _status_map("ku_transmit", {0: 'RESET', 1: 'NORMAL'})
+_ARRAY_MDM_STATUS = _status_map("array_mdm_status", {0: 'Not Enabled', 1: 'Enabled'})
+_URINE_PROCESSOR_STATE = _status_map("urine_processor_state", {
+    2: 'STOP', 4: 'SHUTDOWN', 8: 'MAINTENANCE', 16: 'NORMAL', 32: 'STANDBY', 64: 'IDLE',
+    128: 'SYSTEM INITIALIZED'
+})
+_WATER_PROCESSOR_STATE = _status_map("water_processor_state", {
+    1: 'STOP', 2: 'SHUTDOWN', 3: 'STANDBY', 4: 'PROCESS', 5: 'HOT SERVICE', 6: 'FLUSH',
+    7: 'WARM SHUTDOWN'
+})
+_WATER_PROCESSOR_STEP = _status_map("water_processor_step", {
+    0: 'NONE', 1: 'VENT', 2: 'HEATUP', 3: 'PURGE', 4: 'FLOW', 5: 'TEST', 6: 'TEST_SV_1',
+    7: 'TEST_SV_2', 8: 'SERVICE'
+})
+_OXYGEN_GENERATOR_STATE = _status_map("oxygen_generator_state", {
+    1: 'PROCESS', 2: 'STANDBY', 3: 'SHUTDOWN', 4: 'STOP', 5: 'VENT_DOME', 6: 'INERT_DOME',
+    7: 'FAST_SHUTDOWN', 8: 'N2_PURGE_SHUTDOWN'
+})
+_BCA_STATUS = _status_map("bca_status", {
+    0: 'Normal', 1: 'No Data', 2: 'Missing Data', 3: 'Extra Data'
+})
+_BCA_CHANNEL_STATUS = _status_map("bca_channel_status", {
+    0: 'No History - a charge has not been initiated yet', 1: 'Presently charging',
+    2: 'Task completed normally', 3: 'Task terminated due to stop switch being toggled',
+    4: 'Task terminated due to an open circuit error',
+    5: 'Task terminated due to Wrong Batt or Hi-imp',
+    6: 'Task terminated due to an over-temperature error',
+    7: 'Amp-hour capacity test result OK', 8: 'Amp-hour capacity test error',
+    9: 'Task terminated due to low charge slope error',
+    10: 'Task terminated due to power error',
+    11: 'Task terminated due to reverse-polarity error',
+    12: 'Task terminated due to a short-circuit error',
+    13: 'Task terminated due to a time-out error',
+    14: 'Task terminated due to an external-temperature error', 15: 'Discharge',
+    16: 'Wait on Discharge', 17: 'Wait on Charge'
+})
+_PUMP_SWITCH = _status_map("pump_switch", {0: 'Off-Ok', 1: 'Not-Off Ok', 2: 'Not-Off Failed'})
+_BASE_LOCATION = _status_map("base_location", {
+    1: 'Lab', 2: 'Node3', 4: 'Node2', 7: 'MBS PDGF 1', 8: 'MBS PDGF 2', 11: 'MBS PDGF 3',
+    13: 'MBS PDGF 4', 14: 'FGB', 16: 'POA', 19: 'SSRMS Tip LEE', 63: 'Undefined'
+})
+_OPERATING_BASE = _status_map("operating_base", {0: 'Lee A', 5: 'Lee B'})
+_LATCH_STATUS = _status_map("latch_status", {0: 'Released', 1: 'Captive', 2: 'Captured'})
+_MCAS_STATUS = _status_map("mcas_status", {0: 'Released', 1: 'Captured'})
+
+
+def _to_float(raw):
+    try:
+        return float(raw)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_int(raw):
+    """ints and status codes sometimes arrive formatted as floats ("1.0")"""
+    try:
+        return int(raw)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return int(float(raw))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _to_bool(raw):
+    """the feed sends flags as "0"/"1", so bool(raw) would always be True"""
+    value = _to_float(raw)
+    return None if value is None else value != 0.0
+
+
+def _to_str(raw):
+    return str(raw)
+
+
+# declared node type -> converter run once per update at ingest,
+# status nodes are declared with their StatusMap and stored as int codes
+_DECODERS = {float: _to_float, int: _to_int, bool: _to_bool, str: _to_str}
+_NUMERIC = (float, int, bool)
+_NAN = float("nan")
+_NEVER = float("-inf")
+# updates the change log remembers, a power of two
+_CHANGE_LOG = 4096
+
+
+class _NodeStore:
+    """receive bookkeeping shared by the stores.
+
+    stamps holds the monotonic receive time of each slot (-inf until the
+    first update) and seqs the global sequence number of its last update.
+    log is a ring of the slots of the last _CHANGE_LOG updates, update seq
+    at index seq % _CHANGE_LOG.
+
+    Writes are guarded by a seqlock: put() makes version odd while it
+    writes and even again when done. A reader that copies the store and
+    sees the same even version before and after got a consistent copy.
+    Only one thread (the ingest thread) may call put().
+    """
+    def __init__(self, items, kinds):
+        n = len(items)
+        self.items = items
+        self.kinds = kinds
+        self.stamps = array("d", [_NEVER]) * n
+        self.seqs = array("Q", [0]) * n
+        self.log = array("H", [0]) * _CHANGE_LOG
+        self.seq = 0
+        self.version = 0
+
+    def put(self, slot, value, stamp):
+        self.version += 1
+        try:
+            self.seq += 1
+            self.stamps[slot] = stamp
+            self.seqs[slot] = self.seq
+            self.log[self.seq & (_CHANGE_LOG - 1)] = slot
+            self._put(slot, value)
+        finally:
+            self.version += 1
+
+    def changed_since(self, seq):
+        """sorted slots updated after seq.
+
+        Read from the change log while it still reaches back to seq, so the
+        cost follows the number of updates, older seqs scan seqs instead. A
+        seq ahead of this store (from another one) counts as 0.
+        """
+        if seq > self.seq:
+            seq = 0
+        count = self.seq - seq
+        if count > _CHANGE_LOG:
+            return [slot for slot, last in enumerate(self.seqs) if last > seq]
+        if not count:
+            return []
+        first = (seq + 1) & (_CHANGE_LOG - 1)
+        slots = set(self.log[first:first + count])
+        if first + count > _CHANGE_LOG:
+            slots.update(self.log[:first + count - _CHANGE_LOG])
+        return sorted(slots)
+
+    def snapshot(self):
+        """a frozen copy of the store as of one sequence number, never blocks the writer"""
+        return self.consistent(type(self)._copy)
+
+    def consistent(self, read):
+        """read(self), retried until no write overlapped it"""
+        while True:
+            version = self.version
+            if not version & 1:
+                result = read(self)
+                if self.version == version:
+                    return result
+            # a write is in flight, let the ingest thread finish it
+            sleep(0)
+
+    def _copy(self):
+        frozen = copy.copy(self)
+        frozen.stamps = self.stamps[:]
+        frozen.seqs = self.seqs[:]
+        return frozen
+
+
+class DictStore(_NodeStore):
+    """item -> decoded value dict, the original storage kept as a fallback"""
+    def __init__(self, items, kinds):
+        super().__init__(items, kinds)
+        self.data = {}
+
+    def _put(self, slot, value):
+        self.data[self.items[slot]] = value
+
+    def _copy(self):
+        frozen = super()._copy()
+        frozen.data = self.data.copy()
+        return frozen
+
+    def get(self, slot):
+        return self.data.get(self.items[slot])
+
+    def vector(self):
+        """numeric values by slot, NaN where missing (a copy for this store)"""
+        values = array("d", [_NAN]) * len(self.items)
+        for slot, kind in enumerate(self.kinds):
+            value = self.get(slot)
+            if value is not None and kind in _NUMERIC:
+                values[slot] = value
+        return memoryview(values)
+
+    def status_codes(self):
+        codes = array("i", [0]) * len(self.items)
+        for slot, kind in enumerate(self.kinds):
+            value = self.get(slot)
+            if value is not None and kind not in _DECODERS:
+                codes[slot] = value
+        return memoryview(codes)
+
+    def valid_mask(self):
+        return memoryview(bytes(self.get(slot) is not None for slot in range(len(self.items))))
+
+
+class ArrayStore(_NodeStore):
+    """one fixed slot per catalog node in flat typed arrays.
+
+    float, int and bool nodes share a float64 array, status codes live in
+    an int32 array and the few free text nodes in a plain list. valid marks
+    which slots currently hold a value. objects keeps the value of each
+    slot as get() returns it (None while invalid), so a read never has to
+    rebuild it from the columns, which serve vector(), snapshots and
+    shared memory.
+    """
+    def __init__(self, items, kinds):
+        super().__init__(items, kinds)
+        n = len(items)
+        self.values = array("d", [_NAN]) * n
+        self.codes = array("i", [0]) * n
+        self.text = [None] * n
+        self.valid = bytearray(n)
+        self.objects = [None] * n
+        # per slot: the container holding it and the type it reads back as
+        self._column_ids = [self._column_id(kind) for kind in kinds]
+        self._types = [kind if kind in _DECODERS else int for kind in kinds]
+        self._bind_columns()
+
+    @staticmethod
+    def _column_id(kind):
+        if kind in _NUMERIC:
+            return 0
+        if kind is str:
+            return 2
+        return 1
+
+    def _bind_columns(self):
+        columns = (self.values, self.codes, self.text)
+        self._columns = [columns[column] for column in self._column_ids]
+
+    def _copy(self):
+        frozen = super()._copy()
+        frozen.values = self.values[:]
+        frozen.codes = self.codes[:]
+        frozen.text = self.text[:]
+        frozen.valid = self.valid[:]
+        frozen.objects = self.objects[:]
+        frozen._bind_columns()
+        return frozen
+
+    def _load_objects(self):
+        """rebuild objects from the columns, for a store filled column by column"""
+        self.objects = [kind(column[slot]) if valid else None for slot, (kind, column, valid)
+                        in enumerate(zip(self._types, self._columns, self.valid))]
+
+    def _put(self, slot, value):
+        if value is None:
+            self.valid[slot] = 0
+            self.objects[slot] = None
+            if self._columns[slot] is self.values:
+                self.values[slot] = _NAN
+            return
+        try:
+            self._columns[slot][slot] = value
+        except OverflowError:
+            self.valid[slot] = 0
+            self.objects[slot] = None
+            return
+        self.valid[slot] = 1
+        self.objects[slot] = value
+
+    def get(self, slot):
+        return self.objects[slot]
+
+    def vector(self):
+        """zero-copy view of every numeric value by slot, NaN where missing"""
+        return memoryview(self.values)
+
+    def status_codes(self):
+        return memoryview(self.codes)
+
+    def valid_mask(self):
+        return memoryview(self.valid)
+
+
+_STORES = {"array": ArrayStore, "dict": DictStore}
+
+
+class NodeHistory:
+    """the last capacity (stamp, value) pairs of one numeric node.
+
+    Both arrays are allocated once at twice the capacity and every entry is
+    written at i and i + capacity, so the newest capacity entries always sit
+    contiguous and in order somewhere in the doubled array. A window is then
+    a memoryview slice: nothing is copied to read it and nothing allocated
+    to append. Status nodes keep their int code, bool nodes 0.0 and 1.0,
+    a missing value is NaN.
+    """
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("history capacity must be at least 1")
+        self.capacity = capacity
+        self.stamps = array("d", [_NEVER]) * (2 * capacity)
+        self.values = array("d", [_NAN]) * (2 * capacity)
+        # updates ever appended, written last so readers never see a half entry
+        self.count = 0
+
+    def append(self, value, stamp):
+        capacity = self.capacity
+        i = self.count % capacity
+        value = _NAN if value is None else value
+        self.stamps[i] = self.stamps[i + capacity] = stamp
+        self.values[i] = self.values[i + capacity] = value
+        self.count += 1
+
+    def window(self, since: Optional[float] = None, until: Optional[float] = None):
+        """(stamps, values) memoryviews of the entries with since <= stamp <= until.
+
+        The views alias the ring, they stay valid until capacity more
+        updates arrive. Copy them (array("d", view)) to keep them longer.
+        """
+        count = self.count
+        size = min(count, self.capacity)
+        end = (count - 1) % self.capacity + 1 + self.capacity if count else 0
+        stamps = memoryview(self.stamps)[end - size:end]
+        values = memoryview(self.values)[end - size:end]
+        lo = 0 if since is None else bisect_left(stamps, since)
+        hi = size if until is None else bisect_right(stamps, until)
+        return stamps[lo:hi], values[lo:hi]
+
+
+def _align(windows):
+    """sample-and-hold several (stamps, values) windows onto the union of their stamps"""
+    stamps = array("d", sorted(set().union(*(window[0] for window in windows))))
+    aligned = []
+    for times, values in windows:
+        column = array("d", [_NAN]) * len(stamps)
+        held, i = _NAN, 0
+        for row, stamp in enumerate(stamps):
+            while i < len(times) and times[i] <= stamp:
+                held = values[i]
+                i += 1
+            column[row] = held
+        aligned.append(column)
+    return stamps, aligned
+
+
+class NodeNotSubscribedError(LookupError):
+    """raised when reading a node that connect() was told not to subscribe to"""
+    def __init__(self, name):
+        super().__init__(f"{name!r} is not subscribed, add it to connect(nodes=...) or connect(groups=...)")
+        self.name = name
+
+
+def _node_groups(sections, umbrellas):
+    """every catalog section is a group, umbrella groups join several sections"""
+    groups = {section: tuple(nodes) for section, nodes in sections.items()}
+    for group, members in umbrellas.items():
+        groups[group] = tuple(name for section in members for name in sections[section])
+    return groups
+
+
+class ISSSnapshot:
+    """a read-only copy of every node, consistent as of one update.
+
+    Reads the same way as ISS: snap.cabin_pressure, snap.get("lab_ppco2").
+    """
+    __slots__ = ("_store", "_subscribed", "seq")
+
+    def __init__(self, store, subscribed):
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_subscribed", subscribed)
+        object.__setattr__(self, "seq", store.seq)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ISSSnapshot is read-only")
+
+    def __getattr__(self, name):
+        prop = getattr(ISS, name, None)
+        if isinstance(prop, property):
+            return prop.fget(self)
+        raise AttributeError(f"ISSSnapshot has no attribute {name!r}")
+
+    def _get_value(self, name):
+        slot = ISS._iss_node_slots[name]
+        if not self._subscribed[slot]:
+            raise NodeNotSubscribedError(name)
+        return self._store.get(slot)
+
+    def get(self, name):
+        """the same value the ISS property of that name returns"""
+        return getattr(self, name)
+
+    def age(self, name, now=None):
+        """seconds between the node's last update and now (default: the current time)"""
+        stamp = self._store.stamps[ISS._iss_node_slots[name]]
+        return None if stamp == _NEVER else (monotonic() if now is None else now) - stamp
+
+    def as_dict(self):
+        """every subscribed node by name"""
+        return {name: getattr(self, name)
+                for name, wanted in zip(ISS.node_names, self._subscribed) if wanted}
+
+    def vector(self):
+        return self._store.vector()
+
+
+_BULK_FORMS = ("tuple", "dict", "array")
+
+
+class _BulkReader:
+    """reads a fixed tuple of nodes in one pass, see ISS.get_many().
+
+    The per-node reads are generated once as a single tuple expression over
+    the array store's objects (its columns for the float64 form), so reading
+    20 nodes costs one Python call instead of 20 property lookups. Other
+    stores fall back to store.get().
+    """
+    def __init__(self, names):
+        unknown = [name for name in names if name not in ISS._iss_node_slots]
+        if unknown:
+            raise ValueError(f"unknown node names: {unknown}")
+        self.names = names
+        self.slots = tuple(ISS._iss_node_slots[name] for name in names)
+        self.labels = tuple(ISS._iss_slot_labels[slot] for slot in self.slots)
+        kinds = [ISS._iss_slot_kinds[slot] for slot in self.slots]
+        namespace = {"nan": _NAN}
+        reads, numbers = [], []
+        for slot, kind in zip(self.slots, kinds):
+            if kind in _DECODERS:
+                reads.append(f"objects[{slot}]")
+            else:
+                # StatusMap.get(None) is None
+                namespace[f"label_{slot}"] = kind.get
+                reads.append(f"label_{slot}(objects[{slot}])")
+            if kind in _NUMERIC:
+                numbers.append(f"values[{slot}]")
+            elif kind is not str:
+                numbers.append(f"(codes[{slot}] if valid[{slot}] else nan)")
+        self.read_objects = self._compile("objects", f"({', '.join(reads)},)", namespace)
+        self.read_objects_dict = self._compile(
+            "objects", "{" + ", ".join(f"{name!r}: {read}" for name, read in zip(names, reads)) + "}",
+            namespace)
+        # float64 form: status nodes as their codes, impossible with text nodes
+        self.read_numbers = None
+        if str not in kinds:
+            self.read_numbers = self._compile("values, codes, valid", f"({', '.join(numbers)},)", namespace)
+        self.subscribed = self._compile(
+            "subscribed", " and ".join(f"subscribed[{slot}]" for slot in self.slots), {})
+
+    @staticmethod
+    def _compile(args, expression, namespace):
+        exec(f"def read({args}):\n    return {expression}\n", namespace)
+        return namespace.pop("read")
+
+    def read(self, store):
+        if isinstance(store, ArrayStore):
+            return self.read_objects(store.objects)
+        return tuple(store.get(slot) if label is None else label(store.get(slot))
+                     for slot, label in zip(self.slots, self.labels))
+
+    def read_dict(self, store):
+        if isinstance(store, ArrayStore):
+            return self.read_objects_dict(store.objects)
+        return dict(zip(self.names, self.read(store)))
+
+    def read_array(self, store):
+        if self.read_numbers is None:
+            text = [name for name in self.names if ISS._iss_node_catalog[name][1] is str]
+            raise ValueError(f"text nodes have no float64 form: {text}")
+        if isinstance(store, ArrayStore):
+            return array("d", self.read_numbers(store.values, store.codes, store.valid))
+        values = store.vector()
+        codes = store.status_codes()
+        valid = store.valid_mask()
+        return array("d", self.read_numbers(values, codes, valid))
+
+
+class Deadband:
+    """suppresses changes smaller than a band around the last value let through.
+
+    absolute is in the node's own units and relative is a fraction of the
+    last value; with both set the wider band wins. A move that reverses the
+    direction of the last one let through must clear the band plus
+    hysteresis, so a value jittering around one point doesn't fire on
+    every wiggle.
+    """
+    __slots__ = ("absolute", "relative", "hysteresis", "_last", "_direction")
+
+    def __init__(self, absolute: float = 0.0, relative: float = 0.0, hysteresis: float = 0.0):
+        self.absolute = absolute
+        self.relative = relative
+        self.hysteresis = hysteresis
+        self._last = None
+        self._direction = 0
+
+    def passes(self, value) -> bool:
+        last = self._last
+        if value is None or last is None:
+            self._last = value
+            self._direction = 0
+            return value is not last
+        delta = value - last
+        band = max(self.absolute, self.relative * abs(last))
+        if delta * self._direction < 0:
+            band += self.hysteresis
+        if abs(delta) <= band:
+            return False
+        self._last = value
+        self._direction = 1 if delta > 0 else -1
+        return True
 
-    @property
-    def attitude_yaw_error(self) -> Optional[float]:
-        """Attitude Yaw Error (degrees)"""
-        val = self._get_value("attitude_yaw_error")
-        return None if val is None else float(val)
 
-    @property
-    def commanded_quaternion_0(self) -> Optional[float]:
-        """Commanded Attitude Quaternion 0"""
-        val = self._get_value("commanded_quaternion_0")
-        return None if val is None else float(val)
+class ISSNodeUpdateListener:
+    def __init__(self, store, routes, callbacks=None, deadbands=None):
+        self.store = store
+        self.routes = routes
+        n = len(ISS.node_names)
+        # slot -> tuple of on_change callbacks, empty for unwatched slots
+        self.callbacks = callbacks if callbacks is not None else [()] * n
+        # slot -> Deadband gating what reaches callbacks and sinks, None for no filtering
+        self.deadbands = deadbands if deadbands is not None else [None] * n
+        # slot -> {callback: Deadband} for callbacks registered with their own
+        # band, None for none; replaced whole like the callback tuples
+        self.callback_deadbands = [None] * n
+        # objects with on_update(slot, value, stamp), fed every update that
+        # gets past the deadband; replaced whole like the callback tuples
+        self.sinks = ()
+        # objects with on_update(slot, value, stamp) fed every update as it
+        # is ingested, deadbands or not, e.g. a NodeRecorder
+        self.taps = ()
+        # slot -> NodeHistory recording every update, None when not kept
+        self.histories = [None] * n
+        # object with on_callback(callback, stamp, start, end) told about every
+        # on_change call, None when they aren't timed
+        self.callback_timer = None
+        # notified whenever a node gets its first value
+        self.first_values = threading.Condition()
+        self.missing = 0
+        self.complete_at = None
+
+    def expect(self, slots):
+        """start counting down to the first value of every one of slots"""
+        with self.first_values:
+            self.missing = sum(1 for slot in slots if self.store.stamps[slot] == _NEVER)
+            self.complete_at = None if self.missing else monotonic()
 
-    @property
-    def commanded_quaternion_1(self) -> Optional[float]:
-        """Commanded Attitude Quaternion 1"""
-        val = self._get_value("commanded_quaternion_1")
-        return None if val is None else float(val)
 
-    @property
-    def commanded_quaternion_2(self) -> Optional[float]:
-        """Commanded Attitude Quaternion 2"""
-        val = self._get_value("commanded_quaternion_2")
-        return None if val is None else float(val)
+    def onItemUpdate(self, update):
+        route = self.routes.get(update.getItemName())
+        if route is None:
+            return
+        slot, decode = route
+        value = update.getValue("Value")
+        # decode once here so property reads are plain lookups
+        value = None if value is None else decode(value)
+        stamp = monotonic()
+        callbacks = self.callbacks[slot]
+        deadband = self.deadbands[slot]
+        if deadband is not None:
+            changed = passed = deadband.passes(value)
+        else:
+            passed = True
+            changed = bool(callbacks) and value != self.store.get(slot)
+        first = self.store.stamps[slot] == _NEVER
+        self.store.put(slot, value, stamp)
+        history = self.histories[slot]
+        if history is not None:
+            history.append(value, stamp)
+        for tap in self.taps:
+            tap.on_update(slot, value, stamp)
+        if first:
+            self._first_value(stamp)
+        if not passed:
+            return
+        if changed and callbacks:
+            self._dispatch(slot, value, callbacks)
+        for sink in self.sinks:
+            sink.on_update(slot, value, stamp)
+
+    def _first_value(self, stamp):
+        with self.first_values:
+            if self.missing > 0:
+                self.missing -= 1
+                if not self.missing:
+                    self.complete_at = stamp
+            self.first_values.notify_all()
+
+    def _dispatch(self, slot, value, callbacks):
+        name = ISS.node_names[slot]
+        value = _label(slot, value)
+        bands = self.callback_deadbands[slot]
+        timer = self.callback_timer
+        for callback in callbacks:
+            if bands is not None and callback in bands and not bands[callback].passes(value):
+                continue
+            if timer is not None:
+                start = monotonic()
+            try:
+                callback(name, value)
+            except Exception as exc:
+                print(f"on_change callback {callback!r} failed for {name}: {exc!r}")
+            if timer is not None:
+                timer.on_callback(callback, self.store.stamps[slot], start, monotonic())
+
+
+def _label(slot, value):
+    """a stored value the way the property returns it, status codes become labels"""
+    label = ISS._iss_slot_labels[slot]
+    return value if label is None else label(value)
+
+
+class UpdateBatch(dict):
+    """node name -> latest value for every node that changed in one window.
+
+    updates counts the raw updates that were folded into it.
+    """
+    def __init__(self, values, updates):
+        super().__init__(values)
+        self.updates = updates
+
+
+class CoalescingDispatcher:
+    """a sink that folds updates together and hands them over in batches.
+
+    Updates collect for window seconds, or until max_count different nodes
+    are pending, then callback(batch) runs once on the dispatcher's own
+    thread with an UpdateBatch. A node that updates several times in a
+    window is delivered once, with its last value.
+    """
+    def __init__(self, callback, window: float = 0.1, max_count: Optional[int] = None,
+                 names_or_groups=None):
+        self.callback = callback
+        self.window = window
+        self.max_count = max_count
+        self._wanted = None
+        if names_or_groups is not None:
+            self._wanted = bytearray(len(ISS.node_names))
+            for slot in ISS._select_names(names_or_groups):
+                self._wanted[slot] = 1
+        self._pending = {}
+        self._updates = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="iss-coalesce", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def on_update(self, slot, value, stamp):
+        if self._wanted is not None and not self._wanted[slot]:
+            return
+        with self._lock:
+            self._pending[slot] = value
+            self._updates += 1
+            full = self.max_count is not None and len(self._pending) >= self.max_count
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """deliver whatever is pending now, on the calling thread"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            updates, self._updates = self._updates, 0
+        if not pending:
+            return
+        batch = UpdateBatch({ISS.node_names[slot]: _label(slot, value)
+                             for slot, value in pending.items()}, updates)
+        try:
+            self.callback(batch)
+        except Exception as exc:
+            print(f"batch callback {self.callback!r} failed: {exc!r}")
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.window)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """stop the dispatcher thread after delivering what is still pending"""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+
+class ISSStats:
+    """counters fed from the ingest thread, see ISS.enable_stats().
+
+    Only the ingest thread writes them and nothing takes a lock, so a read
+    from another thread can be a few updates behind. Update counts come in
+    as a tap and callback timings as the listener's callback_timer.
+    """
+    def __init__(self, window: int = 10):
+        n = len(ISS.node_names)
+        self.window = window
+        self.started = monotonic()
+        self.counts = array("Q", [0]) * n
+        # updates per whole monotonic second, the last window + 1 seconds
+        self._seconds = array("Q", [0]) * (window + 1)
+        self._second = int(self.started)
+        # ingest to callback latency, bucket b holds latencies under 2**b microseconds
+        self.latency = array("Q", [0]) * 32
+        self.latency_sum = 0.0
+        # callback -> [calls, seconds spent in it, slowest call]
+        self.callback_times = {}
+
+    def on_update(self, slot, value, stamp):
+        self.counts[slot] += 1
+        second = int(stamp)
+        if second != self._second:
+            self._roll(second)
+        self._seconds[second % len(self._seconds)] += 1
+
+    def _roll(self, second):
+        # zero the buckets of every second skipped since the last update
+        size = len(self._seconds)
+        for skipped in range(max(self._second + 1, second - size + 1), second + 1):
+            self._seconds[skipped % size] = 0
+        self._second = second
+
+    def rate(self) -> float:
+        """updates per second over the last window whole seconds"""
+        now = int(monotonic())
+        size = len(self._seconds)
+        seconds = max(1, min(self.window, now - int(self.started)))
+        # buckets after the last update's second or older than the ring are stale
+        newest = self._second
+        oldest = newest - size + 1
+        total = sum(self._seconds[second % size] for second in range(now - seconds, now)
+                    if oldest <= second <= newest)
+        return total / seconds
+
+    def on_callback(self, callback, stamp, start, end):
+        """one on_change call for an update received at stamp, ran from start to end"""
+        latency = (start - stamp) * 1e6
+        self.latency[min(31, int(latency).bit_length())] += 1
+        self.latency_sum += latency
+        spent = end - start
+        timing = self.callback_times.get(callback)
+        if timing is None:
+            self.callback_times[callback] = [1, spent, spent]
+        else:
+            timing[0] += 1
+            timing[1] += spent
+            if spent > timing[2]:
+                timing[2] = spent
+
+
+def _prometheus_label(text):
+    return str(text).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsExporter:
+    """Prometheus text exposition of the numeric and status nodes plus the wrapper's own state over HTTP.
+
+    Numeric nodes become iss_node_value gauges, status nodes an
+    iss_node_status_code gauge and an iss_node_status series carrying the
+    label. All are labeled by node name and catalog section. Free text
+    nodes are left out: gmt_time and the like change on every update and
+    would make a new series each scrape. The node part is rendered from a snapshot and
+    cached until an update or subscription change makes it stale. The few
+    connection and stats lines are rendered on every scrape.
+    """
+    def __init__(self, iss: "ISS", host: str = "127.0.0.1", port: int = 9108):
+        self.iss = iss
+        self.renders = 0
+        self._lock = threading.Lock()
+        self._key = None
+        self._nodes = ""
+        self._labels = [f'name="{name}",group="{ISS._iss_slot_sections[slot]}"'
+                        for slot, name in enumerate(ISS.node_names)]
+        self._server = None
+        self._thread = None
+        if port is not None:
+            self._serve(host, port)
+
+    def _serve(self, host, port):
+        # only needed when serving, most users never pay for importing it
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="iss-metrics", daemon=True)
+        self._thread.start()
+
+    @property
+    def address(self):
+        """(host, port) being served, the port is the real one when 0 was asked for"""
+        return None if self._server is None else self._server.server_address[:2]
+
+    def _render_nodes(self, snap):
+        store = snap._store
+        subscribed = snap._subscribed
+        kinds = ISS._iss_slot_kinds
+        values = ["# HELP iss_node_value latest value of a numeric node",
+                  "# TYPE iss_node_value gauge"]
+        codes = ["# HELP iss_node_status_code raw code of a status node",
+                 "# TYPE iss_node_status_code gauge"]
+        states = ["# HELP iss_node_status 1 for the current label of a status node",
+                  "# TYPE iss_node_status gauge"]
+        for slot, labels in enumerate(self._labels):
+            if not subscribed[slot]:
+                continue
+            value = store.get(slot)
+            if value is None:
+                continue
+            kind = kinds[slot]
+            if kind in _NUMERIC:
+                values.append(f"iss_node_value{{{labels}}} {float(value)!r}")
+            elif kind is not str:
+                codes.append(f"iss_node_status_code{{{labels}}} {value}")
+                label = kind.get(value)
+                if label is not None:
+                    states.append(f'iss_node_status{{{labels},state="{_prometheus_label(label)}"}} 1')
+        return "\n".join(values + codes + states) + "\n"
+
+    def _render_wrapper(self):
+        stats = self.iss.stats()
+        lines = [
+            "# TYPE iss_connected gauge",
+            f"iss_connected {int(self.iss.is_connected)}",
+            "# TYPE iss_connection_status gauge",
+            f'iss_connection_status{{status="{_prometheus_label(stats["status"])}"}} 1',
+            "# TYPE iss_reconnects_total counter",
+            f"iss_reconnects_total {stats['reconnects']}",
+            "# TYPE iss_status_seconds_total counter",
+        ]
+        lines += [f'iss_status_seconds_total{{status="{_prometheus_label(status)}"}} {seconds!r}'
+                  for status, seconds in stats["status_seconds"].items()]
+        lines.append("# TYPE iss_queue_depth gauge")
+        lines += [f'iss_queue_depth{{queue="{_prometheus_label(queue)}"}} {depth}'
+                  for queue, depth in stats["queues"].items()]
+        if stats["updates"] is not None:
+            lines.append("# TYPE iss_updates_total counter")
+            # by section like the node series, each update counted once
+            lines += [f'iss_updates_total{{group="{section}"}} {count}'
+                      for section, count in stats["updates_per_section"].items()]
+            lines += ["# TYPE iss_update_rate gauge", f"iss_update_rate {stats['rate_per_s']!r}",
+                      "# TYPE iss_callback_latency_microseconds histogram"]
+            total = 0
+            for bound, count in sorted(stats["callback_latency_us"].items()):
+                total += count
+                lines.append(f'iss_callback_latency_microseconds_bucket{{le="{bound}"}} {total}')
+            lines += [f'iss_callback_latency_microseconds_bucket{{le="+Inf"}} {total}',
+                      f"iss_callback_latency_microseconds_sum {stats['callback_latency_sum_us']!r}",
+                      f"iss_callback_latency_microseconds_count {total}",
+                      "# TYPE iss_callback_seconds_total counter"]
+            lines += [f'iss_callback_seconds_total{{callback="{_prometheus_label(name)}"}} {timing["seconds"]!r}'
+                      for name, timing in stats["callbacks"].items()]
+        return "\n".join(lines) + "\n"
+
+    def render(self) -> str:
+        """the exposition text, node lines reused while nothing has changed"""
+        iss = self.iss
+        key = (iss._store.seq, bytes(iss._subscribed))
+        with self._lock:
+            if key != self._key:
+                snap = iss.snapshot()
+                self._nodes = self._render_nodes(snap)
+                self._key = (snap.seq, snap._subscribed)
+                self.renders += 1
+            nodes = self._nodes
+        return nodes + self._render_wrapper()
+
+    def close(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+
+# recording segment: magic, u32 header length, JSON header, then records of
+# slot u16, tag u8, receive time f64 (unix seconds), value f64. Text values
+# put their utf-8 length in the value field and the bytes right after.
+_RECORDING_MAGIC = b"ISSREC1\n"
+_RECORD = struct.Struct("<HBdd")
+_HEADER_LENGTH = struct.Struct("<I")
+_REC_VALUE, _REC_NONE, _REC_TEXT = 0, 1, 2
+# bytes read_recording() reads at a time
+_READ_CHUNK = 1 << 16
+
+
+class NodeRecorder:
+    """a tap writing every update to segmented append-only binary files.
+
+    The ingest thread only appends (slot, value, stamp) to a deque. The
+    recorder's own thread packs the records and writes them in large
+    buffered chunks every flush_interval seconds. A new segment starts once
+    the current one reaches segment_bytes or is segment_seconds old.
+    """
+    def __init__(self, directory: str, segment_bytes: int = 256 << 20,
+                 segment_seconds: Optional[float] = 3600.0, flush_interval: float = 0.5,
+                 buffer_size: int = 1 << 20):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        os.makedirs(directory, exist_ok=True)
+        # monotonic receive stamp + offset = unix time
+        self._offset = time() - monotonic()
+        self._queue = deque()
+        self._file = None
+        self._segment = 0
+        self.segments = []
+        self.records = 0
+        self.bytes_written = 0
+        self._segment_bytes = 0
+        self._segment_started = 0.0
+        self._closed = False
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="iss-recorder", daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def on_update(self, slot, value, stamp):
+        self._queue.append((slot, value, stamp))
+
+    def _open_segment(self):
+        if self._file is not None:
+            self._file.close()
+        import json
+        created = time()
+        # microseconds keep names in time order, another recorder on the
+        # same directory can still take one first, then try the next counter
+        stamp = f"{strftime('%Y%m%dT%H%M%S', gmtime(created))}.{int(created % 1 * 1e6):06d}Z"
+        while True:
+            self._segment += 1
+            path = os.path.join(self.directory, f"iss-{stamp}-{self._segment:06d}.issrec")
+            try:
+                self._file = open(path, "xb", buffering=self.buffer_size)
+                break
+            except FileExistsError:
+                pass
+        header = json.dumps({"nodes": ISS.node_names, "created": created}).encode()
+        self._file.write(_RECORDING_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+        self._segment_bytes = self._file.tell()
+        self._segment_started = monotonic()
+        self.segments.append(path)
+
+    def _due(self):
+        if self._file is None or self._segment_bytes >= self.segment_bytes:
+            return True
+        return (self.segment_seconds is not None
+                and monotonic() - self._segment_started >= self.segment_seconds)
+
+    def flush(self):
+        """write out everything queued so far, on the calling thread"""
+        queue = self._queue
+        pack = _RECORD.pack
+        offset = self._offset
+        while queue:
+            if self._due():
+                self._open_segment()
+            chunk = bytearray()
+            count = 0
+            # stop at the segment limit so rotation keeps segments near size
+            room = self.segment_bytes - self._segment_bytes
+            while queue and (not count or len(chunk) < room):
+                slot, value, stamp = queue.popleft()
+                if value is None:
+                    chunk += pack(slot, _REC_NONE, stamp + offset, 0.0)
+                elif value.__class__ is str:
+                    text = value.encode()
+                    chunk += pack(slot, _REC_TEXT, stamp + offset, len(text))
+                    chunk += text
+                else:
+                    chunk += pack(slot, _REC_VALUE, stamp + offset, value)
+                count += 1
+            self._file.write(chunk)
+            self._segment_bytes += len(chunk)
+            self.bytes_written += len(chunk)
+            self.records += count
+        if self._file is not None:
+            self._file.flush()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as exc:
+                print(f"recorder write to {self.directory} failed: {exc!r}")
+
+    def close(self):
+        """stop the writer thread after writing what is still queued"""
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_recording(path: str, labels: bool = True):
+    """yield (name, unix time, value) for every record in one recorder segment.
+
+    Values come back typed the way the properties return them, status nodes
+    as their labels (as int codes with labels=False). Nodes the current
+    catalog doesn't know come back as floats. The segment is read
+    _READ_CHUNK bytes at a time, and a record cut off at its end (a
+    recorder that didn't close) is left out.
+    """
+    import json
+    with open(path, "rb") as file:
+        if file.read(len(_RECORDING_MAGIC)) != _RECORDING_MAGIC:
+            raise ValueError(f"{path} is not an ISS recording")
+        (length,) = _HEADER_LENGTH.unpack(file.read(_HEADER_LENGTH.size))
+        names = json.loads(file.read(length))["nodes"]
+        slots = [ISS._iss_node_slots.get(name) for name in names]
+        types = [float if slot is None else ISS._iss_slot_kinds[slot] for slot in slots]
+        size = _RECORD.size
+        data = bytearray()
+        while True:
+            chunk = file.read(_READ_CHUNK)
+            if not chunk:
+                return
+            data += chunk
+            position = 0
+            end = len(data)
+            while position + size <= end:
+                index, tag, stamp, value = _RECORD.unpack_from(data, position)
+                start = position + size
+                slot = slots[index]
+                if tag == _REC_NONE:
+                    value = None
+                elif tag == _REC_TEXT:
+                    stop = start + int(value)
+                    if stop > end:
+                        # the text goes on in the next chunk, or was cut off with the segment
+                        break
+                    value = data[start:stop].decode()
+                    start = stop
+                elif types[index] in (int, bool):
+                    value = types[index](value)
+                elif types[index] is not float:
+                    value = _label(slot, int(value)) if labels else int(value)
+                position = start
+                yield names[index], stamp, value
+            # a partial record carries over to the next chunk
+            del data[:position]
+
+
+class _ReplayUpdate:
+    """the part of lightstreamer's ItemUpdate the listener reads"""
+    __slots__ = ("item", "value")
+
+    def __init__(self, item, value):
+        self.item = item
+        self.value = value
+
+    def getItemName(self):
+        return self.item
+
+    def getValue(self, field):
+        return self.value
+
+
+def _raw(value):
+    """a stored value back in the string form the feed sends"""
+    if value is None or value.__class__ is str:
+        return value
+    if value.__class__ is bool:
+        return "1" if value else "0"
+    return repr(value)
+
+
+class ISSReplay:
+    """feeds recorded segments through an ISS object's listener as if they were live.
+
+    Updates take the same onItemUpdate path as the live feed, so properties,
+    callbacks, deadbands, sinks and history all behave the same. speed=1.0
+    keeps the recorded pacing, 10.0 plays ten times faster and None as fast
+    as possible.
+    """
+    def __init__(self, iss: "ISS", paths, speed: Optional[float] = 1.0):
+        if isinstance(paths, str):
+            paths = [paths]
+        self.iss = iss
+        # segment names start with their UTC creation time, so sorted is in order
+        self.paths = sorted(paths)
+        self.speed = speed
+        self.replayed = 0
+        # recorded unix time of the last update delivered
+        self.position = None
+        self._seek = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _records(self):
+        items = ISS._iss_telemetry_nodes
+        for path in self.paths:
+            for name, stamp, value in read_recording(path, labels=False):
+                item = items.get(name)
+                if item is not None:
+                    yield stamp, _ReplayUpdate(item, _raw(value))
+
+    def seek(self, unix_time: float):
+        """jump the replay clock to unix_time.
+
+        Records up to there are delivered without waiting, so every node
+        holds exactly what it held at that moment. Seeking backwards starts
+        over from the first segment.
+        """
+        self._seek = unix_time
+
+    def run(self):
+        """replay on the calling thread until the recording ends or stop() is called"""
+        while self._play():
+            pass
+
+    def _play(self):
+        """one pass over the recording, True when a backwards seek needs another"""
+        deliver = self.iss._listener.onItemUpdate
+        stop = self._stop
+        # pacing anchor: monotonic time that recorded time origin played at
+        started = origin = catch_up = None
+        for stamp, update in self._records():
+            seek = self._seek
+            if seek is not None:
+                if self.position is not None and seek < self.position:
+                    self.position = None
+                    return True
+                catch_up, self._seek = seek, None
+                started = None
+            if catch_up is not None and stamp > catch_up:
+                started, origin, catch_up = monotonic(), catch_up, None
+            if catch_up is None and self.speed:
+                if started is None:
+                    started, origin = monotonic(), stamp
+                delay = started + (stamp - origin) / self.speed - monotonic()
+                if delay > 0.001 and stop.wait(delay):
+                    return False
+            if stop.is_set():
+                return False
+            deliver(update)
+            self.position = stamp
+            self.replayed += 1
+        return False
+
+    def start(self) -> "ISSReplay":
+        """replay on a background thread"""
+        self._thread = threading.Thread(target=self.run, name="iss-replay", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def join(self, timeout: Optional[float] = None):
+        """wait for a start()ed replay to reach the end of the recording"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_SYNTHETIC_MODES = ("STANDBY", "ACTIVE", "AUTO", "MANUAL", "IDLE")
+# (part of a float node's name, low, high) where its synthetic values stay,
+# the first match wins and anything else stays within 0..100
+_SYNTHETIC_RANGES = (
+    ("quaternion", -1.0, 1.0),
+    ("_error", -2.0, 2.0),
+    ("torque", -50.0, 50.0),
+    ("active_momentum", 0.0, 19000.0),
+    ("bga_position", 0.0, 360.0),
+    ("sarj", 0.0, 360.0),
+    ("trrj", -180.0, 180.0),
+    ("mt_position", -50.0, 50.0),
+    ("_pos", -6800.0, 6800.0),
+    ("_vel", -7.7, 7.7),
+    ("total_mass", 415000.0, 460000.0),
+    ("beta_angle", -75.0, 75.0),
+    ("ppo2", 145.0, 175.0),
+    ("ppn2", 560.0, 600.0),
+    ("ppco2", 1.0, 5.0),
+    ("coolant_lt", 2.0, 10.0),
+    ("coolant_mt", 14.0, 20.0),
+    ("cabin_temperature", 19.0, 26.0),
+    ("_temp", 15.0, 40.0),
+    ("vibration", 0.0, 0.05),
+    ("wheel_speed", 6550.0, 6650.0),
+    ("_voltage", 110.0, 160.0),
+    ("_current", 0.0, 10.0),
+    ("flowrate", 2000.0, 5000.0),
+    ("pm_pressure", 2000.0, 2600.0),
+    ("lock_pressure", 700.0, 770.0),
+    ("_o2_pressure", 500.0, 6000.0),
+    ("n2_pressure", 500.0, 6000.0),
+    ("joint", -180.0, 180.0),
+    ("azimuth", -180.0, 180.0),
+    ("elevation", -90.0, 90.0),
+    ("o2_production_rate", 0.0, 6.0),
+    ("kurs_range_rate", -5.0, 5.0),
+    ("kurs_range", 0.0, 10000.0),
+)
+
+
+def _synthetic_range(item):
+    name = ISS.node_names[ISS._iss_item_routes[item][0]]
+    for part, low, high in _SYNTHETIC_RANGES:
+        if part in name:
+            return low, high
+    return 0.0, 100.0
+
+
+def _synthetic_values(kind, item, rng, period):
+    """period raw strings one item cycles through, shaped like the real feed"""
+    if kind is float:
+        # a slow oscillation around a level with a little sensor noise, within the node's range
+        low, high = _synthetic_range(item)
+        width = high - low
+        level = rng.uniform(low + width / 10, high - width / 10)
+        swing = width * rng.uniform(0.001, 0.05)
+        phase = rng.uniform(0.0, 2 * math.pi)
+        return [repr(round(min(high, max(low, level + swing * math.sin(phase + 2 * math.pi * k / period)
+                                         + rng.gauss(0.0, swing / 100))), 4)) for k in range(period)]
+    if kind is str:
+        if item.startswith("TIME_"):
+            return [f"{k // 3600 % 366:03d}/{k // 60 % 60:02d}:{k % 60:02d}:00" for k in range(period)]
+        if item == "USLAB000058":
+            return [f"{rng.gauss(757.0, 0.5):.2f}" for _ in range(period)]
+        choices, changes = _SYNTHETIC_MODES, 0.01
+    elif kind is bool:
+        choices, changes = ("0", "1"), 0.02
+    elif item == "TIME_000002":
+        return [str(gmtime().tm_year)] * period
+    elif kind is int:
+        choices, changes = [str(n) for n in range(rng.randint(1, 4), 10)], 0.05
+    else:
+        choices, changes = [str(code) for code in kind.codes()], 0.02
+    # discrete nodes hold their value and only now and then move to another
+    current = rng.choice(choices)
+    values = []
+    for _ in range(period):
+        if rng.random() < changes:
+            current = rng.choice(choices)
+        values.append(current)
+    return values
+
+
+class _LocalSubscription:
+    """the part of lightstreamer's Subscription the in-process clients use"""
+    def __init__(self, mode, items, fields):
+        self.mode = mode
+        self.items = list(items)
+        self.fields = list(fields)
+        self.max_frequency = None
+        self._listeners = []
+
+    def addListener(self, listener):
+        self._listeners.append(listener)
+
+    def removeListener(self, listener):
+        self._listeners.remove(listener)
+
+    def getListeners(self):
+        return list(self._listeners)
+
+    def getItems(self):
+        return self.items
+
+    def setRequestedMaxFrequency(self, frequency):
+        self.max_frequency = frequency
+
+    def getRequestedMaxFrequency(self):
+        return self.max_frequency
+
+
+class _LocalClient:
+    """the status and listener plumbing of LightstreamerClient the stand-ins share"""
+    Subscription = _LocalSubscription
+
+    def __init__(self, server, adapter_set):
+        self.server = server
+        self.adapter_set = adapter_set
+        self.connectionDetails = None
+        self._status = "DISCONNECTED"
+        self._listeners = ()
+        self._subscriptions = ()
+
+    def addListener(self, listener):
+        self._listeners += (listener,)
+
+    def removeListener(self, listener):
+        self._listeners = tuple(other for other in self._listeners if other is not listener)
+
+    def getStatus(self):
+        return self._status
+
+    def _set_status(self, status):
+        self._status = status
+        for listener in self._listeners:
+            listener.onStatusChange(status)
+
+
+class SyntheticFeed(_LocalClient):
+    """an in-process stand-in for LightstreamerClient producing synthetic updates.
+
+    Pass it as ISS(transport=SyntheticFeed) or, to set the rate,
+    ISS(transport=functools.partial(SyntheticFeed, rate=100_000)). Once
+    connected it cycles through every subscribed item on its own thread,
+    rate updates per second in total (None for as fast as the listeners
+    take them). Float nodes oscillate with noise, discrete nodes hold and
+    occasionally change, the same seed gives the same stream.
+    """
+    def __init__(self, server: Optional[str] = None, adapter_set: Optional[str] = None,
+                 rate: Optional[float] = 10000.0, seed: int = 0, period: int = 256):
+        super().__init__(server, adapter_set)
+        self.rate = rate
+        import random
+        self.sent = 0
+        self._rng = random.Random(seed)
+        self._period = period
+        self._values = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, subscription):
+        for item in subscription.getItems():
+            if item not in self._values:
+                slot = ISS._iss_item_routes[item][0]
+                self._values[item] = _synthetic_values(
+                    ISS._iss_slot_kinds[slot], item, self._rng, self._period)
+        self._subscriptions += (subscription,)
+
+    def unsubscribe(self, subscription):
+        self._subscriptions = tuple(other for other in self._subscriptions if other is not subscription)
 
-    @property
-    def commanded_quaternion_3(self) -> Optional[float]:
-        """Commanded Attitude Quaternion 3"""
-        val = self._get_value("commanded_quaternion_3")
-        return None if val is None else float(val)
+    def connect(self):
+        if self._thread is not None:
+            return
+        self._set_status("CONNECTING")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="iss-synthetic", daemon=True)
+        self._thread.start()
+        self._set_status("CONNECTED:WS-STREAMING")
+
+    def disconnect(self):
+        if self._thread is not None:
+            self._stop.set()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+        self._set_status("DISCONNECTED")
+
+    def _round(self):
+        """one update per subscribed item as (update, listeners) pairs"""
+        step = self.sent // max(1, sum(len(sub.getItems()) for sub in self._subscriptions))
+        updates = []
+        for subscription in self._subscriptions:
+            listeners = subscription.getListeners()
+            for item in subscription.getItems():
+                values = self._values[item]
+                updates.append((_ReplayUpdate(item, values[step % len(values)]), listeners))
+        return updates
+
+    def _run(self):
+        stop = self._stop
+        started = monotonic()
+        while not stop.is_set():
+            updates = self._round()
+            if not updates:
+                stop.wait(0.01)
+                continue
+            for update, listeners in updates:
+                for listener in listeners:
+                    listener.onItemUpdate(update)
+                self.sent += 1
+                if self.rate and not self.sent % 100:
+                    # pace in small bursts, sleeping is too coarse per update
+                    ahead = self.sent / self.rate - (monotonic() - started)
+                    if ahead > 0.001 and stop.wait(ahead):
+                        return
+                    if stop.is_set():
+                        return
+
+# broadcast stream: each side opens with the magic and a u32-length JSON
+# frame, the server's listing its catalog items, the client's the items it
+# wants (sent again whenever that changes). Then the server sends recorder
+# records, slot being the index into its item list, plus _REC_STATUS
+# records carrying the upstream connection status as text.
+_BROADCAST_MAGIC = b"ISSCAST1"
+_BROADCAST_POLICIES = ("coalesce", "drop")
+_REC_STATUS = 3
+_STATUS_SLOT = 0xFFFF
+_MAX_FRAME = 1 << 20
+
+
+def _frame(message):
+    import json
+    body = json.dumps(message).encode()
+    return _HEADER_LENGTH.pack(len(body)) + body
+
+
+def _pack_record(slot, value, unix_time):
+    """one record in the recorder format for a stored value"""
+    if value is None:
+        return _RECORD.pack(slot, _REC_NONE, unix_time, 0.0)
+    if value.__class__ is str:
+        text = value.encode()
+        return _RECORD.pack(slot, _REC_TEXT, unix_time, len(text)) + text
+    return _RECORD.pack(slot, _REC_VALUE, unix_time, value)
+
+
+def _pack_status(status, unix_time):
+    text = status.encode()
+    return _RECORD.pack(_STATUS_SLOT, _REC_STATUS, unix_time, len(text)) + text
+
+
+class _Consumer:
+    """one connected broadcast client, only touched by the broadcaster's thread"""
+    def __init__(self, sock):
+        n = len(ISS.node_names)
+        self.sock = sock
+        self.inbox = bytearray()
+        self.greeted = False
+        self.wanted = bytearray(n)
+        # slot -> seq of the value the client already got with its initial state
+        self.since = array("Q", [0]) * n
+        # bytes not yet accepted by the socket
+        self.out = bytearray()
+        # slot -> latest record held back while the client is behind
+        self.held = {}
+        self.dropped = 0
+
+
+class ISSBroadcaster:
+    """re-publishes one ISS object's updates to any number of BroadcastFeed clients.
+
+    address is a (host, port) tuple for TCP or a path for a Unix socket.
+    Each client first gets the current value of every node it subscribes
+    to, then only the updates, as binary records. The ingest thread just
+    appends to a deque. The broadcaster's thread packs each update once
+    every flush_interval seconds and writes it to every interested client
+    with non-blocking sends, so a stalled client never holds up the others.
+    Once a client has more than max_buffer bytes unsent, policy decides
+    what happens to its further updates until it catches up: "coalesce"
+    keeps only the latest one per node, "drop" discards them (see dropped).
+    A client that makes the broadcaster fail is dropped. Any other failure
+    stops the broadcaster: every client is disconnected and the exception
+    is kept in error.
+    """
+    def __init__(self, iss: "ISS", address, policy: str = "coalesce",
+                 max_buffer: int = 1 << 20, flush_interval: float = 0.02):
+        if policy not in _BROADCAST_POLICIES:
+            raise ValueError(f"unknown policy {policy!r}, expected one of {_BROADCAST_POLICIES}")
+        # only needed when broadcasting, most users never pay for importing them
+        import selectors
+        import socket
+        self.iss = iss
+        self.policy = policy
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._store = iss._store
+        self._status = iss.connection_status
+        # monotonic receive stamp + offset = unix time
+        self._offset = time() - monotonic()
+        self._queue = deque()
+        self._consumers = {}
+        self._path = None
+        if isinstance(address, str):
+            if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+                # left behind by a broadcaster that didn't close
+                os.unlink(address)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(address)
+            server.listen()
+            self._path = address
+        else:
+            server = socket.create_server(tuple(address))
+        server.setblocking(False)
+        self._server = server
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(server, selectors.EVENT_READ)
+        self._read_event = selectors.EVENT_READ
+        self._closed = False
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name="iss-broadcast", daemon=True)
+        self._thread.start()
 
     @property
-    def state_vector_x_pos(self) -> Optional[float]:
-        """State Vector X Position (meters)"""
-        val = self._get_value("state_vector_x_pos")
-        return None if val is None else float(val)
+    def address(self):
+        """the Unix socket path or (host, port) served, the real port when 0 was asked for"""
+        return self._path or self._server.getsockname()[:2]
 
     @property
-    def state_vector_y_pos(self) -> Optional[float]:
-        """State Vector Y Position (meters)"""
-        val = self._get_value("state_vector_y_pos")
-        return None if val is None else float(val)
+    def consumers(self) -> int:
+        return len(self._consumers)
 
     @property
-    def state_vector_z_pos(self) -> Optional[float]:
-        """State Vector Z Position (meters)"""
-        val = self._get_value("state_vector_z_pos")
-        return None if val is None else float(val)
+    def pending(self) -> int:
+        return len(self._queue)
 
-    @property
-    def state_vector_x_vel(self) -> Optional[float]:
-        """State Vector X Velocity (m/s)"""
-        val = self._get_value("state_vector_x_vel")
-        return None if val is None else float(val)
+    def on_update(self, slot, value, stamp):
+        # the store already counted this update, its seq tells clients' initial state apart
+        self._queue.append((self._store.seq, slot, value, stamp))
 
-    @property
-    def state_vector_y_vel(self) -> Optional[float]:
-        """State Vector Y Velocity (m/s)"""
-        val = self._get_value("state_vector_y_vel")
-        return None if val is None else float(val)
+    def onStatusChange(self, status):
+        self._queue.append((0, _STATUS_SLOT, status, monotonic()))
 
-    @property
-    def state_vector_z_vel(self) -> Optional[float]:
-        """State Vector Z Velocity (m/s)"""
-        val = self._get_value("state_vector_z_vel")
-        return None if val is None else float(val)
+    def _run(self):
+        address = self.address
+        try:
+            while not self._closed:
+                self._serve_once()
+        except Exception as exc:
+            # not down to one client, retrying would only fail the same way
+            self.error = exc
+            print(f"broadcast on {address} stopped: {exc!r}")
+            # nothing reads the queue any more
+            listener = self.iss._listener
+            listener.taps = tuple(tap for tap in listener.taps if tap is not self)
+            self.iss.remove_status_listener(self)
+            self._shut_down()
+
+    def _serve_once(self):
+        for key, _ in self._selector.select(self.flush_interval):
+            if key.data is None:
+                self._accept()
+                continue
+            try:
+                self._receive(key.data)
+            except Exception as exc:
+                print(f"broadcast client dropped: {exc!r}")
+                if key.data.sock in self._consumers:
+                    self._drop(key.data)
+        self._fan_out()
+        self._send()
+
+    def _accept(self):
+        try:
+            sock, _ = self._server.accept()
+        except OSError:
+            return
+        sock.setblocking(False)
+        consumer = _Consumer(sock)
+        self._consumers[sock] = consumer
+        self._selector.register(sock, self._read_event, consumer)
+
+    def _drop(self, consumer):
+        self._selector.unregister(consumer.sock)
+        consumer.sock.close()
+        del self._consumers[consumer.sock]
+
+    def _receive(self, consumer):
+        try:
+            data = consumer.sock.recv(1 << 16)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._drop(consumer)
+            return
+        inbox = consumer.inbox
+        inbox += data
+        if not consumer.greeted:
+            if len(inbox) < len(_BROADCAST_MAGIC):
+                return
+            if inbox[:len(_BROADCAST_MAGIC)] != _BROADCAST_MAGIC:
+                self._drop(consumer)
+                return
+            del inbox[:len(_BROADCAST_MAGIC)]
+            consumer.greeted = True
+            consumer.out += (_BROADCAST_MAGIC + _frame({"items": ISS._iss_slot_items})
+                             + _pack_status(self._status, time()))
+        import json
+        while len(inbox) >= _HEADER_LENGTH.size:
+            (length,) = _HEADER_LENGTH.unpack_from(inbox)
+            end = _HEADER_LENGTH.size + length
+            if length > _MAX_FRAME:
+                self._drop(consumer)
+                return
+            if len(inbox) < end:
+                return
+            frame = inbox[_HEADER_LENGTH.size:end]
+            del inbox[:end]
+            try:
+                self._want(consumer, json.loads(frame).get("items") or ())
+            except (ValueError, TypeError, AttributeError):
+                # not a frame a BroadcastFeed sends, only this client goes
+                self._drop(consumer)
+                return
+
+    def _want(self, consumer, items):
+        """change what consumer gets, sending the current value of every node it adds"""
+        wanted = bytearray(len(ISS.node_names))
+        for item in items:
+            route = ISS._iss_item_routes.get(item)
+            if route is not None:
+                wanted[route[0]] = 1
+        added = [slot for slot, (now, before) in enumerate(zip(wanted, consumer.wanted))
+                 if now and not before]
+        consumer.wanted = wanted
+        consumer.held = {slot: record for slot, record in consumer.held.items() if wanted[slot]}
+        if not added:
+            return
+        store = self._store.snapshot()
+        out = consumer.out
+        for slot in added:
+            stamp = store.stamps[slot]
+            if stamp != _NEVER:
+                consumer.since[slot] = store.seqs[slot]
+                out += _pack_record(slot, store.get(slot), stamp + self._offset)
+
+    def _fan_out(self):
+        """pack what the ingest thread queued once and hand it to every interested client"""
+        queue = self._queue
+        if not queue:
+            return
+        offset = self._offset
+        records = []
+        while queue:
+            seq, slot, value, stamp = queue.popleft()
+            if slot == _STATUS_SLOT:
+                self._status = value
+                records.append((seq, slot, _pack_status(value, stamp + offset)))
+            else:
+                records.append((seq, slot, _pack_record(slot, value, stamp + offset)))
+        limit = self.max_buffer
+        coalesce = self.policy == "coalesce"
+        for consumer in self._consumers.values():
+            if not consumer.greeted:
+                continue
+            wanted, since, out, held = consumer.wanted, consumer.since, consumer.out, consumer.held
+            # a client still behind from earlier rounds gets this one held back or dropped
+            behind = held or len(out) > limit
+            for seq, slot, record in records:
+                if slot == _STATUS_SLOT:
+                    out += record
+                elif not wanted[slot] or seq <= since[slot]:
+                    continue
+                elif not behind:
+                    out += record
+                elif coalesce:
+                    held[slot] = record
+                else:
+                    consumer.dropped += 1
+                    self.dropped += 1
+
+    def _send(self):
+        for consumer in list(self._consumers.values()):
+            out = consumer.out
+            if consumer.held and len(out) <= self.max_buffer:
+                # caught up, the held back values go out together
+                out += b"".join(consumer.held.values())
+                consumer.held = {}
+            if not out:
+                continue
+            try:
+                sent = consumer.sock.send(out)
+            except BlockingIOError:
+                continue
+            except OSError:
+                self._drop(consumer)
+                continue
+            del out[:sent]
+
+    def close(self):
+        """stop serving and disconnect every client"""
+        self._closed = True
+        self._thread.join()
+        if self.error is None:
+            self._shut_down()
+
+    def _shut_down(self):
+        for consumer in list(self._consumers.values()):
+            self._drop(consumer)
+        self._selector.close()
+        self._server.close()
+        if self._path is not None and os.path.exists(self._path):
+            os.unlink(self._path)
+
+
+def _text_int(value):
+    return str(int(value))
+
+
+class BroadcastFeed(_LocalClient):
+    """a stand-in for LightstreamerClient fed by an ISSBroadcaster instead of the internet.
+
+    Pass it as ISS(transport=functools.partial(BroadcastFeed, address=...))
+    with the broadcaster's address. Its subscriptions tell the broadcaster
+    which nodes to send, updates reach the ISS object the way live ones do.
+    The status is the upstream connection's as the broadcaster relays it,
+    "DISCONNECTED:WILL-RETRY" while the broadcaster can't be reached. A
+    lost connection is retried every retry seconds and starts again with
+    the full state.
+    """
+    def __init__(self, server: Optional[str] = None, adapter_set: Optional[str] = None,
+                 address=None, retry: float = 1.0):
+        if address is None:
+            raise ValueError("BroadcastFeed needs the broadcaster's address")
+        super().__init__(server, adapter_set)
+        self.address = address
+        self.retry = retry
+        self.received = 0
+        # item -> subscriptions with that item
+        self._routes = {}
+        self._socket = None
+        self._send_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def subscribe(self, subscription):
+        self._subscriptions += (subscription,)
+        self._update_routes()
+
+    def unsubscribe(self, subscription):
+        self._subscriptions = tuple(other for other in self._subscriptions if other is not subscription)
+        self._update_routes()
+
+    def _update_routes(self):
+        routes = {}
+        for subscription in self._subscriptions:
+            for item in subscription.getItems():
+                routes[item] = routes.get(item, ()) + (subscription,)
+        self._routes = routes
+        with self._send_lock:
+            if self._socket is not None:
+                try:
+                    self._socket.sendall(_frame({"items": sorted(self._routes)}))
+                except OSError:
+                    # the reading thread notices and reconnects
+                    pass
 
-    @property
-    def cmg_capacity(self) -> Optional[float]:
-        """Control Moment Gyroscope Capacity"""
-        val = self._get_value("cmg_capacity")
-        return None if val is None else float(val)
+    def connect(self):
+        if self._thread is not None:
+            return
+        self._set_status("CONNECTING")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="iss-broadcast-feed", daemon=True)
+        self._thread.start()
+
+    def disconnect(self):
+        if self._thread is not None:
+            self._stop.set()
+            import socket
+            with self._send_lock:
+                if self._socket is not None:
+                    try:
+                        # wakes the reading thread out of recv()
+                        self._socket.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+        self._set_status("DISCONNECTED")
+
+    def _run(self):
+        import socket
+        while not self._stop.is_set():
+            try:
+                if isinstance(self.address, str):
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.connect(self.address)
+                else:
+                    sock = socket.create_connection(tuple(self.address))
+            except OSError:
+                sock = None
+            if sock is not None:
+                try:
+                    self._stream(sock)
+                except (OSError, ValueError):
+                    pass
+                finally:
+                    with self._send_lock:
+                        self._socket = None
+                    sock.close()
+            if self._stop.is_set():
+                return
+            self._set_status("DISCONNECTED:WILL-RETRY")
+            self._stop.wait(self.retry)
+
+    def _stream(self, sock):
+        """read one connection's records until it closes"""
+        import json
+        with self._send_lock:
+            sock.sendall(_BROADCAST_MAGIC + _frame({"items": sorted(self._routes)}))
+            self._socket = sock
+        data = bytearray()
+        opening = len(_BROADCAST_MAGIC) + _HEADER_LENGTH.size
+        while len(data) < opening:
+            if not self._read(sock, data):
+                return
+        if data[:len(_BROADCAST_MAGIC)] != _BROADCAST_MAGIC:
+            raise ValueError(f"{self.address} is not an ISS broadcaster")
+        (length,) = _HEADER_LENGTH.unpack_from(data, len(_BROADCAST_MAGIC))
+        while len(data) < opening + length:
+            if not self._read(sock, data):
+                return
+        items = json.loads(data[opening:opening + length])["items"]
+        del data[:opening + length]
+        # the feed's raw text form for each server index, so the listener decodes as usual
+        kinds = [ISS._iss_slot_kinds[ISS._iss_item_routes[item][0]]
+                 if item in ISS._iss_item_routes else float for item in items]
+        texts = [repr if kind is float else _text_int for kind in kinds]
+        unpack = _RECORD.unpack_from
+        size = _RECORD.size
+        while True:
+            position = 0
+            end = len(data)
+            while position + size <= end:
+                index, tag, _, value = unpack(data, position)
+                start = position + size
+                if tag == _REC_TEXT or tag == _REC_STATUS:
+                    stop = start + int(value)
+                    if stop > end:
+                        break
+                    value = data[start:stop].decode()
+                    start = stop
+                position = start
+                if tag == _REC_STATUS:
+                    self._set_status(value)
+                    continue
+                if index >= len(items):
+                    # the connection is dropped and made again
+                    raise ValueError(f"{self.address} sent node {index}, it only has {len(items)}")
+                item = items[index]
+                subscriptions = self._routes.get(item)
+                if subscriptions is None:
+                    continue
+                if tag == _REC_NONE:
+                    value = None
+                elif tag == _REC_VALUE:
+                    value = texts[index](value)
+                update = _ReplayUpdate(item, value)
+                for subscription in subscriptions:
+                    for listener in subscription.getListeners():
+                        listener.onItemUpdate(update)
+                self.received += 1
+            del data[:position]
+            if not self._read(sock, data):
+                return
+
+    @staticmethod
+    def _read(sock, data):
+        chunk = sock.recv(1 << 16)
+        data += chunk
+        return bool(chunk)
+
+
+class NodeUpdate(NamedTuple):
+    name: str
+    value: object
+    stamp: float
+
+
+class _LoopBridge:
+    """a sink handing updates to an asyncio loop.
+
+    Updates pile up in a deque and the loop is woken once per pile rather
+    than once per update, so a fast feed costs one call_soon_threadsafe
+    for however many updates arrived while the loop was busy.
+    """
+    def __init__(self, loop, deliver):
+        self.loop = loop
+        self.deliver = deliver
+        self.wakeups = 0
+        self._queue = deque()
+        self._scheduled = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def on_update(self, slot, value, stamp):
+        self._queue.append((slot, value, stamp))
+        if not self._scheduled:
+            self._scheduled = True
+            try:
+                self.loop.call_soon_threadsafe(self._drain)
+            except RuntimeError:
+                # the loop has been closed, nobody is listening any more
+                pass
+
+    def _drain(self):
+        # cleared before draining: anything appended after this schedules a new drain
+        self._scheduled = False
+        self.wakeups += 1
+        queue = self._queue
+        self.deliver([queue.popleft() for _ in range(len(queue))])
+
+
+class _StatusBridge:
+    """mirrors the Lightstreamer connection status into an asyncio.Event"""
+    def __init__(self, loop, connected):
+        self.loop = loop
+        self.connected = connected
+
+    def onStatusChange(self, status):
+        streaming = status.startswith("CONNECTED:") and status.endswith("-STREAMING")
+        try:
+            self.loop.call_soon_threadsafe(self.connected.set if streaming else self.connected.clear)
+        except RuntimeError:
+            pass
 
-    @property
-    def iss_total_mass(self) -> Optional[float]:
-        """International Space Station Total Mass (kg)"""
-        val = self._get_value("iss_total_mass")
-        return None if val is None else float(val)
 
-    @property
-    def solar_beta_angle(self) -> Optional[float]:
-        """Solar Beta Angle (degrees)"""
-        val = self._get_value("solar_beta_angle")
-        return None if val is None else float(val)
-    
-    @property
-    def loac_cmg_alarm(self) -> Optional[str]:
-        """Loss of Attitude Control CMG Alarm"""
-        value = self._get_value("loac_cmg_alarm")
-        mapping = {0: "FALSE", 1: "TRUE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def loac_iss_alarm(self) -> Optional[str]:
-        """Loss of Attitude Control ISS Alarm"""
-        value = self._get_value("loac_iss_alarm")
-        mapping = {0: "FALSE", 1: "TRUE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def gps_1_status(self) -> Optional[str]:
-        """Global Positioning System 1 Status"""
-        value = self._get_value("gps_1_status")
-        mapping = {
-            0: "DOING POSITION FIXES", 1: "SV TIMING", 2: "APPROXIMATE TIMING", 
-            3: "GPS TIME", 4: "NEED INITIALIZATION", 5: "GDOP NEEDED", 
-            6: "BAD TIMING", 7: "NO USABLE SV", 8: "ONLY 1 USABLE SVs", 
-            9: "ONLY 2 USABLE SVs", 10: "ONLY 3 USABLE SVs", 11: "BAD INTEGRITY", 
-            12: "NO VEL AVAIL", 13: "UNUSABLE FIX"
-        }
-        return self._decode_status(value, mapping)
-    
-    @property
-    def gps_2_status(self) -> Optional[str]:
-        """Global Positioning System 2 Status"""
-        value = self._get_value("gps_2_status")
-        mapping = {
-            0: "DOING POSITION FIXES", 1: "SV TIMING", 2: "APPROXIMATE TIMING", 
-            3: "GPS TIME", 4: "NEED INITIALIZATION", 5: "GDOP NEEDED", 
-            6: "BAD TIMING", 7: "NO USABLE SV", 8: "ONLY 1 USABLE SVs", 
-            9: "ONLY 2 USABLE SVs", 10: "ONLY 3 USABLE SVs", 11: "BAD INTEGRITY", 
-            12: "NO VEL AVAIL", 13: "UNUSABLE FIX"
+class ISS:
+    """a wrapper to get the live nodes from the ISS lightstreamer"""
+    server = "https://push.lightstreamer.com"
+    adapter_set = "ISSLIVE"
+
+    # catalog section -> node name -> (Lightstreamer item, declared value type or
+    # StatusMap, description). Each node becomes a read-only property of the
+    # same name, generated from this table below the class.
+    _iss_node_sections = {
+        # Control Moment Gyroscope (CMG) - Attitude Control
+        'cmg_control': {
+            'cmg_1_online': ('USLAB000001', _CMG_ONLINE, 'Control Moment Gyroscope 1 Online Status'),
+            'cmg_2_online': ('USLAB000002', _CMG_ONLINE, 'Control Moment Gyroscope 2 Online Status'),
+            'cmg_3_online': ('USLAB000003', _CMG_ONLINE, 'Control Moment Gyroscope 3 Online Status'),
+            'cmg_4_online': ('USLAB000004', _CMG_ONLINE, 'Control Moment Gyroscope 4 Online Status'),
+            'cmgs_online_count': ('USLAB000005', int, 'Control Moment Gyroscopes Online Count'),
+            'cmg_control_torque_roll': ('USLAB000006', float, 'Control Moment Gyroscope Control Torque Roll'),
+            'cmg_control_torque_pitch': ('USLAB000007', float, 'Control Moment Gyroscope Control Torque Pitch'),
+            'cmg_control_torque_yaw': ('USLAB000008', float, 'Control Moment Gyroscope Control Torque Yaw'),
+            'cmg_active_momentum': ('USLAB000009', float, 'Control Moment Gyroscope Active Momentum'),
+            'cmg_momentum_percentage': ('USLAB000010', float, 'Control Moment Gyroscope Momentum Percentage'),
+            'desaturation_request': ('USLAB000011', _DESATURATION_REQUEST, 'CMG Desaturation Request Status'),
+            'gnc_mode': ('USLAB000012', str, 'Guidance Navigation and Control Mode'),
+            'attitude_source': ('USLAB000013', _ATTITUDE_SOURCE, 'Attitude Determination Source'),
+            'rate_source': ('USLAB000014', _RATE_SOURCE, 'Angular Rate Source'),
+            'state_vector_source': ('USLAB000015', _STATE_VECTOR_SOURCE, 'State Vector Source'),
+            'attitude_controller_type': ('USLAB000016', _ATTITUDE_CONTROLLER, 'Attitude Controller Type'),
+            'attitude_control_reference_frame': ('USLAB000017', _REFERENCE_FRAME, 'Attitude Control Reference Frame')
+        },
+
+        # Attitude Quaternions
+        'attitude_quaternions': {
+            'lvlh_quaternion_0': ('USLAB000018', float, 'Local Vertical Local Horizontal Quaternion 0'),
+            'lvlh_quaternion_1': ('USLAB000019', float, 'Local Vertical Local Horizontal Quaternion 1'),
+            'lvlh_quaternion_2': ('USLAB000020', float, 'Local Vertical Local Horizontal Quaternion 2'),
+            'lvlh_quaternion_3': ('USLAB000021', float, 'Local Vertical Local Horizontal Quaternion 3'),
+            'attitude_roll_error': ('USLAB000022', float, 'Attitude Roll Error (degrees)'),
+            'attitude_pitch_error': ('USLAB000023', float, 'Attitude Pitch Error (degrees)'),
+            'attitude_yaw_error': ('USLAB000024', float, 'Attitude Yaw Error (degrees)'),
+            'commanded_quaternion_0': ('USLAB000025', float, 'Commanded Attitude Quaternion 0'),
+            'commanded_quaternion_1': ('USLAB000026', float, 'Commanded Attitude Quaternion 1'),
+            'commanded_quaternion_2': ('USLAB000027', float, 'Commanded Attitude Quaternion 2'),
+            'commanded_quaternion_3': ('USLAB000028', float, 'Commanded Attitude Quaternion 3')
+        },
+
+        # Position and Velocity State Vectors
+        'state_vector': {
+            'state_vector_x_pos': ('USLAB000032', float, 'State Vector X Position (meters)'),
+            'state_vector_y_pos': ('USLAB000033', float, 'State Vector Y Position (meters)'),
+            'state_vector_z_pos': ('USLAB000034', float, 'State Vector Z Position (meters)'),
+            'state_vector_x_vel': ('USLAB000035', float, 'State Vector X Velocity (m/s)'),
+            'state_vector_y_vel': ('USLAB000036', float, 'State Vector Y Velocity (m/s)'),
+            'state_vector_z_vel': ('USLAB000037', float, 'State Vector Z Velocity (m/s)')
+        },
+
+        # Station and System Status
+        'station_status': {
+            'cmg_capacity': ('USLAB000038', float, 'Control Moment Gyroscope Capacity'),
+            'iss_total_mass': ('USLAB000039', float, 'International Space Station Total Mass (kg)'),
+            'solar_beta_angle': ('USLAB000040', float, 'Solar Beta Angle (degrees)'),
+            'loac_cmg_alarm': ('USLAB000041', _TRUE_FALSE, 'Loss of Attitude Control CMG Alarm'),
+            'loac_iss_alarm': ('USLAB000042', _TRUE_FALSE, 'Loss of Attitude Control ISS Alarm'),
+            'gps_1_status': ('USLAB000043', _GPS_STATUS, 'Global Positioning System 1 Status'),
+            'gps_2_status': ('USLAB000044', _GPS_STATUS, 'Global Positioning System 2 Status')
+        },
+
+        # CMG Temperatures
+        'cmg_temperatures': {
+            'cmg_1_spin_motor_temp': ('USLAB000045', float, 'Control Moment Gyroscope 1 Spin Motor Temperature'),
+            'cmg_2_spin_motor_temp': ('USLAB000046', float, 'Control Moment Gyroscope 2 Spin Motor Temperature'),
+            'cmg_3_spin_motor_temp': ('USLAB000047', float, 'Control Moment Gyroscope 3 Spin Motor Temperature'),
+            'cmg_4_spin_motor_temp': ('USLAB000048', float, 'Control Moment Gyroscope 4 Spin Motor Temperature'),
+            'cmg_1_hall_resolver_temp': ('USLAB000049', float, 'Control Moment Gyroscope 1 Hall Resolver Temperature'),
+            'cmg_2_hall_resolver_temp': ('USLAB000050', float, 'Control Moment Gyroscope 2 Hall Resolver Temperature'),
+            'cmg_3_hall_resolver_temp': ('USLAB000051', float, 'Control Moment Gyroscope 3 Hall Resolver Temperature'),
+            'cmg_4_hall_resolver_temp': ('USLAB000052', float, 'Control Moment Gyroscope 4 Hall Resolver Temperature')
+        },
+
+        # Environmental Control and Life Support
+        'lab_environment': {
+            'lab_ppo2': ('USLAB000053', float, 'Lab Partial Pressure Oxygen'),
+            'lab_ppn2': ('USLAB000054', float, 'Lab Partial Pressure Nitrogen'),
+            'lab_ppco2': ('USLAB000055', float, 'Lab Partial Pressure Carbon Dioxide'),
+            'lab_coolant_lt': ('USLAB000056', float, 'Lab Coolant Loop Temperature (Low)'),
+            'lab_coolant_mt': ('USLAB000057', float, 'Lab Coolant Loop Temperature (Medium)'),
+            'cabin_pressure': ('USLAB000058', str, 'Cabin Atmospheric Pressure'),
+            'cabin_temperature': ('USLAB000059', float, 'Cabin Temperature'),
+            'lab_avionics_temp': ('USLAB000060', float, 'Lab Avionics Temperature'),
+            'lab_air_cooling_temp': ('USLAB000061', float, 'Lab Air Cooling Temperature'),
+            'vacuum_resource_valve': ('USLAB000062', _VACUUM_VALVE, 'Vacuum Resource Valve Position'),
+            'vacuum_exhaust_valve': ('USLAB000063', _VACUUM_VALVE, 'Vacuum Exhaust Valve Position'),
+            'lab_port_ac_state': ('USLAB000064', _AC_STATE, 'Lab Port Air Conditioning State'),
+            'lab_starboard_ac_state': ('USLAB000065', _AC_STATE, 'Lab Starboard Air Conditioning State')
+        },
+
+        # Multiplexer/Demultiplexer Status
+        'mdm_status': {
+            'cc_mdm_1_status': ('USLAB000066', _POWER_STATUS, 'Command and Control Multiplexer/Demultiplexer 1 Status'),
+            'cc_mdm_2_status': ('USLAB000067', _POWER_STATUS, 'Command and Control Multiplexer/Demultiplexer 2 Status'),
+            'cc_mdm_3_status': ('USLAB000068', _POWER_STATUS, 'Command and Control Multiplexer/Demultiplexer 3 Status'),
+            'icz_mdm_1_status': ('USLAB000069', _POWER_STATUS, 'Internal Control Zone Multiplexer/Demultiplexer 1 Status'),
+            'icz_mdm_2_status': ('USLAB000070', _POWER_STATUS, 'Internal Control Zone Multiplexer/Demultiplexer 2 Status'),
+            'pl_mdm_1_status': ('USLAB000071', _POWER_STATUS, 'Payload Multiplexer/Demultiplexer 1 Status'),
+            'pl_mdm_2_status': ('USLAB000072', _POWER_STATUS, 'Payload Multiplexer/Demultiplexer 2 Status'),
+            'gnc_mdm_1_status': ('USLAB000073', _POWER_STATUS, 'Guidance Navigation Control Multiplexer/Demultiplexer 1 Status'),
+            'gnc_mdm_2_status': ('USLAB000074', _POWER_STATUS, 'Guidance Navigation Control Multiplexer/Demultiplexer 2 Status'),
+            'pmcu_1_mdm_status': ('USLAB000075', _POWER_STATUS, 'Power Management Control Unit 1 Multiplexer/Demultiplexer Status'),
+            'pmcu_2_mdm_status': ('USLAB000076', _POWER_STATUS, 'Power Management Control Unit 2 Multiplexer/Demultiplexer Status'),
+            'lab_mdm_1_status': ('USLAB000077', _POWER_STATUS, 'Lab Multiplexer/Demultiplexer 1 Status'),
+            'lab_mdm_2_status': ('USLAB000078', _POWER_STATUS, 'Lab Multiplexer/Demultiplexer 2 Status'),
+            'lab_mdm_3_status': ('USLAB000079', _POWER_STATUS, 'Lab Multiplexer/Demultiplexer 3 Status'),
+            'pmm_power_status': ('USLAB000080', _POWER_STATUS, 'Permanent Multipurpose Module Power Status')
+        },
+
+        # Mission Control and Commands
+        'mission_control': {
+            'attitude_maneuver_in_progress': ('USLAB000081', bool, 'Attitude Maneuver In Progress Status'),
+            'standard_command_counter': ('USLAB000082', int, 'Standard Command Counter'),
+            'data_load_command_counter': ('USLAB000083', int, 'Data Load Command Counter'),
+            'cc_mdm_time_coarse': ('USLAB000084', int, 'Command and Control MDM Time Coarse'),
+            'cc_mdm_time_fine': ('USLAB000085', int, 'Command and Control MDM Time Fine'),
+            'station_mode': ('USLAB000086', str, 'Space Station Operating Mode'),
+            'laptops_active': ('USLAB000087', int, 'Number of Active Laptops')
+        },
+
+        # Communications
+        'communications': {
+            'ku_video_ch1_activity': ('USLAB000088', _ACTIVITY, 'Ku-band Video Channel 1 Activity'),
+            'ku_video_ch2_activity': ('USLAB000089', _ACTIVITY, 'Ku-band Video Channel 2 Activity'),
+            'ku_video_ch3_activity': ('USLAB000090', _ACTIVITY, 'Ku-band Video Channel 3 Activity'),
+            'ku_video_ch4_activity': ('USLAB000091', _ACTIVITY, 'Ku-band Video Channel 4 Activity'),
+            'sband_active_string': ('USLAB000092', _SBAND_STRING, 'S-band Active Communication String'),
+            'iac_1_status': ('USLAB000093', _IAC_STATUS, 'Internal Audio Controller 1 Status'),
+            'iac_2_status': ('USLAB000094', _IAC_STATUS, 'Internal Audio Controller 2 Status'),
+            'video_downlink_1': ('USLAB000095', _VIDEO_SOURCE, 'Video Downlink Channel 1'),
+            'video_downlink_2': ('USLAB000096', _VIDEO_SOURCE, 'Video Downlink Channel 2'),
+            'video_downlink_3': ('USLAB000097', _VIDEO_SOURCE, 'Video Downlink Channel 3'),
+            'video_downlink_4': ('USLAB000098', _VIDEO_SOURCE, 'Video Downlink Channel 4'),
+            'uhf_1_power': ('USLAB000099', _POWER_STATUS, 'Ultra High Frequency Radio 1 Power Status'),
+            'uhf_2_power': ('USLAB000100', _POWER_STATUS, 'Ultra High Frequency Radio 2 Power Status'),
+            'uhf_frame_sync': ('USLAB000101', _FRAME_SYNC, 'Ultra High Frequency Frame Synchronization')
+        },
+
+        # CMG Vibration and Performance (Z1000 series)
+        'cmg_vibration': {
+            'cmg_1_vibration': ('Z1000001', float, 'Control Moment Gyroscope 1 Vibration Level'),
+            'cmg_2_vibration': ('Z1000002', float, 'Control Moment Gyroscope 2 Vibration Level'),
+            'cmg_3_vibration': ('Z1000003', float, 'Control Moment Gyroscope 3 Vibration Level'),
+            'cmg_4_vibration': ('Z1000004', float, 'Control Moment Gyroscope 4 Vibration Level'),
+            'cmg_1_spin_motor_current': ('Z1000005', float, 'Control Moment Gyroscope 1 Spin Motor Current'),
+            'cmg_2_spin_motor_current': ('Z1000006', float, 'Control Moment Gyroscope 2 Spin Motor Current'),
+            'cmg_3_spin_motor_current': ('Z1000007', float, 'Control Moment Gyroscope 3 Spin Motor Current'),
+            'cmg_4_spin_motor_current': ('Z1000008', float, 'Control Moment Gyroscope 4 Spin Motor Current'),
+            'cmg_1_wheel_speed': ('Z1000009', float, 'Control Moment Gyroscope 1 Wheel Speed'),
+            'cmg_2_wheel_speed': ('Z1000010', float, 'Control Moment Gyroscope 2 Wheel Speed'),
+            'cmg_3_wheel_speed': ('Z1000011', float, 'Control Moment Gyroscope 3 Wheel Speed'),
+            'cmg_4_wheel_speed': ('Z1000012', float, 'Control Moment Gyroscope 4 Wheel Speed'),
+            'ku_transmit': ('Z1000013', _KU_TRANSMIT, 'Ku-band Transmit Status'),
+            'ku_sgant_elevation': ('Z1000014', float, 'Ku-band Space-to-Ground Antenna Elevation'),
+            'ku_sgant_cross_elevation': ('Z1000015', float, 'Ku-band Space-to-Ground Antenna Cross Elevation')
+        },
+
+        # Node Systems
+        'node_systems': {
+            'airlock_mdm_status': ('AIRLOCK000058', _POWER_STATUS, 'Airlock Multiplexer/Demultiplexer Status'),
+            'node1_mdm_1_status': ('NODE1000001', _POWER_STATUS, 'Node 1 Multiplexer/Demultiplexer 1 Status'),
+            'node1_mdm_2_status': ('NODE1000002', _POWER_STATUS, 'Node 1 Multiplexer/Demultiplexer 2 Status'),
+            'node2_mdm_2_status': ('NODE2000004', _POWER_STATUS, 'Node 2 Multiplexer/Demultiplexer 2 Status'),
+            'node2_mdm_1_status': ('NODE2000005', _POWER_STATUS, 'Node 2 Multiplexer/Demultiplexer 1 Status'),
+            'node3_hcz_mdm_2_status': ('NODE3000014', _POWER_STATUS, 'Node 3 Health and Status Zone Multiplexer/Demultiplexer 2 Status'),
+            'node3_mdm_2_status': ('NODE3000015', _POWER_STATUS, 'Node 3 Multiplexer/Demultiplexer 2 Status'),
+            'node3_hcz_mdm_1_status': ('NODE3000016', _POWER_STATUS, 'Node 3 Health and Status Zone Multiplexer/Demultiplexer 1 Status'),
+            'node3_mdm_1_status': ('NODE3000020', _POWER_STATUS, 'Node 3 Multiplexer/Demultiplexer 1 Status')
+        },
+
+        # Truss Systems and Solar Arrays
+        'truss_systems': {
+            'p1_mdm_1_status': ('P1000006', _POWER_STATUS, 'P1 Truss Multiplexer/Demultiplexer 1 Status'),
+            'p1_str_mdm_status': ('P1000008', _POWER_STATUS, 'P1 Starboard Truss Multiplexer/Demultiplexer Status'),
+            'p1_mdm_2_status': ('P1000009', _POWER_STATUS, 'P1 Truss Multiplexer/Demultiplexer 2 Status'),
+            'p3_mdm_1_status': ('P3000001', _POWER_STATUS, 'P3 Truss Multiplexer/Demultiplexer 1 Status'),
+            'p3_mdm_2_status': ('P3000002', _POWER_STATUS, 'P3 Truss Multiplexer/Demultiplexer 2 Status'),
+            's0_ecz_mdm_1_status': ('S0000010', _POWER_STATUS, 'S0 External Control Zone Multiplexer/Demultiplexer 1 Status'),
+            's0_mdm_1_status': ('S0000011', _POWER_STATUS, 'S0 Truss Multiplexer/Demultiplexer 1 Status'),
+            's0_ecz_mdm_2_status': ('S0000012', _POWER_STATUS, 'S0 External Control Zone Multiplexer/Demultiplexer 2 Status'),
+            's0_mdm_2_status': ('S0000013', _POWER_STATUS, 'S0 Truss Multiplexer/Demultiplexer 2 Status'),
+            's1_str_mdm_status': ('S1000006', _POWER_STATUS, 'S1 Starboard Truss Multiplexer/Demultiplexer Status'),
+            's1_mdm_1_status': ('S1000007', _POWER_STATUS, 'S1 Truss Multiplexer/Demultiplexer 1 Status'),
+            's1_mdm_2_status': ('S1000008', _POWER_STATUS, 'S1 Truss Multiplexer/Demultiplexer 2 Status'),
+            's3_mdm_1_status': ('S3000001', _POWER_STATUS, 'S3 Truss Multiplexer/Demultiplexer 1 Status'),
+            's3_mdm_2_status': ('S3000002', _POWER_STATUS, 'S3 Truss Multiplexer/Demultiplexer 2 Status')
+        },
+
+        # Solar Array Power Systems
+        'solar_array_power': {
+            'solar_array_2a_mdm_status': ('P4000003', _ARRAY_MDM_STATUS, 'Solar Array 2A Multiplexer/Demultiplexer Status'),
+            'solar_array_4a_mdm_status': ('P4000006', _ARRAY_MDM_STATUS, 'Solar Array 4A Multiplexer/Demultiplexer Status'),
+            'solar_array_4b_mdm_status': ('P6000003', _ARRAY_MDM_STATUS, 'Solar Array 4B Multiplexer/Demultiplexer Status'),
+            'solar_array_2b_mdm_status': ('P6000006', _ARRAY_MDM_STATUS, 'Solar Array 2B Multiplexer/Demultiplexer Status'),
+            'solar_array_1a_mdm_status': ('S4000003', _ARRAY_MDM_STATUS, 'Solar Array 1A Multiplexer/Demultiplexer Status'),
+            'solar_array_3a_mdm_status': ('S4000006', _ARRAY_MDM_STATUS, 'Solar Array 3A Multiplexer/Demultiplexer Status'),
+            'solar_array_3b_mdm_status': ('S6000003', _ARRAY_MDM_STATUS, 'Solar Array 3B Multiplexer/Demultiplexer Status'),
+            'solar_array_1b_mdm_status': ('S6000006', _ARRAY_MDM_STATUS, 'Solar Array 1B Multiplexer/Demultiplexer Status')
+        },
+
+        # Antenna Systems
+        'antennas': {
+            'sband_rfg2_azimuth': ('P1000004', float, 'S-band Radio Frequency Group 2 Azimuth'),
+            'sband_rfg2_elevation': ('P1000005', float, 'S-band Radio Frequency Group 2 Elevation'),
+            'sband_rfg2_status': ('P1000007', _POWER_STATUS, 'S-band Radio Frequency Group 2 Status'),
+            'sband_rfg1_azimuth': ('S1000004', float, 'S-band Radio Frequency Group 1 Azimuth'),
+            'sband_rfg1_elevation': ('S1000005', float, 'S-band Radio Frequency Group 1 Elevation'),
+            'sband_rfg1_status': ('S1000009', _POWER_STATUS, 'S-band Radio Frequency Group 1 Status')
+        },
+
+        # Thermal Control Systems
+        'thermal': {
+            'loop_b_pump_flowrate': ('P1000001', float, 'Thermal Control Loop B Pump Flow Rate'),
+            'loop_b_pm_pressure': ('P1000002', float, 'Thermal Control Loop B Pump Module Pressure'),
+            'loop_b_pm_temp': ('P1000003', float, 'Thermal Control Loop B Pump Module Temperature'),
+            'loop_a_pump_flowrate': ('S1000001', float, 'Thermal Control Loop A Pump Flow Rate'),
+            'loop_a_pm_pressure': ('S1000002', float, 'Thermal Control Loop A Pump Module Pressure'),
+            'loop_a_pm_temp': ('S1000003', float, 'Thermal Control Loop A Pump Module Temperature')
+        },
+
+        # Solar Array Drive Systems
+        'solar_array_drives': {
+            'solar_2a_drive_voltage': ('P4000001', float, 'Solar Array 2A Drive Voltage'),
+            'solar_2a_drive_current': ('P4000002', float, 'Solar Array 2A Drive Current'),
+            'solar_4a_drive_voltage': ('P4000004', float, 'Solar Array 4A Drive Voltage'),
+            'solar_4a_drive_current': ('P4000005', float, 'Solar Array 4A Drive Current'),
+            'solar_2a_bga_position': ('P4000007', float, 'Solar Array 2A Beta Gimbal Assembly Position'),
+            'solar_4a_bga_position': ('P4000008', float, 'Solar Array 4A Beta Gimbal Assembly Position'),
+            'solar_4b_drive_voltage': ('P6000001', float, 'Solar Array 4B Drive Voltage'),
+            'solar_4b_drive_current': ('P6000002', float, 'Solar Array 4B Drive Current'),
+            'solar_2b_drive_voltage': ('P6000004', float, 'Solar Array 2B Drive Voltage'),
+            'solar_2b_drive_current': ('P6000005', float, 'Solar Array 2B Drive Current'),
+            'solar_4b_bga_position': ('P6000007', float, 'Solar Array 4B Beta Gimbal Assembly Position'),
+            'solar_2b_bga_position': ('P6000008', float, 'Solar Array 2B Beta Gimbal Assembly Position'),
+            'solar_1a_drive_voltage': ('S4000001', float, 'Solar Array 1A Drive Voltage'),
+            'solar_1a_drive_current': ('S4000002', float, 'Solar Array 1A Drive Current'),
+            'solar_3a_drive_voltage': ('S4000004', float, 'Solar Array 3A Drive Voltage'),
+            'solar_3a_drive_current': ('S4000005', float, 'Solar Array 3A Drive Current'),
+            'solar_1a_bga_position': ('S4000007', float, 'Solar Array 1A Beta Gimbal Assembly Position'),
+            'solar_3a_bga_position': ('S4000008', float, 'Solar Array 3A Beta Gimbal Assembly Position'),
+            'solar_3b_drive_voltage': ('S6000001', float, 'Solar Array 3B Drive Voltage'),
+            'solar_3b_drive_current': ('S6000002', float, 'Solar Array 3B Drive Current'),
+            'solar_1b_drive_voltage': ('S6000004', float, 'Solar Array 1B Drive Voltage'),
+            'solar_1b_drive_current': ('S6000005', float, 'Solar Array 1B Drive Current'),
+            'solar_3b_bga_position': ('S6000007', float, 'Solar Array 3B Beta Gimbal Assembly Position'),
+            'solar_1b_bga_position': ('S6000008', float, 'Solar Array 1B Beta Gimbal Assembly Position')
+        },
+
+        # Joint Positions
+        'joints': {
+            'starboard_trrj_position': ('S0000001', float, 'Starboard Thermal Radiator Rotary Joint Position'),
+            'port_trrj_position': ('S0000002', float, 'Port Thermal Radiator Rotary Joint Position'),
+            'starboard_sarj_position': ('S0000003', float, 'Starboard Solar Alpha Rotary Joint Position'),
+            'port_sarj_position': ('S0000004', float, 'Port Solar Alpha Rotary Joint Position'),
+            'port_sarj_commanded_position': ('S0000005', float, 'Port Solar Alpha Rotary Joint Commanded Position'),
+            'trrj_loop_b_mode': ('S0000006', str, 'Thermal Radiator Rotary Joint Loop B Mode'),
+            'trrj_loop_a_mode': ('S0000007', str, 'Thermal Radiator Rotary Joint Loop A Mode'),
+            'sarj_port_mode': ('S0000008', str, 'Solar Alpha Rotary Joint Port Mode'),
+            'sarj_starboard_mode': ('S0000009', str, 'Solar Alpha Rotary Joint Starboard Mode')
+        },
+
+        # Node Environmental Systems
+        'node_environment': {
+            'node2_coolant_mt': ('NODE2000001', float, 'Node 2 Coolant Medium Temperature'),
+            'node2_coolant_lt': ('NODE2000002', float, 'Node 2 Coolant Low Temperature'),
+            'node2_ac_state': ('NODE2000003', _AC_STATE, 'Node 2 Air Conditioning State'),
+            'node2_air_cooling_temp': ('NODE2000006', float, 'Node 2 Air Cooling Temperature'),
+            'node2_avionics_temp': ('NODE2000007', float, 'Node 2 Avionics Temperature'),
+            'node3_ppo2': ('NODE3000001', float, 'Node 3 Partial Pressure Oxygen'),
+            'node3_ppn2': ('NODE3000002', float, 'Node 3 Partial Pressure Nitrogen'),
+            'node3_ppco2': ('NODE3000003', float, 'Node 3 Partial Pressure Carbon Dioxide'),
+            'urine_processor_state': ('NODE3000004', _URINE_PROCESSOR_STATE, 'Urine Processor Assembly State'),
+            'urine_tank_qty': ('NODE3000005', float, 'Urine Tank Quantity'),
+            'water_processor_state': ('NODE3000006', _WATER_PROCESSOR_STATE, 'Water Processor Assembly State'),
+            'water_processor_step': ('NODE3000007', _WATER_PROCESSOR_STEP, 'Water Processor Assembly Processing Step'),
+            'waste_water_tank_qty': ('NODE3000008', float, 'Waste Water Tank Quantity'),
+            'clean_water_tank_qty': ('NODE3000009', float, 'Clean Water Tank Quantity'),
+            'oxygen_generator_state': ('NODE3000010', _OXYGEN_GENERATOR_STATE, 'Oxygen Generator Assembly State'),
+            'o2_production_rate': ('NODE3000011', float, 'Oxygen Production Rate'),
+            'node3_avionics_temp': ('NODE3000012', float, 'Node 3 Avionics Temperature'),
+            'node3_air_cooling_temp': ('NODE3000013', float, 'Node 3 Air Cooling Temperature'),
+            'node3_coolant_qty_1': ('NODE3000017', float, 'Node 3 Coolant Quantity 1'),
+            'node3_ac_state': ('NODE3000018', _AC_STATE, 'Node 3 Air Conditioning State'),
+            'node3_coolant_qty_2': ('NODE3000019', float, 'Node 3 Coolant Quantity 2')
+        },
+
+        # Airlock Systems
+        'airlock_systems': {
+            'crewlock_pressure': ('AIRLOCK000049', float, 'Crew Lock Atmospheric Pressure'),
+            'hi_p_o2_valve_position': ('AIRLOCK000050', _VALVE_POSITION, 'High Pressure Oxygen Valve Position'),
+            'lo_p_o2_valve_position': ('AIRLOCK000051', _VALVE_POSITION, 'Low Pressure Oxygen Valve Position'),
+            'n2_supply_valve_position': ('AIRLOCK000052', _VALVE_POSITION, 'Nitrogen Supply Valve Position'),
+            'airlock_ac_state': ('AIRLOCK000053', _AC_STATE, 'Airlock Air Conditioning State'),
+            'airlock_pressure': ('AIRLOCK000054', float, 'Airlock Atmospheric Pressure'),
+            'airlock_hi_p_o2_pressure': ('AIRLOCK000055', float, 'Airlock High Pressure Oxygen Pressure'),
+            'airlock_lo_p_o2_pressure': ('AIRLOCK000056', float, 'Airlock Low Pressure Oxygen Pressure'),
+            'airlock_n2_pressure': ('AIRLOCK000057', float, 'Airlock Nitrogen Pressure')
+        },
+
+        # Airlock Power Systems (EMU and BCA)
+        'airlock_power': {
+            'emu_1_voltage': ('AIRLOCK000001', float, 'Extravehicular Mobility Unit 1 Voltage'),
+            'emu_1_current': ('AIRLOCK000002', float, 'Extravehicular Mobility Unit 1 Current'),
+            'emu_2_voltage': ('AIRLOCK000003', float, 'Extravehicular Mobility Unit 2 Voltage'),
+            'emu_2_current': ('AIRLOCK000004', float, 'Extravehicular Mobility Unit 2 Current'),
+            'iru_voltage': ('AIRLOCK000005', float, 'Interface Relay Unit Voltage'),
+            'iru_current': ('AIRLOCK000006', float, 'Interface Relay Unit Current'),
+            'eva_emu_1_voltage': ('AIRLOCK000007', float, 'EVA Extravehicular Mobility Unit 1 Voltage'),
+            'eva_emu_1_current': ('AIRLOCK000008', float, 'EVA Extravehicular Mobility Unit 1 Current'),
+            'eva_emu_2_voltage': ('AIRLOCK000009', float, 'EVA Extravehicular Mobility Unit 2 Voltage'),
+            'eva_emu_2_current': ('AIRLOCK000010', float, 'EVA Extravehicular Mobility Unit 2 Current'),
+            'bca_1_voltage': ('AIRLOCK000011', float, 'Battery Charger Assembly 1 Voltage'),
+            'bca_1_current': ('AIRLOCK000012', float, 'Battery Charger Assembly 1 Current'),
+            'bca_2_voltage': ('AIRLOCK000013', float, 'Battery Charger Assembly 2 Voltage'),
+            'bca_2_current': ('AIRLOCK000014', float, 'Battery Charger Assembly 2 Current'),
+            'bca_3_voltage': ('AIRLOCK000015', float, 'Battery Charger Assembly 3 Voltage'),
+            'bca_3_current': ('AIRLOCK000016', float, 'Battery Charger Assembly 3 Current'),
+            'bca_4_voltage': ('AIRLOCK000017', float, 'Battery Charger Assembly 4 Voltage'),
+            'bca_4_current': ('AIRLOCK000018', float, 'Battery Charger Assembly 4 Current'),
+            'bca_1_status': ('AIRLOCK000019', _BCA_STATUS, 'Battery Charger Assembly 1 Status'),
+            'bca_2_status': ('AIRLOCK000020', _BCA_STATUS, 'Battery Charger Assembly 2 Status'),
+            'bca_3_status': ('AIRLOCK000021', _BCA_STATUS, 'Battery Charger Assembly 3 Status'),
+            'bca_4_status': ('AIRLOCK000022', _BCA_STATUS, 'Battery Charger Assembly 4 Status')
+        },
+
+        # Battery Charger Channel Status (abbreviated - there are many more)
+        'battery_chargers': {
+            'bca_1_ch1_status': ('AIRLOCK000023', _BCA_CHANNEL_STATUS, 'Battery Charger Assembly 1 Channel 1 Status'),
+            'bca_1_ch2_status': ('AIRLOCK000024', _BCA_CHANNEL_STATUS, 'Battery Charger Assembly 1 Channel 2 Status'),
+            'bca_1_ch3_status': ('AIRLOCK000025', _BCA_CHANNEL_STATUS, 'Battery Charger Assembly 1 Channel 3 Status'),
+            'bca_1_ch4_status': ('AIRLOCK000026', _BCA_CHANNEL_STATUS, 'Battery Charger Assembly 1 Channel 4 Status'),
+            'bca_1_ch5_status': ('AIRLOCK000027', _BCA_CHANNEL_STATUS, 'Battery Charger Assembly 1 Channel 5 Status'),
+            'bca_1_ch6_status': ('AIRLOCK000028', _BCA_CHANNEL_STATUS, 'Battery Charger Assembly 1 Channel 6 Status'),
+            'depressurization_pump_voltage': ('AIRLOCK000047', float, 'Depressurization Pump Voltage'),
+            'depressurization_pump_switch': ('AIRLOCK000048', _PUMP_SWITCH, 'Depressurization Pump Switch Position')
+        },
+
+        # Mobile Servicing System (MSS)
+        'ssrms': {
+            'mss_mt_position': ('CSAMT000001', float, 'Mobile Servicing System Mobile Transporter Position'),
+            'ssrms_base_location': ('CSASSRMS002', _BASE_LOCATION, 'Space Station Remote Manipulator System Base Location'),
+            'ssrms_operating_base': ('CSASSRMS003', _OPERATING_BASE, 'Space Station Remote Manipulator System Operating Base'),
+            'ssrms_sr_joint': ('CSASSRMS004', float, 'SSRMS Shoulder Roll Joint Position'),
+            'ssrms_sy_joint': ('CSASSRMS005', float, 'SSRMS Shoulder Yaw Joint Position'),
+            'ssrms_sp_joint': ('CSASSRMS006', float, 'SSRMS Shoulder Pitch Joint Position'),
+            'ssrms_ep_joint': ('CSASSRMS007', float, 'SSRMS Elbow Pitch Joint Position'),
+            'ssrms_wp_joint': ('CSASSRMS008', float, 'SSRMS Wrist Pitch Joint Position'),
+            'ssrms_wy_joint': ('CSASSRMS009', float, 'SSRMS Wrist Yaw Joint Position'),
+            'ssrms_wr_joint': ('CSASSRMS010', float, 'SSRMS Wrist Roll Joint Position'),
+            'ssrms_tip_lee_status': ('CSASSRMS011', _LATCH_STATUS, 'SSRMS Tip Latching End Effector Status')
+        },
+
+        # SPDM (Special Purpose Dexterous Manipulator)
+        'spdm': {
+            'spdm_base_location': ('CSASPDM0002', _BASE_LOCATION, 'Special Purpose Dexterous Manipulator Base Location'),
+            'spdm_1_sr_joint': ('CSASPDM0003', float, 'SPDM Arm 1 Shoulder Roll Joint Position'),
+            'spdm_1_sy_joint': ('CSASPDM0004', float, 'SPDM Arm 1 Shoulder Yaw Joint Position'),
+            'spdm_1_sp_joint': ('CSASPDM0005', float, 'SPDM Arm 1 Shoulder Pitch Joint Position'),
+            'spdm_1_ep_joint': ('CSASPDM0006', float, 'SPDM Arm 1 Elbow Pitch Joint Position'),
+            'spdm_1_wp_joint': ('CSASPDM0007', float, 'SPDM Arm 1 Wrist Pitch Joint Position'),
+            'spdm_1_wy_joint': ('CSASPDM0008', float, 'SPDM Arm 1 Wrist Yaw Joint Position'),
+            'spdm_1_wr_joint': ('CSASPDM0009', float, 'SPDM Arm 1 Wrist Roll Joint Position'),
+            'spdm_1_otcm_status': ('CSASPDM0010', _LATCH_STATUS, 'SPDM Arm 1 Orbital Tool Change Mechanism Status'),
+            'spdm_2_sr_joint': ('CSASPDM0011', float, 'SPDM Arm 2 Shoulder Roll Joint Position'),
+            'spdm_2_sy_joint': ('CSASPDM0012', float, 'SPDM Arm 2 Shoulder Yaw Joint Position'),
+            'spdm_2_sp_joint': ('CSASPDM0013', float, 'SPDM Arm 2 Shoulder Pitch Joint Position'),
+            'spdm_2_ep_joint': ('CSASPDM0014', float, 'SPDM Arm 2 Elbow Pitch Joint Position'),
+            'spdm_2_wp_joint': ('CSASPDM0015', float, 'SPDM Arm 2 Wrist Pitch Joint Position'),
+            'spdm_2_wy_joint': ('CSASPDM0016', float, 'SPDM Arm 2 Wrist Yaw Joint Position'),
+            'spdm_2_wr_joint': ('CSASPDM0017', float, 'SPDM Arm 2 Wrist Roll Joint Position'),
+            'spdm_2_otcm_status': ('CSASPDM0019', _LATCH_STATUS, 'SPDM Arm 2 Orbital Tool Change Mechanism Status'),
+            'spdm_body_roll_joint': ('CSASPDM0020', float, 'SPDM Body Roll Joint Position'),
+            'spdm_body_status': ('CSASPDM0022', _LATCH_STATUS, 'SPDM Body Status')
+        },
+
+        # MBS (Mobile Base System)
+        'mbs': {
+            'mbs_mcas_status': ('CSAMBS00002', _MCAS_STATUS, 'Mobile Base System Mobile Cart Assembly Status'),
+            'mbs_poa_status': ('CSAMBA00004', _LATCH_STATUS, 'Mobile Base System Payload Orbital Adapter Status')
+        },
+
+        # Russian Segment
+        'russian_segment': {
+            'russian_station_mode': ('RUSSEG000001', str, 'Russian Segment Station Mode'),
+            'kurs_equipment_1': ('RUSSEG000002', str, 'Kurs Rendezvous Equipment 1 Status'),
+            'kurs_equipment_2': ('RUSSEG000003', str, 'Kurs Rendezvous Equipment 2 Status'),
+            'kurs_p1_p2_failure': ('RUSSEG000004', bool, 'Kurs P1/P2 Channel Failure Status'),
+            'kurs_range': ('RUSSEG000005', float, 'Kurs Target Range (meters)'),
+            'kurs_range_rate': ('RUSSEG000006', float, 'Kurs Target Range Rate (m/s)'),
+            'kurs_test_mode': ('RUSSEG000007', bool, 'Kurs Test Mode Status'),
+            'kurs_capture_signal': ('RUSSEG000008', bool, 'Kurs Capture Signal Status'),
+            'kurs_target_acquisition': ('RUSSEG000009', bool, 'Kurs Target Acquisition Status'),
+            'kurs_functional_mode': ('RUSSEG000010', bool, 'Kurs Functional Mode Status'),
+            'kurs_standby_mode': ('RUSSEG000011', bool, 'Kurs Standby Mode Status'),
+            'sm_docking_flag': ('RUSSEG000012', bool, 'Service Module Docking Flag'),
+            'sm_forward_dock_engaged': ('RUSSEG000013', bool, 'Service Module Forward Docking Port Engaged'),
+            'sm_aft_dock_engaged': ('RUSSEG000014', bool, 'Service Module Aft Docking Port Engaged'),
+            'sm_nadir_dock_engaged': ('RUSSEG000015', bool, 'Service Module Nadir Docking Port Engaged'),
+            'fgb_nadir_dock_engaged': ('RUSSEG000016', bool, 'Functional Cargo Block Nadir Docking Port Engaged'),
+            'sm_nadir_udm_dock_engaged': ('RUSSEG000017', bool, 'Service Module Nadir Universal Docking Module Port Engaged'),
+            'mrm1_dock_engaged': ('RUSSEG000018', bool, 'Mini Research Module 1 Docking Port Engaged'),
+            'mrm2_dock_engaged': ('RUSSEG000019', bool, 'Mini Research Module 2 Docking Port Engaged'),
+            'sm_hooks_closed': ('RUSSEG000020', bool, 'Service Module Docking Hooks Closed'),
+            'russian_attitude_mode': ('RUSSEG000021', str, 'Russian Segment Attitude Control Mode'),
+            'russian_motion_control': ('RUSSEG000022', str, 'Russian Segment Motion Control Mode'),
+            'russian_free_drift_prep': ('RUSSEG000023', bool, 'Russian Segment Free Drift Preparation'),
+            'russian_thruster_terminated': ('RUSSEG000024', bool, 'Russian Segment Thruster Terminated Status'),
+            'russian_dynamic_mode': ('RUSSEG000025', bool, 'Russian Segment Dynamic Mode Status')
+        },
+
+        # Time Systems
+        'time': {
+            'gmt_time': ('TIME_000001', str, 'Greenwich Mean Time'),
+            'year': ('TIME_000002', int, 'Current Year')
         }
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def cmg_1_spin_motor_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 1 Spin Motor Temperature"""
-        val = self._get_value("cmg_1_spin_motor_temp")
-        return None if val is None else float(val)
+    }
+
+    # node name -> (Lightstreamer item, declared value type or StatusMap, description)
+    _iss_node_catalog = {name: row for nodes in _iss_node_sections.values() for name, row in nodes.items()}
+
+    _iss_telemetry_nodes = {name: item for name, (item, _, _) in _iss_node_catalog.items()}
+
+    # every node gets a fixed slot, in catalog order
+    node_names = tuple(_iss_node_catalog)
+    _iss_node_slots = {name: slot for slot, name in enumerate(_iss_node_catalog)}
+    _iss_slot_items = tuple(item for item, _, _ in _iss_node_catalog.values())
+    _iss_slot_kinds = tuple(kind for _, kind, _ in _iss_node_catalog.values())
+    _iss_slot_sections = tuple(section for section, nodes in _iss_node_sections.items() for _ in nodes)
+    # status slots turn their code into the label properties return
+    _iss_slot_labels = tuple(kind.get if isinstance(kind, StatusMap) else None for kind in _iss_slot_kinds)
+    _iss_item_routes = {item: (slot, _DECODERS.get(kind, _to_int))
+                        for slot, (item, kind, _) in enumerate(_iss_node_catalog.values())}
+
+    # group name -> node names, one group per catalog section plus these
+    # subsystem groups spanning several sections
+    _iss_umbrella_groups = {
+        'cmg': ('cmg_control', 'cmg_temperatures', 'cmg_vibration'),
+        'gnc': ('cmg_control', 'attitude_quaternions', 'state_vector'),
+        'eclss': ('lab_environment', 'node_environment'),
+        'mdm': ('mdm_status', 'node_systems', 'truss_systems', 'solar_array_power'),
+        'solar_arrays': ('solar_array_power', 'solar_array_drives', 'joints'),
+        'comms': ('communications', 'antennas'),
+        'airlock': ('airlock_systems', 'airlock_power', 'battery_chargers'),
+        'mss': ('ssrms', 'spdm', 'mbs')
+    }
+    node_groups = _node_groups(_iss_node_sections, _iss_umbrella_groups)
+
+    def __init__(self, store: str = "array", shared_client: bool = False, transport=None):
+        """store is "array" (typed slot arrays) or "dict" (the old item dict).
+
+        With shared_client=True every ISS object in the process that asks for
+        it subscribes over one LightstreamerClient, connected while any of
+        them is.
+
+        transport(server, adapter_set) makes the client connect() uses,
+        LightstreamerClient by default. SyntheticFeed stands in for it offline.
+        """
+        if store not in _STORES:
+            raise ValueError(f"unknown store {store!r}, expected one of {sorted(_STORES)}")
+        self._store = _STORES[store](self._iss_slot_items, self._iss_slot_kinds)
+        self._client = None
+        self._shared_client = shared_client
+        # None is the real LightstreamerClient, looked up when connecting
+        self._transport = transport
+        self._stats = None
+        self._streaming = threading.Event()
+        self._status = ISSStatusUpdater(self._streaming)
+        # slot -> tuple of on_change callbacks, replaced whole so the
+        # listener thread never sees a list being edited
+        self._callbacks = [()] * len(self.node_names)
+        # slot -> Deadband filtering what on_change callbacks and sinks see
+        self._deadbands = [None] * len(self.node_names)
+        self._listener = ISSNodeUpdateListener(
+            self._store, self._iss_item_routes, self._callbacks, self._deadbands)
+        self._connect_started = None
+        # shard name -> (slots, Subscription)
+        self._shards = {}
+        # every node reads normally until connect() narrows the subscription
+        self._subscribed = bytearray(b"\x01") * len(self.node_names)
+
+    @classmethod
+    def _select(cls, nodes=None, groups=None):
+        """sorted slots for the named nodes and groups, every slot when both are None"""
+        if nodes is None and groups is None:
+            return list(range(len(cls.node_names)))
+        if isinstance(nodes, str):
+            nodes = [nodes]
+        if isinstance(groups, str):
+            groups = [groups]
+        names = list(nodes or ())
+        for group in groups or ():
+            if group not in cls.node_groups:
+                raise ValueError(f"unknown group {group!r}, expected one of {sorted(cls.node_groups)}")
+            names.extend(cls.node_groups[group])
+        unknown = [name for name in names if name not in cls._iss_node_slots]
+        if unknown:
+            raise ValueError(f"unknown node names: {unknown}")
+        return sorted({cls._iss_node_slots[name] for name in names})
+
+    @classmethod
+    def _select_names(cls, names_or_groups):
+        """slots for a mix of node and group names"""
+        if isinstance(names_or_groups, str):
+            names_or_groups = [names_or_groups]
+        unknown = [name for name in names_or_groups
+                   if name not in cls._iss_node_slots and name not in cls.node_groups]
+        if unknown:
+            raise ValueError(f"unknown node or group names: {unknown}")
+        return cls._select([name for name in names_or_groups if name in cls._iss_node_slots],
+                           [name for name in names_or_groups if name in cls.node_groups])
 
-    @property
-    def cmg_2_spin_motor_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 2 Spin Motor Temperature"""
-        val = self._get_value("cmg_2_spin_motor_temp")
-        return None if val is None else float(val)
 
-    @property
-    def cmg_3_spin_motor_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 3 Spin Motor Temperature"""
-        val = self._get_value("cmg_3_spin_motor_temp")
-        return None if val is None else float(val)
+    def _decode_status(self, value, mapping):
+        """decode the index to the map"""
+        if value is None:
+            return None
+        return mapping.get(value)
+        
+    
+     
+    def connect(self, nodes=None, groups=None, max_frequency=None, frequencies=None,
+                wait: bool = False, timeout: Optional[float] = None):
+        """subscribe to the named nodes and groups (see node_groups), or to everything.
+
+        Every catalog section gets its own Lightstreamer subscription (a shard)
+        so it can be throttled on its own. frequencies maps section or group
+        names to the max updates/sec per item ("unlimited" for no limit),
+        max_frequency applies to every other shard. None leaves it to the server.
+
+        With wait=True this returns once the client is streaming and raises
+        TimeoutError if that takes longer than timeout seconds.
+        """
+        slots = self._select(nodes, groups)
+        self._connect_started = monotonic()
+        self._listener.expect(slots)
+        rates = {}
+        for group, rate in (frequencies or {}).items():
+            for slot in self._select(groups=[group]):
+                rates[self._iss_slot_sections[slot]] = rate
+
+        self.disconnect()
+        self._subscribed = bytearray(len(self.node_names))
+        if self._transport is None:
+            self._transport = _lightstreamer().LightstreamerClient
+        self._client, fresh = _acquire_client(
+            self._transport, self.server, self.adapter_set, self._shared_client)
+        self._client.addListener(self._status)
+
+        if fresh:
+            self._client.connect()
+        else:
+            # joined a client that is already up, it won't repeat its status
+            self._status.onStatusChange(self._client.getStatus())
+        for section in self._iss_node_sections:
+            section_slots = [slot for slot in slots if self._iss_slot_sections[slot] == section]
+            if section_slots:
+                self._open_shard(section, section_slots, rates.get(section, max_frequency))
+        if wait and not self._streaming.wait(timeout):
+            raise TimeoutError(f"not streaming after {timeout} seconds")
+
+    def disconnect(self):
+        """drop this object's subscriptions and its hold on the client"""
+        if self._client is None:
+            return
+        for _, sub in self._shards.values():
+            self._client.unsubscribe(sub)
+        self._shards = {}
+        self._client.removeListener(self._status)
+        _release_client(
+            self._client, self._transport, self.server, self.adapter_set, self._shared_client)
+        self._client = None
+        self._status.onStatusChange("DISCONNECTED")
 
     @property
-    def cmg_4_spin_motor_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 4 Spin Motor Temperature"""
-        val = self._get_value("cmg_4_spin_motor_temp")
-        return None if val is None else float(val)
+    def is_connected(self) -> bool:
+        """True while this object's client is streaming"""
+        return self._streaming.is_set()
 
     @property
-    def cmg_1_hall_resolver_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 1 Hall Resolver Temperature"""
-        val = self._get_value("cmg_1_hall_resolver_temp")
-        return None if val is None else float(val)
+    def connection_status(self) -> str:
+        """the last Lightstreamer status this object saw, e.g. "CONNECTED:WS-STREAMING" """
+        return self._status.status
 
-    @property
-    def cmg_2_hall_resolver_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 2 Hall Resolver Temperature"""
-        val = self._get_value("cmg_2_hall_resolver_temp")
-        return None if val is None else float(val)
+    def add_status_listener(self, listener):
+        """listener.onStatusChange(status) for this object's connection, kept across reconnects"""
+        self._status.listeners += (listener,)
+        return listener
 
-    @property
-    def cmg_3_hall_resolver_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 3 Hall Resolver Temperature"""
-        val = self._get_value("cmg_3_hall_resolver_temp")
-        return None if val is None else float(val)
+    def remove_status_listener(self, listener):
+        self._status.listeners = tuple(other for other in self._status.listeners if other is not listener)
 
-    @property
-    def cmg_4_hall_resolver_temp(self) -> Optional[float]:
-        """Control Moment Gyroscope 4 Hall Resolver Temperature"""
-        val = self._get_value("cmg_4_hall_resolver_temp")
-        return None if val is None else float(val)
+    def wait_for_initial_snapshot(self, nodes=None, groups=None,
+                                  timeout: Optional[float] = None) -> ISSSnapshot:
+        """block until every requested node (default: every subscribed one) has a value.
 
-    @property
-    def lab_ppo2(self) -> Optional[float]:
-        """Lab Partial Pressure Oxygen"""
-        val = self._get_value("lab_ppo2")
-        return None if val is None else float(val)
+        Returns a snapshot taken at that point, raises TimeoutError after timeout seconds.
+        """
+        if nodes is None and groups is None:
+            slots = [slot for slot, wanted in enumerate(self._subscribed) if wanted]
+        else:
+            slots = self._select(nodes, groups)
+        stamps = self._store.stamps
+        with self._listener.first_values:
+            if not self._listener.first_values.wait_for(
+                    lambda: all(stamps[slot] != _NEVER for slot in slots), timeout):
+                missing = [self.node_names[slot] for slot in slots if stamps[slot] == _NEVER]
+                raise TimeoutError(f"no value after {timeout} seconds for {missing}")
+        return self.snapshot()
+
+    @property
+    def time_to_complete_state(self) -> Optional[float]:
+        """seconds from connect() until every subscribed node had a value, None until then"""
+        complete_at = self._listener.complete_at
+        if complete_at is None or self._connect_started is None:
+            return None
+        return complete_at - self._connect_started
 
-    @property
-    def lab_ppn2(self) -> Optional[float]:
-        """Lab Partial Pressure Nitrogen"""
-        val = self._get_value("lab_ppn2")
-        return None if val is None else float(val)
+    def _open_shard(self, name, slots, max_frequency):
+        #sub = Subscription("MERGE",["item1","item2","item3"],["stock_name","last_price"])
 
-    @property
-    def lab_ppco2(self) -> Optional[float]:
-        """Lab Partial Pressure Carbon Dioxide"""
-        val = self._get_value("lab_ppco2")
-        return None if val is None else float(val)
+        # stand-in clients bring their own subscription type
+        subscription = getattr(self._client, "Subscription", None) or _lightstreamer().Subscription
+        sub = subscription(
+            mode="MERGE",
+            items=[self._iss_slot_items[slot] for slot in slots],
+            fields=['Value'])
+        if max_frequency is not None:
+            sub.setRequestedMaxFrequency(str(max_frequency))
+        sub.addListener(self._listener)
 
-    @property
-    def lab_coolant_lt(self) -> Optional[float]:
-        """Lab Coolant Loop Temperature (Low)"""
-        val = self._get_value("lab_coolant_lt")
-        return None if val is None else float(val)
+        self._shards[name] = (slots, sub)
+        for slot in slots:
+            self._subscribed[slot] = 1
+        self._client.subscribe(sub)
 
-    @property
-    def lab_coolant_mt(self) -> Optional[float]:
-        """Lab Coolant Loop Temperature (Medium)"""
-        val = self._get_value("lab_coolant_mt")
-        return None if val is None else float(val)
+    def add_shard(self, name: str, nodes=None, groups=None, max_frequency=None):
+        """subscribe to more nodes on the live connection, as one independently throttled shard"""
+        if self._client is None:
+            raise RuntimeError("connect() before adding shards")
+        if name in self._shards:
+            raise ValueError(f"shard {name!r} already exists")
+        if nodes is None and groups is None:
+            raise ValueError("add_shard needs nodes or groups")
+        slots = self._select(nodes, groups)
+        taken = [self.node_names[slot] for slot in slots if self._subscribed[slot]]
+        if taken:
+            raise ValueError(f"already subscribed in another shard: {taken}")
+        self._open_shard(name, slots, max_frequency)
+
+    def remove_shard(self, name: str):
+        """unsubscribe a shard, its nodes then raise NodeNotSubscribedError"""
+        slots, sub = self._shards.pop(name)
+        self._client.unsubscribe(sub)
+        for slot in slots:
+            self._subscribed[slot] = 0
+
+    def set_shard_frequency(self, name: str, max_frequency):
+        """change a live shard's max updates/sec per item ("unlimited" for no limit)"""
+        self._shards[name][1].setRequestedMaxFrequency(str(max_frequency))
+
+    @property
+    def shards(self) -> Dict[str, List[str]]:
+        """shard name -> the node names it subscribes to"""
+        return {name: [self.node_names[slot] for slot in slots]
+                for name, (slots, _) in self._shards.items()}
+
+    def on_change(self, names_or_groups, callback, deadband=None, relative=None, hysteresis=0.0):
+        """call callback(name, value) on the Lightstreamer thread whenever one of these nodes changes.
+
+        Takes node names, group names or a mix. Updates that repeat the
+        current value are not dispatched. deadband, relative and hysteresis
+        (see set_deadband()) give this callback a band of its own on each of
+        these nodes, other callbacks and sinks are not affected. Registering
+        the same callback again replaces its band. Returns callback for
+        remove_on_change().
+        """
+        slots = self._select_names(names_or_groups)
+        banded = deadband is not None or relative is not None
+        if banded:
+            self._check_deadband_slots(slots)
+        bands = self._listener.callback_deadbands
+        for slot in slots:
+            if callback not in self._callbacks[slot]:
+                self._callbacks[slot] = self._callbacks[slot] + (callback,)
+            own = {other: band for other, band in (bands[slot] or {}).items() if other != callback}
+            if banded:
+                own[callback] = Deadband(deadband or 0.0, relative or 0.0, hysteresis)
+            bands[slot] = own or None
+        return callback
+
+    def _check_deadband_slots(self, slots):
+        wrong = [self.node_names[slot] for slot in slots if self._iss_slot_kinds[slot] not in (float, int)]
+        if wrong:
+            raise ValueError(f"deadbands need numeric nodes: {wrong}")
+
+    def set_deadband(self, names_or_groups, absolute=None, relative=None, hysteresis=0.0):
+        """only report changes bigger than absolute (node units) or relative (fraction of the value).
+
+        The band belongs to the node: applied on the ingest thread, so
+        suppressed updates reach no callback and no sink (coalesce(),
+        AsyncISS, ...). hysteresis widens the band for moves that reverse
+        direction. Pass neither absolute nor relative to clear. Only float
+        and int nodes can have a deadband.
+        """
+        slots = self._select_names(names_or_groups)
+        if absolute is None and relative is None:
+            for slot in slots:
+                self._deadbands[slot] = None
+            return
+        self._check_deadband_slots(slots)
+        for slot in slots:
+            self._deadbands[slot] = Deadband(absolute or 0.0, relative or 0.0, hysteresis)
+
+    def add_sink(self, sink):
+        """feed sink.on_update(slot, value, stamp) every update that passes the deadbands"""
+        self._listener.sinks = self._listener.sinks + (sink,)
+        return sink
+
+    def remove_sink(self, sink):
+        self._listener.sinks = tuple(other for other in self._listener.sinks if other is not sink)
+
+    def coalesce(self, callback, window: float = 0.1, max_count: Optional[int] = None,
+                 names_or_groups=None) -> CoalescingDispatcher:
+        """deliver changes in batches: callback(UpdateBatch) at most once per window.
+
+        Stop it with iss.remove_sink(dispatcher) and dispatcher.close().
+        """
+        return self.add_sink(CoalescingDispatcher(callback, window, max_count, names_or_groups))
+
+    def enable_stats(self, window: int = 10) -> ISSStats:
+        """start counting, see stats(). window is the rolling rate's length in seconds"""
+        if self._stats is None:
+            self._stats = ISSStats(window)
+            self._listener.taps = self._listener.taps + (self._stats,)
+            self._listener.callback_timer = self._stats
+        return self._stats
+
+    def disable_stats(self):
+        """stop counting and put the plain hot path back"""
+        if self._stats is not None:
+            self._listener.taps = tuple(tap for tap in self._listener.taps if tap is not self._stats)
+            self._listener.callback_timer = None
+            self._stats = None
+
+    def stats(self) -> dict:
+        """how busy this object is, as a plain dict.
+
+        Connection status, reconnects, seconds per status and the pending
+        updates of every queued sink are always there. Update counts per node,
+        per catalog section and per group, the rolling rate, the callback
+        latency histogram (keys are upper bounds in microseconds) with its sum,
+        and time per callback (keyed "qualname#id") need enable_stats() first
+        and are None until then. Every node is in exactly one section, so the
+        section counts add up to the total. Umbrella groups such as "cmg" share
+        nodes with their sections, so the group counts don't.
+        """
+        status = self._status
+        durations = dict(status.durations)
+        durations[status.status] = durations.get(status.status, 0.0) + monotonic() - status.since
+        queues = {f"{type(sink).__name__}#{index}": sink.pending
+                  for index, sink in enumerate(self._listener.sinks + self._listener.taps)
+                  if hasattr(sink, "pending")}
+        result = {
+            "status": status.status,
+            "reconnects": max(0, status.streams - 1),
+            "status_seconds": durations,
+            "queues": queues,
+            "updates": None,
+            "updates_per_node": None,
+            "updates_per_section": None,
+            "updates_per_group": None,
+            "rate_per_s": None,
+            "callback_latency_us": None,
+            "callback_latency_sum_us": None,
+            "callbacks": None,
+        }
+        stats = self._stats
+        if stats is None:
+            return result
+        counts = stats.counts
+        result["updates"] = sum(counts)
+        result["updates_per_node"] = {name: counts[slot] for slot, name in enumerate(self.node_names)
+                                      if counts[slot]}
+        sections = dict.fromkeys(self._iss_node_sections, 0)
+        for slot, section in enumerate(self._iss_slot_sections):
+            sections[section] += counts[slot]
+        result["updates_per_section"] = sections
+        result["updates_per_group"] = {group: sum(counts[self._iss_node_slots[name]] for name in names)
+                                       for group, names in self.node_groups.items()}
+        result["rate_per_s"] = stats.rate()
+        result["callback_latency_us"] = {1 << bucket: count for bucket, count in enumerate(stats.latency)
+                                         if count}
+        result["callback_latency_sum_us"] = stats.latency_sum
+        # qualified name plus the callback's id, two instances' methods or two
+        # lambdas are different subscribers
+        result["callbacks"] = {
+            f"{getattr(callback, '__qualname__', type(callback).__qualname__)}#{id(callback):x}": {
+                "calls": calls, "seconds": spent, "max_seconds": slowest}
+            for callback, (calls, spent, slowest) in list(stats.callback_times.items())}
+        return result
+
+    def serve_metrics(self, port: int = 9108, host: str = "127.0.0.1") -> MetricsExporter:
+        """serve Prometheus metrics for every node and the wrapper itself on http://host:port/metrics.
+
+        Stop it with close() on the result. Port 0 picks a free port, see
+        MetricsExporter.address.
+        """
+        return MetricsExporter(self, host, port)
+
+    def record(self, directory: str, segment_bytes: int = 256 << 20,
+               segment_seconds: Optional[float] = 3600.0, flush_interval: float = 0.5) -> NodeRecorder:
+        """archive every update to binary segment files in directory, see NodeRecorder.
+
+        Records everything ingested, deadbands don't apply. Read the files
+        back with read_recording(). Stop with stop_recording().
+        """
+        recorder = NodeRecorder(directory, segment_bytes, segment_seconds, flush_interval)
+        self._listener.taps = self._listener.taps + (recorder,)
+        return recorder
+
+    def replay(self, paths, speed: Optional[float] = 1.0) -> ISSReplay:
+        """drive this object from recorder segments instead of the live feed, see ISSReplay.
+
+        Call start() on the result to play it in the background or run() to
+        play it on this thread.
+        """
+        return ISSReplay(self, paths, speed)
+
+    def stop_recording(self, recorder: NodeRecorder):
+        """detach the recorder and close it once everything queued is on disk"""
+        self._listener.taps = tuple(other for other in self._listener.taps if other is not recorder)
+        recorder.close()
+
+    def broadcast(self, address, policy: str = "coalesce", max_buffer: int = 1 << 20,
+                  flush_interval: float = 0.02) -> ISSBroadcaster:
+        """re-publish this object's updates to other local processes, see ISSBroadcaster.
+
+        address is a (host, port) tuple or a Unix socket path. Other processes
+        read it with ISS(transport=functools.partial(BroadcastFeed, address=address)).
+        Stop with stop_broadcast().
+        """
+        broadcaster = ISSBroadcaster(self, address, policy, max_buffer, flush_interval)
+        self._listener.taps = self._listener.taps + (broadcaster,)
+        self.add_status_listener(broadcaster)
+        return broadcaster
+
+    def stop_broadcast(self, broadcaster: ISSBroadcaster):
+        """detach the broadcaster and disconnect its clients"""
+        self._listener.taps = tuple(other for other in self._listener.taps if other is not broadcaster)
+        self.remove_status_listener(broadcaster)
+        broadcaster.close()
+
+    def share(self, name: Optional[str] = None) -> "SharedStatePublisher":
+        """mirror every node into shared memory for other processes, see SharedStatePublisher.
+
+        Readers attach with SharedISS(publisher.name). Stop with stop_sharing().
+        """
+        publisher = SharedStatePublisher(self, name)
+        self._listener.taps = self._listener.taps + (publisher,)
+        publisher.fill()
+        return publisher
+
+    def stop_sharing(self, publisher: "SharedStatePublisher"):
+        """detach the publisher and remove its shared memory block"""
+        self._listener.taps = tuple(other for other in self._listener.taps if other is not publisher)
+        publisher.close()
+
+    def remove_on_change(self, callback, names_or_groups=None):
+        """stop calling callback, for the given nodes or everywhere"""
+        if names_or_groups is None:
+            slots = range(len(self.node_names))
+        else:
+            slots = self._select_names(names_or_groups)
+        bands = self._listener.callback_deadbands
+        for slot in slots:
+            if callback in self._callbacks[slot]:
+                self._callbacks[slot] = tuple(other for other in self._callbacks[slot] if other != callback)
+            if bands[slot] is not None and callback in bands[slot]:
+                bands[slot] = {other: band for other, band in bands[slot].items() if other != callback} or None
 
-    @property
-    def cabin_temperature(self) -> Optional[float]:
-        """Cabin Temperature"""
-        val = self._get_value("cabin_temperature")
-        return None if val is None else float(val)
+    def _get_value(self, name: str):
+        slot = self._iss_node_slots.get(name)
+        if slot is not None:
+            if not self._subscribed[slot]:
+                raise NodeNotSubscribedError(name)
+            return self._store.get(slot)
+        else:
+            print("Node name not found")
+            return None
 
-    @property
-    def lab_avionics_temp(self) -> Optional[float]:
-        """Lab Avionics Temperature"""
-        val = self._get_value("lab_avionics_temp")
-        return None if val is None else float(val)
+    def snapshot(self) -> ISSSnapshot:
+        """every node as of one consistent point, safe while updates stream in"""
+        return ISSSnapshot(self._store.snapshot(), bytes(self._subscribed))
+
+    @property
+    def seq(self) -> int:
+        """sequence number of the latest update, every update adds one"""
+        return self._store.seq
+
+    def changes_since(self, seq: int = 0):
+        """(name -> value of every node updated after seq, the current seq).
+
+        Pass the returned seq to the next call to get only what changed in
+        between, or 0 for every node with a value. Values read like the
+        properties and come from one consistent point. Nodes that aren't
+        subscribed (any more, see remove_shard()) are left out. The cost
+        follows the number of updates since seq, up to a scan of the catalog
+        when more than _CHANGE_LOG have happened.
+        """
+        subscribed = self._subscribed
+
+        def read(store):
+            return store.seq, [(slot, store.get(slot)) for slot in store.changed_since(seq)
+                               if subscribed[slot]]
+        current, changed = self._store.consistent(read)
+        names = self.node_names
+        return {names[slot]: _label(slot, value) for slot, value in changed}, current
+
+    def age(self, name: str) -> Optional[float]:
+        """seconds since the node last updated, None if it never has"""
+        stamp = self._store.stamps[self._iss_node_slots[name]]
+        return None if stamp == _NEVER else monotonic() - stamp
+
+    def stale(self, max_age: float) -> List[str]:
+        """every subscribed node older than max_age seconds (or never received), in one pass"""
+        cutoff = monotonic() - max_age
+        old = compress(range(len(self.node_names)), map(cutoff.__gt__, self._store.stamps))
+        return [self.node_names[slot] for slot in old if self._subscribed[slot]]
+
+    def vector(self) -> memoryview:
+        """every numeric node as float64 in slot order (see node_names), NaN where missing.
+
+        Zero-copy with the array store, so numpy.frombuffer(iss.vector()) can
+        run checks across all channels at once.
+        """
+        return self._store.vector()
+
+    def status_codes(self) -> memoryview:
+        """raw int32 status codes in slot order"""
+        return self._store.status_codes()
+
+    def valid_mask(self) -> memoryview:
+        """one byte per slot, 1 where the node has a value"""
+        return self._store.valid_mask()
+
+
+    def enable_history(self, names_or_groups=None, capacity: int = 3600):
+        """keep the last capacity updates of these nodes (default every numeric one).
+
+        The buffers are preallocated here, recording them costs the ingest
+        thread two array writes per update. Free text nodes have no history.
+        Calling it again for a node starts its history over.
+        """
+        if names_or_groups is None:
+            slots = [slot for slot, kind in enumerate(self._iss_slot_kinds) if kind is not str]
+        else:
+            slots = self._select_names(names_or_groups)
+            text = [self.node_names[slot] for slot in slots if self._iss_slot_kinds[slot] is str]
+            if text:
+                raise ValueError(f"history needs numeric or status nodes: {text}")
+        for slot in slots:
+            self._listener.histories[slot] = NodeHistory(capacity)
+
+    def disable_history(self, names_or_groups=None):
+        """stop recording and free the buffers, for these nodes or all of them"""
+        slots = range(len(self.node_names)) if names_or_groups is None else self._select_names(names_or_groups)
+        for slot in slots:
+            self._listener.histories[slot] = None
+
+    def _history(self, name):
+        slot = self._iss_node_slots.get(name)
+        if slot is None:
+            raise ValueError(f"unknown node name: {name!r}")
+        history = self._listener.histories[slot]
+        if history is None:
+            raise LookupError(f"no history kept for {name!r}, call enable_history() first")
+        return history
+
+    def history(self, name: str, since: Optional[float] = None, until: Optional[float] = None):
+        """(stamps, values) float64 memoryviews of the node's updates between since and until.
+
+        Stamps are on the time.monotonic() clock like age(). The views are
+        zero-copy slices of the ring buffer, see NodeHistory.window().
+        """
+        return self._history(name).window(since, until)
+
+    def history_many(self, names, since: Optional[float] = None, until: Optional[float] = None):
+        """(stamps, {name: values}) for several nodes on one shared time axis.
+
+        stamps is every update time of any of the nodes in the window, each
+        value column holds that node's latest value at those times (NaN
+        before its first). The result is a fresh copy, not a view.
+        """
+        stamps, columns = _align([self._history(name).window(since, until) for name in names])
+        return stamps, dict(zip(names, columns))
+
+    # name tuple -> _BulkReader, shared by every ISS object
+    _bulk_readers = {}
+
+    def get_many(self, names, form: str = "tuple"):
+        """the values of several nodes, read in one pass as of one consistent update.
+
+        form is "tuple" (in the order of names), "dict" (name -> value) or
+        "array" (float64, NaN where missing, status nodes as their codes).
+        Values are what the properties return. The accessor for each name
+        tuple is built once and cached.
+        """
+        if form not in _BULK_FORMS:
+            raise ValueError(f"unknown form {form!r}, expected one of {_BULK_FORMS}")
+        names = tuple(names) if not isinstance(names, str) else (names,)
+        if not names:
+            return {"tuple": (), "dict": {}, "array": array("d")}[form]
+        reader = self._bulk_readers.get(names)
+        if reader is None:
+            reader = _BulkReader(names)
+            if len(self._bulk_readers) >= 1024:
+                self._bulk_readers.clear()
+            self._bulk_readers[names] = reader
+        if not reader.subscribed(self._subscribed):
+            raise NodeNotSubscribedError(next(
+                name for name, slot in zip(names, reader.slots) if not self._subscribed[slot]))
+        if form == "tuple":
+            return self._store.consistent(reader.read)
+        if form == "dict":
+            return self._store.consistent(reader.read_dict)
+        return self._store.consistent(reader.read_array)
+
+    def get_group(self, group: str, form: str = "dict"):
+        """every node of a group (see node_groups) in one pass, like get_many()"""
+        if group not in self.node_groups:
+            raise ValueError(f"unknown group {group!r}, expected one of {sorted(self.node_groups)}")
+        return self.get_many(self.node_groups[group], form)
 
-    @property
-    def lab_air_cooling_temp(self) -> Optional[float]:
-        """Lab Air Cooling Temperature"""
-        val = self._get_value("lab_air_cooling_temp")
-        return None if val is None else float(val)
-    
-    @property
-    def vacuum_resource_valve(self) -> Optional[str]:
-        """Vacuum Resource Valve Position"""
-        value = self._get_value("vacuum_resource_valve")
-        mapping = {0: "FAIL", 1: "OPEN", 2: "CLSD", 3: "TRNS"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def vacuum_exhaust_valve(self) -> Optional[str]:
-        """Vacuum Exhaust Valve Position"""
-        value = self._get_value("vacuum_exhaust_valve")
-        mapping = {0: "FAIL", 1: "OPEN", 2: "CLSD", 3: "TRNS"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def lab_port_ac_state(self) -> Optional[str]:
-        """Lab Port Air Conditioning State"""
-        value = self._get_value("lab_port_ac_state")
-        mapping = {0: "RESET", 1: "DRAIN", 2: "DRYOUT", 3: "EIB OFF", 4: "OFF", 5: "ON", 6: "STARTUP", 7: "TEST"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def lab_starboard_ac_state(self) -> Optional[str]:
-        """Lab Starboard Air Conditioning State"""
-        value = self._get_value("lab_starboard_ac_state")
-        mapping = {0: "RESET", 1: "DRAIN", 2: "DRYOUT", 3: "EIB OFF", 4: "OFF", 5: "ON", 6: "STARTUP", 7: "TEST"}
-        return self._decode_status(value, mapping)
+    def get_node(self,name:str):
+        return self._get_value(name)
     
+    def get_dets(self):
+        return self._client.connectionDetails
 
-    @property
-    def cc_mdm_1_status(self) -> Optional[str]:
-        """Command and Control Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("cc_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def cc_mdm_2_status(self) -> Optional[str]:
-        """Command and Control Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("cc_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def cc_mdm_3_status(self) -> Optional[str]:
-        """Command and Control Multiplexer/Demultiplexer 3 Status"""
-        value = self._get_value("cc_mdm_3_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def icz_mdm_1_status(self) -> Optional[str]:
-        """Internal Control Zone Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("icz_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def icz_mdm_2_status(self) -> Optional[str]:
-        """Internal Control Zone Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("icz_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def pl_mdm_1_status(self) -> Optional[str]:
-        """Payload Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("pl_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def pl_mdm_2_status(self) -> Optional[str]:
-        """Payload Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("pl_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def gnc_mdm_1_status(self) -> Optional[str]:
-        """Guidance Navigation Control Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("gnc_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def gnc_mdm_2_status(self) -> Optional[str]:
-        """Guidance Navigation Control Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("gnc_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def pmcu_1_mdm_status(self) -> Optional[str]:
-        """Power Management Control Unit 1 Multiplexer/Demultiplexer Status"""
-        value = self._get_value("pmcu_1_mdm_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def pmcu_2_mdm_status(self) -> Optional[str]:
-        """Power Management Control Unit 2 Multiplexer/Demultiplexer Status"""
-        value = self._get_value("pmcu_2_mdm_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def lab_mdm_1_status(self) -> Optional[str]:
-        """Lab Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("lab_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def lab_mdm_2_status(self) -> Optional[str]:
-        """Lab Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("lab_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def lab_mdm_3_status(self) -> Optional[str]:
-        """Lab Multiplexer/Demultiplexer 3 Status"""
-        value = self._get_value("lab_mdm_3_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def pmm_power_status(self) -> Optional[str]:
-        """Permanent Multipurpose Module Power Status"""
-        value = self._get_value("pmm_power_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
 
-    @property
-    def attitude_maneuver_in_progress(self) -> Optional[bool]:
-        """Attitude Maneuver In Progress Status"""
-        val = self._get_value("attitude_maneuver_in_progress")
-        return None if val is None else bool(val)
+# property name -> node it reads, for properties named differently from their node
+_PROPERTY_ALIASES = {
+    'waste_water_tank': ('waste_water_tank_qty', 'Waste Water Tank Quantity'),
+}
+_RETURN_TYPES = {float: Optional[float], int: Optional[int], bool: Optional[bool]}
+
+
+def _node_property(name, kind, doc):
+    """the read-only property for one catalog node.
+
+    Every node property shares one of these two functions' code, so the
+    catalog table above is all the module has to load per node.
+    """
+    if isinstance(kind, StatusMap):
+        def read(self):
+            return kind.get(self._get_value(name))
+    else:
+        def read(self):
+            return self._get_value(name)
+    read.__annotations__ = {"return": _RETURN_TYPES.get(kind, Optional[str])}
+    return property(read, doc=doc)
+
+
+def _install_node_properties(cls):
+    for name, (_, kind, doc) in cls._iss_node_catalog.items():
+        setattr(cls, name, _node_property(name, kind, doc))
+    for alias, (name, doc) in _PROPERTY_ALIASES.items():
+        setattr(cls, alias, _node_property(name, cls._iss_node_catalog[name][1], doc))
+
+
+_install_node_properties(ISS)
+
+# shared memory block: header of magic, node count, crc32 of the catalog's
+# item list, seqlock version and the seq of the last update written, then
+# values f64[n], receive stamps f64[n] (time.monotonic(), the same clock in
+# every process on the machine), status codes i32[n], valid u8[n] and
+# _SHARED_TEXT bytes per text node (a length byte and the utf-8 text)
+_SHARED_MAGIC = b"ISSSHM1\0"
+_SHARED_HEADER = struct.Struct("<8sIIQQ")
+_SHARED_TEXT = 64
+# names of the blocks this process's publishers created
+_shared_blocks = set()
+
+
+class _SharedLayout:
+    """where each part of the shared block lives, memoryviews over them"""
+    n = len(ISS.node_names)
+    values_at = _SHARED_HEADER.size
+    stamps_at = values_at + 8 * n
+    codes_at = stamps_at + 8 * n
+    valid_at = codes_at + 4 * n
+    text_at = valid_at + n
+    # slot -> offset of its text in the text part, for str nodes only
+    text_offsets = {slot: index * _SHARED_TEXT for index, slot in enumerate(
+        [slot for slot, kind in enumerate(ISS._iss_slot_kinds) if kind is str])}
+    size = text_at + _SHARED_TEXT * len(text_offsets)
+
+    def __init__(self, buf):
+        self.header = buf[:self.values_at]
+        # seqlock version and seq, one u64 each
+        self.counters = buf[16:self.values_at].cast("Q")
+        self.values = buf[self.values_at:self.stamps_at].cast("d")
+        self.stamps = buf[self.stamps_at:self.codes_at].cast("d")
+        self.codes = buf[self.codes_at:self.valid_at].cast("i")
+        self.valid = buf[self.valid_at:self.text_at]
+        self.text = buf[self.text_at:self.size]
+
+    @staticmethod
+    def catalog_crc():
+        import zlib
+        return zlib.crc32("\n".join(ISS._iss_slot_items).encode())
+
+    def release(self):
+        for view in (self.header, self.counters, self.values, self.stamps, self.codes,
+                     self.valid, self.text):
+            view.release()
+
+
+class SharedStatePublisher:
+    """a tap mirroring one ISS object's nodes into a multiprocessing.shared_memory block.
+
+    Any process on the machine can attach a SharedISS to it by name. Writes
+    go through a seqlock, so readers never take a lock: a read that sees
+    the same even version before and after is consistent. Text nodes keep
+    their first _SHARED_TEXT - 1 bytes.
+    """
+    def __init__(self, iss: "ISS", name: Optional[str] = None):
+        from multiprocessing.shared_memory import SharedMemory
+        self._shm = SharedMemory(name=name, create=True, size=_SharedLayout.size)
+        _shared_blocks.add(self._shm.name)
+        self._layout = _SharedLayout(self._shm.buf)
+        self._layout.header[:] = _SHARED_HEADER.pack(
+            _SHARED_MAGIC, len(ISS.node_names), _SharedLayout.catalog_crc(), 0, 0)
+        self._layout.values[:] = array("d", [_NAN]) * len(ISS.node_names)
+        self._layout.stamps[:] = array("d", [_NEVER]) * len(ISS.node_names)
+        self._columns = [ArrayStore._column_id(kind) for kind in ISS._iss_slot_kinds]
+        self._source = iss._store
+        # the ingest thread and the initial fill() both write
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        """what SharedISS(name) attaches to"""
+        return self._shm.name
+
+    def fill(self):
+        """write every node's current value, consistent as of one update"""
+        with self._lock:
+            # taken while updates wait on the lock, so none of them is older
+            store = self._source.snapshot()
+            counters = self._layout.counters
+            counters[0] += 1
+            try:
+                for slot, stamp in enumerate(store.stamps):
+                    if stamp != _NEVER:
+                        self._write(slot, store.get(slot), stamp)
+                counters[1] = max(counters[1], store.seq)
+            finally:
+                counters[0] += 1
+
+    def on_update(self, slot, value, stamp):
+        with self._lock:
+            counters = self._layout.counters
+            counters[0] += 1
+            try:
+                self._write(slot, value, stamp)
+                counters[1] = self._source.seq
+            finally:
+                counters[0] += 1
+
+    def _write(self, slot, value, stamp):
+        layout = self._layout
+        layout.stamps[slot] = stamp
+        column = self._columns[slot]
+        if value is None:
+            layout.valid[slot] = 0
+            if not column:
+                layout.values[slot] = _NAN
+            return
+        if not column:
+            layout.values[slot] = value
+        elif column == 1:
+            try:
+                layout.codes[slot] = value
+            except ValueError:
+                layout.valid[slot] = 0
+                return
+        else:
+            text = value.encode()[:_SHARED_TEXT - 1]
+            offset = _SharedLayout.text_offsets[slot]
+            layout.text[offset] = len(text)
+            layout.text[offset + 1:offset + 1 + len(text)] = text
+        layout.valid[slot] = 1
+
+    def close(self):
+        """remove the block, attached readers keep their mapping until they close"""
+        self._layout.release()
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            # already removed from outside, nothing left to clean up
+            pass
+        _shared_blocks.discard(self._shm.name)
 
-    @property
-    def standard_command_counter(self) -> Optional[int]:
-        """Standard Command Counter"""
-        val = self._get_value("standard_command_counter")
-        return None if val is None else int(val)
 
-    @property
-    def data_load_command_counter(self) -> Optional[int]:
-        """Data Load Command Counter"""
-        val = self._get_value("data_load_command_counter")
-        return None if val is None else int(val)
+class SharedISS:
+    """live node values read straight out of a SharedStatePublisher's block.
 
-    @property
-    def cc_mdm_time_coarse(self) -> Optional[int]:
-        """Command and Control MDM Time Coarse"""
-        val = self._get_value("cc_mdm_time_coarse")
-        return None if val is None else int(val)
-
-    @property
-    def cc_mdm_time_fine(self) -> Optional[int]:
-        """Command and Control MDM Time Fine"""
-        val = self._get_value("cc_mdm_time_fine")
-        return None if val is None else int(val)
-
-    @property
-    def station_mode(self) -> Optional[str]:
-        """Space Station Operating Mode"""
-        val = self._get_value("station_mode")
-        return None if val is None else str(val)
-
-    @property
-    def laptops_active(self) -> Optional[int]:
-        """Number of Active Laptops"""
-        val = self._get_value("laptops_active")
-        return None if val is None else int(val)
-    
-
-    @property
-    def ku_video_ch1_activity(self) -> Optional[str]:
-        """Ku-band Video Channel 1 Activity"""
-        value = self._get_value("ku_video_ch1_activity")
-        mapping = {0: "INACTIVE", 1: "ACTIVE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def ku_video_ch2_activity(self) -> Optional[str]:
-        """Ku-band Video Channel 2 Activity"""
-        value = self._get_value("ku_video_ch2_activity")
-        mapping = {0: "INACTIVE", 1: "ACTIVE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def ku_video_ch3_activity(self) -> Optional[str]:
-        """Ku-band Video Channel 3 Activity"""
-        value = self._get_value("ku_video_ch3_activity")
-        mapping = {0: "INACTIVE", 1: "ACTIVE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def ku_video_ch4_activity(self) -> Optional[str]:
-        """Ku-band Video Channel 4 Activity"""
-        value = self._get_value("ku_video_ch4_activity")
-        mapping = {0: "INACTIVE", 1: "ACTIVE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def sband_active_string(self) -> Optional[str]:
-        """S-band Active Communication String"""
-        value = self._get_value("sband_active_string")
-        mapping = {1: "String 1", 2: "String 2"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def iac_1_status(self) -> Optional[str]:
-        """Internal Audio Controller 1 Status"""
-        value = self._get_value("iac_1_status")
-        mapping = {0: "Backup", 1: "Active"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def iac_2_status(self) -> Optional[str]:
-        """Internal Audio Controller 2 Status"""
-        value = self._get_value("iac_2_status")
-        mapping = {0: "Backup", 1: "Active"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def video_downlink_1(self) -> Optional[str]:
-        """Video Downlink Channel 1"""
-        value = self._get_value("video_downlink_1")
-        video_mapping = {
-            0: "-", 1: "S3AFT", 2: "S1UPOB", 3: "SCU1 Mux", 4: "S1LOOB", 5: "JPM a", 
-            6: "JPM b", 7: "S1UPIB", 8: "S1LOIB", 9: "COL 1", 10: "COL 2", 11: "P1UPIB", 
-            12: "SCU2 Mux", 13: "NOD3S", 14: "P1LOIB", 15: "SCU1 Test", 16: "WETA112", 
-            17: "ORB1", 18: "ORB2", 19: "P1LOOB", 20: "SCU2 Test", 21: "P3AFT", 
-            22: "Payload Rack", 23: "VTR1", 24: "VTR2", 25: "NOD2LO", 26: "WETA115", 
-            28: "LAB S", 31: "POA PL3", 32: "POA", 33: "SPDMS1", 34: "SPDMS2", 
-            35: "MBS CLPA", 36: "SPDMLEE", 37: "MAST", 40: "BLEE", 43: "BELB", 
-            48: "TELB", 50: "MSS PL3", 51: "TLEE", 52: "Lab AVU1", 53: "Lab AVU2", 
-            54: "Cup AVU1", 55: "Cup AVU2", 56: "OTCM1", 57: "BODY1", 58: "OTCM2", 
-            59: "BODY2", 60: "SSRMS PL1", 61: "SSRMS PL2", 62: "SSRMS PL3", 
-            63: "MSS PL1", 64: "MSS PL2", 65: "LAB1D3", 66: "LAB1P2", 67: "LAB1P4", 
-            68: "LABCAM", 69: "LAB1O5", 70: "LAB1O4", 71: "LAB1O3", 72: "LAB1O2", 
-            73: "LAB1O1", 74: "LAB1S1", 75: "LAB1S2", 76: "LAB1S3", 77: "A/L CAM", 
-            78: "LAB1S4", 79: "N1 CAM", 80: "N3 CAM"
-        }
-        return self._decode_status(value, video_mapping)
-    
-    @property
-    def video_downlink_2(self) -> Optional[str]:
-        """Video Downlink Channel 2"""
-        value = self._get_value("video_downlink_2")
-        video_mapping = {
-            0: "-", 1: "S3AFT", 2: "S1UPOB", 3: "SCU1 Mux", 4: "S1LOOB", 5: "JPM a", 
-            6: "JPM b", 7: "S1UPIB", 8: "S1LOIB", 9: "COL 1", 10: "COL 2", 11: "P1UPIB", 
-            12: "SCU2 Mux", 13: "NOD3S", 14: "P1LOIB", 15: "SCU1 Test", 16: "WETA112", 
-            17: "ORB1", 18: "ORB2", 19: "P1LOOB", 20: "SCU2 Test", 21: "P3AFT", 
-            22: "Payload Rack", 23: "VTR1", 24: "VTR2", 25: "NOD2LO", 26: "WETA115", 
-            28: "LAB S", 31: "POA PL3", 32: "POA", 33: "SPDMS1", 34: "SPDMS2", 
-            35: "MBS CLPA", 36: "SPDMLEE", 37: "MAST", 40: "BLEE", 43: "BELB", 
-            48: "TELB", 50: "MSS PL3", 51: "TLEE", 52: "Lab AVU1", 53: "Lab AVU2", 
-            54: "Cup AVU1", 55: "Cup AVU2", 56: "OTCM1", 57: "BODY1", 58: "OTCM2", 
-            59: "BODY2", 60: "SSRMS PL1", 61: "SSRMS PL2", 62: "SSRMS PL3", 
-            63: "MSS PL1", 64: "MSS PL2", 65: "LAB1D3", 66: "LAB1P2", 67: "LAB1P4", 
-            68: "LABCAM", 69: "LAB1O5", 70: "LAB1O4", 71: "LAB1O3", 72: "LAB1O2", 
-            73: "LAB1O1", 74: "LAB1S1", 75: "LAB1S2", 76: "LAB1S3", 77: "A/L CAM", 
-            78: "LAB1S4", 79: "N1 CAM", 80: "N3 CAM"
-        }
-        return self._decode_status(value, video_mapping)
-    
-    @property
-    def video_downlink_3(self) -> Optional[str]:
-        """Video Downlink Channel 3"""
-        value = self._get_value("video_downlink_3")
-        video_mapping = {
-            0: "-", 1: "S3AFT", 2: "S1UPOB", 3: "SCU1 Mux", 4: "S1LOOB", 5: "JPM a", 
-            6: "JPM b", 7: "S1UPIB", 8: "S1LOIB", 9: "COL 1", 10: "COL 2", 11: "P1UPIB", 
-            12: "SCU2 Mux", 13: "NOD3S", 14: "P1LOIB", 15: "SCU1 Test", 16: "WETA112", 
-            17: "ORB1", 18: "ORB2", 19: "P1LOOB", 20: "SCU2 Test", 21: "P3AFT", 
-            22: "Payload Rack", 23: "VTR1", 24: "VTR2", 25: "NOD2LO", 26: "WETA115", 
-            28: "LAB S", 31: "POA PL3", 32: "POA", 33: "SPDMS1", 34: "SPDMS2", 
-            35: "MBS CLPA", 36: "SPDMLEE", 37: "MAST", 40: "BLEE", 43: "BELB", 
-            48: "TELB", 50: "MSS PL3", 51: "TLEE", 52: "Lab AVU1", 53: "Lab AVU2", 
-            54: "Cup AVU1", 55: "Cup AVU2", 56: "OTCM1", 57: "BODY1", 58: "OTCM2", 
-            59: "BODY2", 60: "SSRMS PL1", 61: "SSRMS PL2", 62: "SSRMS PL3", 
-            63: "MSS PL1", 64: "MSS PL2", 65: "LAB1D3", 66: "LAB1P2", 67: "LAB1P4", 
-            68: "LABCAM", 69: "LAB1O5", 70: "LAB1O4", 71: "LAB1O3", 72: "LAB1O2", 
-            73: "LAB1O1", 74: "LAB1S1", 75: "LAB1S2", 76: "LAB1S3", 77: "A/L CAM", 
-            78: "LAB1S4", 79: "N1 CAM", 80: "N3 CAM"
-        }
-        return self._decode_status(value, video_mapping)
-    
-    @property
-    def video_downlink_4(self) -> Optional[str]:
-        """Video Downlink Channel 4"""
-        value = self._get_value("video_downlink_4")
-        video_mapping = {
-            0: "-", 1: "S3AFT", 2: "S1UPOB", 3: "SCU1 Mux", 4: "S1LOOB", 5: "JPM a", 
-            6: "JPM b", 7: "S1UPIB", 8: "S1LOIB", 9: "COL 1", 10: "COL 2", 11: "P1UPIB", 
-            12: "SCU2 Mux", 13: "NOD3S", 14: "P1LOIB", 15: "SCU1 Test", 16: "WETA112", 
-            17: "ORB1", 18: "ORB2", 19: "P1LOOB", 20: "SCU2 Test", 21: "P3AFT", 
-            22: "Payload Rack", 23: "VTR1", 24: "VTR2", 25: "NOD2LO", 26: "WETA115", 
-            28: "LAB S", 31: "POA PL3", 32: "POA", 33: "SPDMS1", 34: "SPDMS2", 
-            35: "MBS CLPA", 36: "SPDMLEE", 37: "MAST", 40: "BLEE", 43: "BELB", 
-            48: "TELB", 50: "MSS PL3", 51: "TLEE", 52: "Lab AVU1", 53: "Lab AVU2", 
-            54: "Cup AVU1", 55: "Cup AVU2", 56: "OTCM1", 57: "BODY1", 58: "OTCM2", 
-            59: "BODY2", 60: "SSRMS PL1", 61: "SSRMS PL2", 62: "SSRMS PL3", 
-            63: "MSS PL1", 64: "MSS PL2", 65: "LAB1D3", 66: "LAB1P2", 67: "LAB1P4", 
-            68: "LABCAM", 69: "LAB1O5", 70: "LAB1O4", 71: "LAB1O3", 72: "LAB1O2", 
-            73: "LAB1O1", 74: "LAB1S1", 75: "LAB1S2", 76: "LAB1S3", 77: "A/L CAM", 
-            78: "LAB1S4", 79: "N1 CAM", 80: "N3 CAM"
-        }
-        return self._decode_status(value, video_mapping)
-    
-    @property
-    def uhf_1_power(self) -> Optional[str]:
-        """Ultra High Frequency Radio 1 Power Status"""
-        value = self._get_value("uhf_1_power")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def uhf_2_power(self) -> Optional[str]:
-        """Ultra High Frequency Radio 2 Power Status"""
-        value = self._get_value("uhf_2_power")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def uhf_frame_sync(self) -> Optional[str]:
-        """Ultra High Frequency Frame Synchronization"""
-        value = self._get_value("uhf_frame_sync")
-        mapping = {0: "Frame Sync unlocked", 1: "Frame Sync locked"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def cmg_1_vibration(self) -> Optional[float]:
-        """Control Moment Gyroscope 1 Vibration Level"""
-        val = self._get_value("cmg_1_vibration")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_2_vibration(self) -> Optional[float]:
-        """Control Moment Gyroscope 2 Vibration Level"""
-        val = self._get_value("cmg_2_vibration")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_3_vibration(self) -> Optional[float]:
-        """Control Moment Gyroscope 3 Vibration Level"""
-        val = self._get_value("cmg_3_vibration")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_4_vibration(self) -> Optional[float]:
-        """Control Moment Gyroscope 4 Vibration Level"""
-        val = self._get_value("cmg_4_vibration")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_1_spin_motor_current(self) -> Optional[float]:
-        """Control Moment Gyroscope 1 Spin Motor Current"""
-        val = self._get_value("cmg_1_spin_motor_current")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_2_spin_motor_current(self) -> Optional[float]:
-        """Control Moment Gyroscope 2 Spin Motor Current"""
-        val = self._get_value("cmg_2_spin_motor_current")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_3_spin_motor_current(self) -> Optional[float]:
-        """Control Moment Gyroscope 3 Spin Motor Current"""
-        val = self._get_value("cmg_3_spin_motor_current")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_4_spin_motor_current(self) -> Optional[float]:
-        """Control Moment Gyroscope 4 Spin Motor Current"""
-        val = self._get_value("cmg_4_spin_motor_current")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_1_wheel_speed(self) -> Optional[float]:
-        """Control Moment Gyroscope 1 Wheel Speed"""
-        val = self._get_value("cmg_1_wheel_speed")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_2_wheel_speed(self) -> Optional[float]:
-        """Control Moment Gyroscope 2 Wheel Speed"""
-        val = self._get_value("cmg_2_wheel_speed")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_3_wheel_speed(self) -> Optional[float]:
-        """Control Moment Gyroscope 3 Wheel Speed"""
-        val = self._get_value("cmg_3_wheel_speed")
-        return None if val is None else float(val)
-
-    @property
-    def cmg_4_wheel_speed(self) -> Optional[float]:
-        """Control Moment Gyroscope 4 Wheel Speed"""
-        val = self._get_value("cmg_4_wheel_speed")
-        return None if val is None else float(val)
-    
-    @property
-    def ku_transmit(self) -> Optional[str]:
-        """Ku-band Transmit Status"""
-        value = self._get_value("ku_transmit")
-        mapping = {0: "RESET", 1: "NORMAL"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def ku_sgant_elevation(self) -> Optional[float]:
-        """Ku-band Space-to-Ground Antenna Elevation"""
-        val = self._get_value("ku_sgant_elevation")
-        return None if val is None else float(val)
-
-    @property
-    def ku_sgant_cross_elevation(self) -> Optional[float]:
-        """Ku-band Space-to-Ground Antenna Cross Elevation"""
-        val = self._get_value("ku_sgant_cross_elevation")
-        return None if val is None else float(val)
-    
-
-    @property
-    def airlock_mdm_status(self) -> Optional[str]:
-        """Airlock Multiplexer/Demultiplexer Status"""
-        value = self._get_value("airlock_mdm_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node1_mdm_1_status(self) -> Optional[str]:
-        """Node 1 Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("node1_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node1_mdm_2_status(self) -> Optional[str]:
-        """Node 1 Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("node1_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node2_mdm_2_status(self) -> Optional[str]:
-        """Node 2 Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("node2_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node2_mdm_1_status(self) -> Optional[str]:
-        """Node 2 Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("node2_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node3_hcz_mdm_2_status(self) -> Optional[str]:
-        """Node 3 Health and Status Zone Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("node3_hcz_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node3_mdm_2_status(self) -> Optional[str]:
-        """Node 3 Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("node3_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node3_hcz_mdm_1_status(self) -> Optional[str]:
-        """Node 3 Health and Status Zone Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("node3_hcz_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node3_mdm_1_status(self) -> Optional[str]:
-        """Node 3 Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("node3_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def p1_mdm_1_status(self) -> Optional[str]:
-        """P1 Truss Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("p1_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def p1_str_mdm_status(self) -> Optional[str]:
-        """P1 Starboard Truss Multiplexer/Demultiplexer Status"""
-        value = self._get_value("p1_str_mdm_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def p1_mdm_2_status(self) -> Optional[str]:
-        """P1 Truss Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("p1_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def p3_mdm_1_status(self) -> Optional[str]:
-        """P3 Truss Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("p3_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def p3_mdm_2_status(self) -> Optional[str]:
-        """P3 Truss Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("p3_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s0_ecz_mdm_1_status(self) -> Optional[str]:
-        """S0 External Control Zone Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("s0_ecz_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s0_mdm_1_status(self) -> Optional[str]:
-        """S0 Truss Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("s0_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s0_ecz_mdm_2_status(self) -> Optional[str]:
-        """S0 External Control Zone Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("s0_ecz_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s0_mdm_2_status(self) -> Optional[str]:
-        """S0 Truss Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("s0_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s1_str_mdm_status(self) -> Optional[str]:
-        """S1 Starboard Truss Multiplexer/Demultiplexer Status"""
-        value = self._get_value("s1_str_mdm_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s1_mdm_1_status(self) -> Optional[str]:
-        """S1 Truss Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("s1_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s1_mdm_2_status(self) -> Optional[str]:
-        """S1 Truss Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("s1_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s3_mdm_1_status(self) -> Optional[str]:
-        """S3 Truss Multiplexer/Demultiplexer 1 Status"""
-        value = self._get_value("s3_mdm_1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def s3_mdm_2_status(self) -> Optional[str]:
-        """S3 Truss Multiplexer/Demultiplexer 2 Status"""
-        value = self._get_value("s3_mdm_2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def solar_array_2a_mdm_status(self) -> Optional[str]:
-        """Solar Array 2A Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_2a_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_4a_mdm_status(self) -> Optional[str]:
-        """Solar Array 4A Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_4a_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_4b_mdm_status(self) -> Optional[str]:
-        """Solar Array 4B Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_4b_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_2b_mdm_status(self) -> Optional[str]:
-        """Solar Array 2B Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_2b_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_1a_mdm_status(self) -> Optional[str]:
-        """Solar Array 1A Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_1a_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_3a_mdm_status(self) -> Optional[str]:
-        """Solar Array 3A Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_3a_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_3b_mdm_status(self) -> Optional[str]:
-        """Solar Array 3B Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_3b_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def solar_array_1b_mdm_status(self) -> Optional[str]:
-        """Solar Array 1B Multiplexer/Demultiplexer Status"""
-        value = self._get_value("solar_array_1b_mdm_status")
-        mapping = {0: "Not Enabled", 1: "Enabled"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def sband_rfg2_azimuth(self) -> Optional[float]:
-        """S-band Radio Frequency Group 2 Azimuth"""
-        val = self._get_value("sband_rfg2_azimuth")
-        return None if val is None else float(val)
-
-    @property
-    def sband_rfg2_elevation(self) -> Optional[float]:
-        """S-band Radio Frequency Group 2 Elevation"""
-        val = self._get_value("sband_rfg2_elevation")
-        return None if val is None else float(val)
-    
-    @property
-    def sband_rfg2_status(self) -> Optional[str]:
-        """S-band Radio Frequency Group 2 Status"""
-        value = self._get_value("sband_rfg2_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def sband_rfg1_azimuth(self) -> Optional[float]:
-        """S-band Radio Frequency Group 1 Azimuth"""
-        val = self._get_value("sband_rfg1_azimuth")
-        return None if val is None else float(val)
-
-    @property
-    def sband_rfg1_elevation(self) -> Optional[float]:
-        """S-band Radio Frequency Group 1 Elevation"""
-        val = self._get_value("sband_rfg1_elevation")
-        return None if val is None else float(val)
-    
-    @property
-    def sband_rfg1_status(self) -> Optional[str]:
-        """S-band Radio Frequency Group 1 Status"""
-        value = self._get_value("sband_rfg1_status")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 3: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def loop_b_pump_flowrate(self) -> Optional[float]:
-        """Thermal Control Loop B Pump Flow Rate"""
-        val = self._get_value("loop_b_pump_flowrate")
-        return None if val is None else float(val)
-
-    @property
-    def loop_b_pm_pressure(self) -> Optional[float]:
-        """Thermal Control Loop B Pump Module Pressure"""
-        val = self._get_value("loop_b_pm_pressure")
-        return None if val is None else float(val)
-
-    @property
-    def loop_b_pm_temp(self) -> Optional[float]:
-        """Thermal Control Loop B Pump Module Temperature"""
-        val = self._get_value("loop_b_pm_temp")
-        return None if val is None else float(val)
-
-    @property
-    def loop_a_pump_flowrate(self) -> Optional[float]:
-        """Thermal Control Loop A Pump Flow Rate"""
-        val = self._get_value("loop_a_pump_flowrate")
-        return None if val is None else float(val)
-
-    @property
-    def loop_a_pm_pressure(self) -> Optional[float]:
-        """Thermal Control Loop A Pump Module Pressure"""
-        val = self._get_value("loop_a_pm_pressure")
-        return None if val is None else float(val)
-
-    @property
-    def loop_a_pm_temp(self) -> Optional[float]:
-        """Thermal Control Loop A Pump Module Temperature"""
-        val = self._get_value("loop_a_pm_temp")
-        return None if val is None else float(val)
-
-    @property
-    def solar_2a_drive_voltage(self) -> Optional[float]:
-        """Solar Array 2A Drive Voltage"""
-        val = self._get_value("solar_2a_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_2a_drive_current(self) -> Optional[float]:
-        """Solar Array 2A Drive Current"""
-        val = self._get_value("solar_2a_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_4a_drive_voltage(self) -> Optional[float]:
-        """Solar Array 4A Drive Voltage"""
-        val = self._get_value("solar_4a_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_4a_drive_current(self) -> Optional[float]:
-        """Solar Array 4A Drive Current"""
-        val = self._get_value("solar_4a_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_2a_bga_position(self) -> Optional[float]:
-        """Solar Array 2A Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_2a_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_4a_bga_position(self) -> Optional[float]:
-        """Solar Array 4A Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_4a_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_4b_drive_voltage(self) -> Optional[float]:
-        """Solar Array 4B Drive Voltage"""
-        val = self._get_value("solar_4b_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_4b_drive_current(self) -> Optional[float]:
-        """Solar Array 4B Drive Current"""
-        val = self._get_value("solar_4b_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_2b_drive_voltage(self) -> Optional[float]:
-        """Solar Array 2B Drive Voltage"""
-        val = self._get_value("solar_2b_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_2b_drive_current(self) -> Optional[float]:
-        """Solar Array 2B Drive Current"""
-        val = self._get_value("solar_2b_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_4b_bga_position(self) -> Optional[float]:
-        """Solar Array 4B Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_4b_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_2b_bga_position(self) -> Optional[float]:
-        """Solar Array 2B Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_2b_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_1a_drive_voltage(self) -> Optional[float]:
-        """Solar Array 1A Drive Voltage"""
-        val = self._get_value("solar_1a_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_1a_drive_current(self) -> Optional[float]:
-        """Solar Array 1A Drive Current"""
-        val = self._get_value("solar_1a_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_3a_drive_voltage(self) -> Optional[float]:
-        """Solar Array 3A Drive Voltage"""
-        val = self._get_value("solar_3a_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_3a_drive_current(self) -> Optional[float]:
-        """Solar Array 3A Drive Current"""
-        val = self._get_value("solar_3a_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_1a_bga_position(self) -> Optional[float]:
-        """Solar Array 1A Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_1a_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_3a_bga_position(self) -> Optional[float]:
-        """Solar Array 3A Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_3a_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_3b_drive_voltage(self) -> Optional[float]:
-        """Solar Array 3B Drive Voltage"""
-        val = self._get_value("solar_3b_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_3b_drive_current(self) -> Optional[float]:
-        """Solar Array 3B Drive Current"""
-        val = self._get_value("solar_3b_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_1b_drive_voltage(self) -> Optional[float]:
-        """Solar Array 1B Drive Voltage"""
-        val = self._get_value("solar_1b_drive_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def solar_1b_drive_current(self) -> Optional[float]:
-        """Solar Array 1B Drive Current"""
-        val = self._get_value("solar_1b_drive_current")
-        return None if val is None else float(val)
-
-    @property
-    def solar_3b_bga_position(self) -> Optional[float]:
-        """Solar Array 3B Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_3b_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def solar_1b_bga_position(self) -> Optional[float]:
-        """Solar Array 1B Beta Gimbal Assembly Position"""
-        val = self._get_value("solar_1b_bga_position")
-        return None if val is None else float(val)
-
-    @property
-    def starboard_trrj_position(self) -> Optional[float]:
-        """Starboard Thermal Radiator Rotary Joint Position"""
-        val = self._get_value("starboard_trrj_position")
-        return None if val is None else float(val)
-
-    @property
-    def port_trrj_position(self) -> Optional[float]:
-        """Port Thermal Radiator Rotary Joint Position"""
-        val = self._get_value("port_trrj_position")
-        return None if val is None else float(val)
-
-    @property
-    def starboard_sarj_position(self) -> Optional[float]:
-        """Starboard Solar Alpha Rotary Joint Position"""
-        val = self._get_value("starboard_sarj_position")
-        return None if val is None else float(val)
-
-    @property
-    def port_sarj_position(self) -> Optional[float]:
-        """Port Solar Alpha Rotary Joint Position"""
-        val = self._get_value("port_sarj_position")
-        return None if val is None else float(val)
-
-    @property
-    def port_sarj_commanded_position(self) -> Optional[float]:
-        """Port Solar Alpha Rotary Joint Commanded Position"""
-        val = self._get_value("port_sarj_commanded_position")
-        return None if val is None else float(val)
-
-    @property
-    def trrj_loop_b_mode(self) -> Optional[str]:
-        """Thermal Radiator Rotary Joint Loop B Mode"""
-        val = self._get_value("trrj_loop_b_mode")
-        return None if val is None else str(val)
-
-    @property
-    def trrj_loop_a_mode(self) -> Optional[str]:
-        """Thermal Radiator Rotary Joint Loop A Mode"""
-        val = self._get_value("trrj_loop_a_mode")
-        return None if val is None else str(val)
-
-    @property
-    def sarj_port_mode(self) -> Optional[str]:
-        """Solar Alpha Rotary Joint Port Mode"""
-        val = self._get_value("sarj_port_mode")
-        return None if val is None else str(val)
-
-    @property
-    def sarj_starboard_mode(self) -> Optional[str]:
-        """Solar Alpha Rotary Joint Starboard Mode"""
-        val = self._get_value("sarj_starboard_mode")
-        return None if val is None else str(val)
-
-    @property
-    def node2_coolant_mt(self) -> Optional[float]:
-        """Node 2 Coolant Medium Temperature"""
-        val = self._get_value("node2_coolant_mt")
-        return None if val is None else float(val)
-
-    @property
-    def node2_coolant_lt(self) -> Optional[float]:
-        """Node 2 Coolant Low Temperature"""
-        val = self._get_value("node2_coolant_lt")
-        return None if val is None else float(val)
-    
-    @property
-    def node2_ac_state(self) -> Optional[str]:
-        """Node 2 Air Conditioning State"""
-        value = self._get_value("node2_ac_state")
-        mapping = {0: "RESET", 1: "DRAIN", 2: "DRYOUT", 3: "EIB OFF", 4: "OFF", 5: "ON", 6: "STARTUP", 7: "TEST"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node2_air_cooling_temp(self) -> Optional[float]:
-        """Node 2 Air Cooling Temperature"""
-        val = self._get_value("node2_air_cooling_temp")
-        return None if val is None else float(val)
-
-    @property
-    def node2_avionics_temp(self) -> Optional[float]:
-        """Node 2 Avionics Temperature"""
-        val = self._get_value("node2_avionics_temp")
-        return None if val is None else float(val)
-
-    @property
-    def node3_ppo2(self) -> Optional[float]:
-        """Node 3 Partial Pressure Oxygen"""
-        val = self._get_value("node3_ppo2")
-        return None if val is None else float(val)
-
-    @property
-    def node3_ppn2(self) -> Optional[float]:
-        """Node 3 Partial Pressure Nitrogen"""
-        val = self._get_value("node3_ppn2")
-        return None if val is None else float(val)
-
-    @property
-    def node3_ppco2(self) -> Optional[float]:
-        """Node 3 Partial Pressure Carbon Dioxide"""
-        val = self._get_value("node3_ppco2")
-        return None if val is None else float(val)
-    
-    @property
-    def urine_processor_state(self) -> Optional[str]:
-        """Urine Processor Assembly State"""
-        value = self._get_value("urine_processor_state")
-        mapping = {2: "STOP", 4: "SHUTDOWN", 8: "MAINTENANCE", 16: "NORMAL", 32: "STANDBY", 64: "IDLE", 128: "SYSTEM INITIALIZED"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def urine_tank_qty(self) -> Optional[float]:
-        """Urine Tank Quantity"""
-        val = self._get_value("urine_tank_qty")
-        return None if val is None else float(val)
-    
-    @property
-    def water_processor_state(self) -> Optional[str]:
-        """Water Processor Assembly State"""
-        value = self._get_value("water_processor_state")
-        mapping = {1: "STOP", 2: "SHUTDOWN", 3: "STANDBY", 4: "PROCESS", 5: "HOT SERVICE", 6: "FLUSH", 7: "WARM SHUTDOWN"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def water_processor_step(self) -> Optional[str]:
-        """Water Processor Assembly Processing Step"""
-        value = self._get_value("water_processor_step")
-        mapping = {0: "NONE", 1: "VENT", 2: "HEATUP", 3: "PURGE", 4: "FLOW", 5: "TEST", 6: "TEST_SV_1", 7: "TEST_SV_2", 8: "SERVICE"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def waste_water_tank_qty(self) -> Optional[float]:
-        """Waste Water Tank Quantity"""
-        val = self._get_value("waste_water_tank_qty")
-        return None if val is None else float(val)
-
-    @property
-    def clean_water_tank_qty(self) -> Optional[float]:
-        """Clean Water Tank Quantity"""
-        val = self._get_value("clean_water_tank_qty")
-        return None if val is None else float(val)
-        
-    @property
-    def oxygen_generator_state(self) -> Optional[str]:
-        """Oxygen Generator Assembly State"""
-        value = self._get_value("oxygen_generator_state")
-        mapping = {1: "PROCESS", 2: "STANDBY", 3: "SHUTDOWN", 4: "STOP", 5: "VENT_DOME", 6: "INERT_DOME", 7: "FAST_SHUTDOWN", 8: "N2_PURGE_SHUTDOWN"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def o2_production_rate(self) -> Optional[float]:
-        """Oxygen Production Rate"""
-        val = self._get_value("o2_production_rate")
-        return None if val is None else float(val)
-
-    @property
-    def node3_avionics_temp(self) -> Optional[float]:
-        """Node 3 Avionics Temperature"""
-        val = self._get_value("node3_avionics_temp")
-        return None if val is None else float(val)
-
-    @property
-    def node3_air_cooling_temp(self) -> Optional[float]:
-        """Node 3 Air Cooling Temperature"""
-        val = self._get_value("node3_air_cooling_temp")
-        return None if val is None else float(val)
-
-    @property
-    def node3_coolant_qty_1(self) -> Optional[float]:
-        """Node 3 Coolant Quantity 1"""
-        val = self._get_value("node3_coolant_qty_1")
-        return None if val is None else float(val)
-        
-    @property
-    def node3_ac_state(self) -> Optional[str]:
-        """Node 3 Air Conditioning State"""
-        value = self._get_value("node3_ac_state")
-        mapping = {0: "RESET", 1: "DRAIN", 2: "DRYOUT", 3: "EIB OFF", 4: "OFF", 5: "ON", 6: "STARTUP", 7: "TEST"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def node3_coolant_qty_2(self) -> Optional[float]:
-        """Node 3 Coolant Quantity 2"""
-        val = self._get_value("node3_coolant_qty_2")
-        return None if val is None else float(val)
-
-    @property
-    def crewlock_pressure(self) -> Optional[float]:
-        """Crew Lock Atmospheric Pressure"""
-        val = self._get_value("crewlock_pressure")
-        return None if val is None else float(val)
-    
-    @property
-    def lo_p_o2_valve_position(self) -> Optional[str]:
-        """Low Pressure Oxygen Valve Position"""
-        value = self._get_value("lo_p_o2_valve_position")
-        mapping = {0: "CLOSED", 1: "OPEN", 2: "IN-TRANSIT", 3: "FAILED"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def n2_supply_valve_position(self) -> Optional[str]:
-        """Nitrogen Supply Valve Position"""
-        value = self._get_value("n2_supply_valve_position")
-        mapping = {0: "CLOSED", 1: "OPEN", 2: "IN-TRANSIT", 3: "FAILED"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def airlock_ac_state(self) -> Optional[str]:
-        """Airlock Air Conditioning State"""
-        value = self._get_value("airlock_ac_state")
-        mapping = {0: "RESET", 1: "DRAIN", 2: "DRYOUT", 3: "EIB OFF", 4: "OFF", 5: "ON", 6: "STARTUP", 7: "TEST"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def airlock_pressure(self) -> Optional[float]:
-        """Airlock Atmospheric Pressure"""
-        val = self._get_value("airlock_pressure")
-        return None if val is None else float(val)
-
-    @property
-    def airlock_hi_p_o2_pressure(self) -> Optional[float]:
-        """Airlock High Pressure Oxygen Pressure"""
-        val = self._get_value("airlock_hi_p_o2_pressure")
-        return None if val is None else float(val)
-
-    @property
-    def airlock_lo_p_o2_pressure(self) -> Optional[float]:
-        """Airlock Low Pressure Oxygen Pressure"""
-        val = self._get_value("airlock_lo_p_o2_pressure")
-        return None if val is None else float(val)
-
-    @property
-    def airlock_n2_pressure(self) -> Optional[float]:
-        """Airlock Nitrogen Pressure"""
-        val = self._get_value("airlock_n2_pressure")
-        return None if val is None else float(val)
-
-    @property
-    def emu_1_voltage(self) -> Optional[float]:
-        """Extravehicular Mobility Unit 1 Voltage"""
-        val = self._get_value("emu_1_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def emu_1_current(self) -> Optional[float]:
-        """Extravehicular Mobility Unit 1 Current"""
-        val = self._get_value("emu_1_current")
-        return None if val is None else float(val)
-
-    @property
-    def emu_2_voltage(self) -> Optional[float]:
-        """Extravehicular Mobility Unit 2 Voltage"""
-        val = self._get_value("emu_2_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def emu_2_current(self) -> Optional[float]:
-        """Extravehicular Mobility Unit 2 Current"""
-        val = self._get_value("emu_2_current")
-        return None if val is None else float(val)
-
-    @property
-    def iru_voltage(self) -> Optional[float]:
-        """Interface Relay Unit Voltage"""
-        val = self._get_value("iru_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def iru_current(self) -> Optional[float]:
-        """Interface Relay Unit Current"""
-        val = self._get_value("iru_current")
-        return None if val is None else float(val)
-
-    @property
-    def eva_emu_1_voltage(self) -> Optional[float]:
-        """EVA Extravehicular Mobility Unit 1 Voltage"""
-        val = self._get_value("eva_emu_1_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def eva_emu_1_current(self) -> Optional[float]:
-        """EVA Extravehicular Mobility Unit 1 Current"""
-        val = self._get_value("eva_emu_1_current")
-        return None if val is None else float(val)
-
-    @property
-    def eva_emu_2_voltage(self) -> Optional[float]:
-        """EVA Extravehicular Mobility Unit 2 Voltage"""
-        val = self._get_value("eva_emu_2_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def eva_emu_2_current(self) -> Optional[float]:
-        """EVA Extravehicular Mobility Unit 2 Current"""
-        val = self._get_value("eva_emu_2_current")
-        return None if val is None else float(val)
-
-    @property
-    def bca_1_voltage(self) -> Optional[float]:
-        """Battery Charger Assembly 1 Voltage"""
-        val = self._get_value("bca_1_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def bca_1_current(self) -> Optional[float]:
-        """Battery Charger Assembly 1 Current"""
-        val = self._get_value("bca_1_current")
-        return None if val is None else float(val)
-
-    @property
-    def bca_2_voltage(self) -> Optional[float]:
-        """Battery Charger Assembly 2 Voltage"""
-        val = self._get_value("bca_2_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def bca_2_current(self) -> Optional[float]:
-        """Battery Charger Assembly 2 Current"""
-        val = self._get_value("bca_2_current")
-        return None if val is None else float(val)
-
-    @property
-    def bca_3_voltage(self) -> Optional[float]:
-        """Battery Charger Assembly 3 Voltage"""
-        val = self._get_value("bca_3_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def bca_3_current(self) -> Optional[float]:
-        """Battery Charger Assembly 3 Current"""
-        val = self._get_value("bca_3_current")
-        return None if val is None else float(val)
-
-    @property
-    def bca_4_voltage(self) -> Optional[float]:
-        """Battery Charger Assembly 4 Voltage"""
-        val = self._get_value("bca_4_voltage")
-        return None if val is None else float(val)
-
-    @property
-    def bca_4_current(self) -> Optional[float]:
-        """Battery Charger Assembly 4 Current"""
-        val = self._get_value("bca_4_current")
-        return None if val is None else float(val)
-    
-    @property
-    def bca_1_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Status"""
-        value = self._get_value("bca_1_status")
-        mapping = {0: "Normal", 1: "No Data", 2: "Missing Data", 3: "Extra Data"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def bca_2_status(self) -> Optional[str]:
-        """Battery Charger Assembly 2 Status"""
-        value = self._get_value("bca_2_status")
-        mapping = {0: "Normal", 1: "No Data", 2: "Missing Data", 3: "Extra Data"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def bca_3_status(self) -> Optional[str]:
-        """Battery Charger Assembly 3 Status"""
-        value = self._get_value("bca_3_status")
-        mapping = {0: "Normal", 1: "No Data", 2: "Missing Data", 3: "Extra Data"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def bca_4_status(self) -> Optional[str]:
-        """Battery Charger Assembly 4 Status"""
-        value = self._get_value("bca_4_status")
-        mapping = {0: "Normal", 1: "No Data", 2: "Missing Data", 3: "Extra Data"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def bca_1_ch1_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Channel 1 Status"""
-        value = self._get_value("bca_1_ch1_status")
-        bca_mapping = {
-            0: "No History - a charge has not been initiated yet", 1: "Presently charging", 
-            2: "Task completed normally", 3: "Task terminated due to stop switch being toggled", 
-            4: "Task terminated due to an open circuit error", 5: "Task terminated due to Wrong Batt or Hi-imp", 
-            6: "Task terminated due to an over-temperature error", 7: "Amp-hour capacity test result OK", 
-            8: "Amp-hour capacity test error", 9: "Task terminated due to low charge slope error", 
-            10: "Task terminated due to power error", 11: "Task terminated due to reverse-polarity error", 
-            12: "Task terminated due to a short-circuit error", 13: "Task terminated due to a time-out error", 
-            14: "Task terminated due to an external-temperature error", 15: "Discharge", 
-            16: "Wait on Discharge", 17: "Wait on Charge"
-        }
-        return self._decode_status(value, bca_mapping)
-    
-    @property
-    def bca_1_ch2_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Channel 2 Status"""
-        value = self._get_value("bca_1_ch2_status")
-        bca_mapping = {
-            0: "No History - a charge has not been initiated yet", 1: "Presently charging", 
-            2: "Task completed normally", 3: "Task terminated due to stop switch being toggled", 
-            4: "Task terminated due to an open circuit error", 5: "Task terminated due to Wrong Batt or Hi-imp", 
-            6: "Task terminated due to an over-temperature error", 7: "Amp-hour capacity test result OK", 
-            8: "Amp-hour capacity test error", 9: "Task terminated due to low charge slope error", 
-            10: "Task terminated due to power error", 11: "Task terminated due to reverse-polarity error", 
-            12: "Task terminated due to a short-circuit error", 13: "Task terminated due to a time-out error", 
-            14: "Task terminated due to an external-temperature error", 15: "Discharge", 
-            16: "Wait on Discharge", 17: "Wait on Charge"
-        }
-        return self._decode_status(value, bca_mapping)
-    
-    @property
-    def bca_1_ch3_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Channel 3 Status"""
-        value = self._get_value("bca_1_ch3_status")
-        bca_mapping = {
-            0: "No History - a charge has not been initiated yet", 1: "Presently charging", 
-            2: "Task completed normally", 3: "Task terminated due to stop switch being toggled", 
-            4: "Task terminated due to an open circuit error", 5: "Task terminated due to Wrong Batt or Hi-imp", 
-            6: "Task terminated due to an over-temperature error", 7: "Amp-hour capacity test result OK", 
-            8: "Amp-hour capacity test error", 9: "Task terminated due to low charge slope error", 
-            10: "Task terminated due to power error", 11: "Task terminated due to reverse-polarity error", 
-            12: "Task terminated due to a short-circuit error", 13: "Task terminated due to a time-out error", 
-            14: "Task terminated due to an external-temperature error", 15: "Discharge", 
-            16: "Wait on Discharge", 17: "Wait on Charge"
-        }
-        return self._decode_status(value, bca_mapping)
-    
-    @property
-    def bca_1_ch4_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Channel 4 Status"""
-        value = self._get_value("bca_1_ch4_status")
-        bca_mapping = {
-            0: "No History - a charge has not been initiated yet", 1: "Presently charging", 
-            2: "Task completed normally", 3: "Task terminated due to stop switch being toggled", 
-            4: "Task terminated due to an open circuit error", 5: "Task terminated due to Wrong Batt or Hi-imp", 
-            6: "Task terminated due to an over-temperature error", 7: "Amp-hour capacity test result OK", 
-            8: "Amp-hour capacity test error", 9: "Task terminated due to low charge slope error", 
-            10: "Task terminated due to power error", 11: "Task terminated due to reverse-polarity error", 
-            12: "Task terminated due to a short-circuit error", 13: "Task terminated due to a time-out error", 
-            14: "Task terminated due to an external-temperature error", 15: "Discharge", 
-            16: "Wait on Discharge", 17: "Wait on Charge"
-        }
-        return self._decode_status(value, bca_mapping)
-    
-    @property
-    def bca_1_ch5_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Channel 5 Status"""
-        value = self._get_value("bca_1_ch5_status")
-        bca_mapping = {
-            0: "No History - a charge has not been initiated yet", 1: "Presently charging", 
-            2: "Task completed normally", 3: "Task terminated due to stop switch being toggled", 
-            4: "Task terminated due to an open circuit error", 5: "Task terminated due to Wrong Batt or Hi-imp", 
-            6: "Task terminated due to an over-temperature error", 7: "Amp-hour capacity test result OK", 
-            8: "Amp-hour capacity test error", 9: "Task terminated due to low charge slope error", 
-            10: "Task terminated due to power error", 11: "Task terminated due to reverse-polarity error", 
-            12: "Task terminated due to a short-circuit error", 13: "Task terminated due to a time-out error", 
-            14: "Task terminated due to an external-temperature error", 15: "Discharge", 
-            16: "Wait on Discharge", 17: "Wait on Charge"
-        }
-        return self._decode_status(value, bca_mapping)
-    
-    @property
-    def bca_1_ch6_status(self) -> Optional[str]:
-        """Battery Charger Assembly 1 Channel 6 Status"""
-        value = self._get_value("bca_1_ch6_status")
-        bca_mapping = {
-            0: "No History - a charge has not been initiated yet", 1: "Presently charging", 
-            2: "Task completed normally", 3: "Task terminated due to stop switch being toggled", 
-            4: "Task terminated due to an open circuit error", 5: "Task terminated due to Wrong Batt or Hi-imp", 
-            6: "Task terminated due to an over-temperature error", 7: "Amp-hour capacity test result OK", 
-            8: "Amp-hour capacity test error", 9: "Task terminated due to low charge slope error", 
-            10: "Task terminated due to power error", 11: "Task terminated due to reverse-polarity error", 
-            12: "Task terminated due to a short-circuit error", 13: "Task terminated due to a time-out error", 
-            14: "Task terminated due to an external-temperature error", 15: "Discharge", 
-            16: "Wait on Discharge", 17: "Wait on Charge"
-        }
-        return self._decode_status(value, bca_mapping)
-    
-    @property
-    def depressurization_pump_voltage(self) -> Optional[float]:
-        """Depressurization Pump Voltage"""
-        val = self._get_value("depressurization_pump_voltage")
-        return None if val is None else float(val)
-    
-    @property
-    def depressurization_pump_switch(self) -> Optional[str]:
-        """Depressurization Pump Switch Position"""
-        value = self._get_value("depressurization_pump_switch")
-        mapping = {0: "Off-Ok", 1: "Not-Off Ok", 2: "Not-Off Failed"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def mss_mt_position(self) -> Optional[float]:
-        """Mobile Servicing System Mobile Transporter Position"""
-        val = self._get_value("mss_mt_position")
-        return None if val is None else float(val)
-    
-    @property
-    def ssrms_base_location(self) -> Optional[str]:
-        """Space Station Remote Manipulator System Base Location"""
-        value = self._get_value("ssrms_base_location")
-        mapping = {
-            1: "Lab", 2: "Node3", 4: "Node2", 7: "MBS PDGF 1", 8: "MBS PDGF 2", 
-            11: "MBS PDGF 3", 13: "MBS PDGF 4", 14: "FGB", 16: "POA", 
-            19: "SSRMS Tip LEE", 63: "Undefined"
-        }
-        return self._decode_status(value, mapping)
-    
-    @property
-    def ssrms_operating_base(self) -> Optional[str]:
-        """Space Station Remote Manipulator System Operating Base"""
-        value = self._get_value("ssrms_operating_base")
-        mapping = {0: "Lee A", 5: "Lee B"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def ssrms_sr_joint(self) -> Optional[float]:
-        """SSRMS Shoulder Roll Joint Position"""
-        val = self._get_value("ssrms_sr_joint")
-        return None if val is None else float(val)
-
-    @property
-    def ssrms_sy_joint(self) -> Optional[float]:
-        """SSRMS Shoulder Yaw Joint Position"""
-        val = self._get_value("ssrms_sy_joint")
-        return None if val is None else float(val)
-
-    @property
-    def ssrms_sp_joint(self) -> Optional[float]:
-        """SSRMS Shoulder Pitch Joint Position"""
-        val = self._get_value("ssrms_sp_joint")
-        return None if val is None else float(val)
-
-    @property
-    def ssrms_ep_joint(self) -> Optional[float]:
-        """SSRMS Elbow Pitch Joint Position"""
-        val = self._get_value("ssrms_ep_joint")
-        return None if val is None else float(val)
-
-    @property
-    def ssrms_wp_joint(self) -> Optional[float]:
-        """SSRMS Wrist Pitch Joint Position"""
-        val = self._get_value("ssrms_wp_joint")
-        return None if val is None else float(val)
-
-    @property
-    def ssrms_wy_joint(self) -> Optional[float]:
-        """SSRMS Wrist Yaw Joint Position"""
-        val = self._get_value("ssrms_wy_joint")
-        return None if val is None else float(val)
-
-    
-    @property
-    def ssrms_wr_joint(self) -> Optional[float]:
-        """SSRMS Wrist Roll Joint Position"""
-        val = self._get_value("ssrms_wr_joint")
-        return None if val is None else float(val)
-    
-    @property
-    def ssrms_tip_lee_status(self) -> Optional[str]:
-        """SSRMS Tip Latching End Effector Status"""
-        value = self._get_value("ssrms_tip_lee_status")
-        mapping = {0: "Released", 1: "Captive", 2: "Captured"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def spdm_base_location(self) -> Optional[str]:
-        """Special Purpose Dexterous Manipulator Base Location"""
-        value = self._get_value("spdm_base_location")
-        mapping = {
-            1: "Lab", 2: "Node3", 4: "Node2", 7: "MBS PDGF 1", 8: "MBS PDGF 2", 
-            11: "MBS PDGF 3", 13: "MBS PDGF 4", 14: "FGB", 16: "POA", 
-            19: "SSRMS Tip LEE", 63: "Undefined"
-        }
-        return self._decode_status(value, mapping)
-    
-    @property
-    def spdm_1_sr_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Shoulder Roll Joint Position"""
-        val = self._get_value("spdm_1_sr_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_1_sy_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Shoulder Yaw Joint Position"""
-        val = self._get_value("spdm_1_sy_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_1_sp_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Shoulder Pitch Joint Position"""
-        val = self._get_value("spdm_1_sp_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_1_ep_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Elbow Pitch Joint Position"""
-        val = self._get_value("spdm_1_ep_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_1_wp_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Wrist Pitch Joint Position"""
-        val = self._get_value("spdm_1_wp_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_1_wy_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Wrist Yaw Joint Position"""
-        val = self._get_value("spdm_1_wy_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_1_wr_joint(self) -> Optional[float]:
-        """SPDM Arm 1 Wrist Roll Joint Position"""
-        val = self._get_value("spdm_1_wr_joint")
-        return None if val is None else float(val)
-    
-    @property
-    def spdm_1_otcm_status(self) -> Optional[str]:
-        """SPDM Arm 1 Orbital Tool Change Mechanism Status"""
-        value = self._get_value("spdm_1_otcm_status")
-        mapping = {0: "Released", 1: "Captive", 2: "Captured"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def spdm_2_sr_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Shoulder Roll Joint Position"""
-        val = self._get_value("spdm_2_sr_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_2_sy_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Shoulder Yaw Joint Position"""
-        val = self._get_value("spdm_2_sy_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_2_sp_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Shoulder Pitch Joint Position"""
-        val = self._get_value("spdm_2_sp_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_2_ep_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Elbow Pitch Joint Position"""
-        val = self._get_value("spdm_2_ep_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_2_wp_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Wrist Pitch Joint Position"""
-        val = self._get_value("spdm_2_wp_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_2_wy_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Wrist Yaw Joint Position"""
-        val = self._get_value("spdm_2_wy_joint")
-        return None if val is None else float(val)
-
-    @property
-    def spdm_2_wr_joint(self) -> Optional[float]:
-        """SPDM Arm 2 Wrist Roll Joint Position"""
-        val = self._get_value("spdm_2_wr_joint")
-        return None if val is None else float(val)
-    
-    @property
-    def spdm_2_otcm_status(self) -> Optional[str]:
-        """SPDM Arm 2 Orbital Tool Change Mechanism Status"""
-        value = self._get_value("spdm_2_otcm_status")
-        mapping = {0: "Released", 1: "Captive", 2: "Captured"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def spdm_body_roll_joint(self) -> Optional[float]:
-        """SPDM Body Roll Joint Position"""
-        val = self._get_value("spdm_body_roll_joint")
-        return None if val is None else float(val)
-    
-    @property
-    def spdm_body_status(self) -> Optional[str]:
-        """SPDM Body Status"""
-        value = self._get_value("spdm_body_status")
-        mapping = {0: "Released", 1: "Captive", 2: "Captured"}
-        return self._decode_status(value, mapping)
-    
-
-    @property
-    def mbs_mcas_status(self) -> Optional[str]:
-        """Mobile Base System Mobile Cart Assembly Status"""
-        value = self._get_value("mbs_mcas_status")
-        mapping = {0: "Released", 1: "Captured"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def mbs_poa_status(self) -> Optional[str]:
-        """Mobile Base System Payload Orbital Adapter Status"""
-        value = self._get_value("mbs_poa_status")
-        mapping = {0: "Released", 1: "Captive", 2: "Captured"}
-        return self._decode_status(value, mapping)
-    
-    @property
-    def russian_station_mode(self) -> Optional[str]:
-        """Russian Segment Station Mode"""
-        val = self._get_value("russian_station_mode")
-        return None if val is None else str(val)
-
-    @property
-    def kurs_equipment_1(self) -> Optional[str]:
-        """Kurs Rendezvous Equipment 1 Status"""
-        val = self._get_value("kurs_equipment_1")
-        return None if val is None else str(val)
-
-    @property
-    def kurs_equipment_2(self) -> Optional[str]:
-        """Kurs Rendezvous Equipment 2 Status"""
-        val = self._get_value("kurs_equipment_2")
-        return None if val is None else str(val)
-
-    @property
-    def kurs_p1_p2_failure(self) -> Optional[bool]:
-        """Kurs P1/P2 Channel Failure Status"""
-        val = self._get_value("kurs_p1_p2_failure")
-        return None if val is None else bool(val)
-
-    @property
-    def kurs_range(self) -> Optional[float]:
-        """Kurs Target Range (meters)"""
-        val = self._get_value("kurs_range")
-        return None if val is None else float(val)
-
-    @property
-    def kurs_range_rate(self) -> Optional[float]:
-        """Kurs Target Range Rate (m/s)"""
-        val = self._get_value("kurs_range_rate")
-        return None if val is None else float(val)
-
-    @property
-    def kurs_test_mode(self) -> Optional[bool]:
-        """Kurs Test Mode Status"""
-        val = self._get_value("kurs_test_mode")
-        return None if val is None else bool(val)
-
-    @property
-    def kurs_capture_signal(self) -> Optional[bool]:
-        """Kurs Capture Signal Status"""
-        val = self._get_value("kurs_capture_signal")
-        return None if val is None else bool(val)
-
-    @property
-    def kurs_target_acquisition(self) -> Optional[bool]:
-        """Kurs Target Acquisition Status"""
-        val = self._get_value("kurs_target_acquisition")
-        return None if val is None else bool(val)
-
-    @property
-    def kurs_functional_mode(self) -> Optional[bool]:
-        """Kurs Functional Mode Status"""
-        val = self._get_value("kurs_functional_mode")
-        return None if val is None else bool(val)
-
-    @property
-    def kurs_standby_mode(self) -> Optional[bool]:
-        """Kurs Standby Mode Status"""
-        val = self._get_value("kurs_standby_mode")
-        return None if val is None else bool(val)
-
-    @property
-    def sm_docking_flag(self) -> Optional[bool]:
-        """Service Module Docking Flag"""
-        val = self._get_value("sm_docking_flag")
-        return None if val is None else bool(val)
-
-    @property
-    def sm_forward_dock_engaged(self) -> Optional[bool]:
-        """Service Module Forward Docking Port Engaged"""
-        val = self._get_value("sm_forward_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def sm_aft_dock_engaged(self) -> Optional[bool]:
-        """Service Module Aft Docking Port Engaged"""
-        val = self._get_value("sm_aft_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def sm_nadir_dock_engaged(self) -> Optional[bool]:
-        """Service Module Nadir Docking Port Engaged"""
-        val = self._get_value("sm_nadir_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def fgb_nadir_dock_engaged(self) -> Optional[bool]:
-        """Functional Cargo Block Nadir Docking Port Engaged"""
-        val = self._get_value("fgb_nadir_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def sm_nadir_udm_dock_engaged(self) -> Optional[bool]:
-        """Service Module Nadir Universal Docking Module Port Engaged"""
-        val = self._get_value("sm_nadir_udm_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def mrm1_dock_engaged(self) -> Optional[bool]:
-        """Mini Research Module 1 Docking Port Engaged"""
-        val = self._get_value("mrm1_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def mrm2_dock_engaged(self) -> Optional[bool]:
-        """Mini Research Module 2 Docking Port Engaged"""
-        val = self._get_value("mrm2_dock_engaged")
-        return None if val is None else bool(val)
-
-    @property
-    def sm_hooks_closed(self) -> Optional[bool]:
-        """Service Module Docking Hooks Closed"""
-        val = self._get_value("sm_hooks_closed")
-        return None if val is None else bool(val)
-
-    @property
-    def russian_attitude_mode(self) -> Optional[str]:
-        """Russian Segment Attitude Control Mode"""
-        val = self._get_value("russian_attitude_mode")
-        return None if val is None else str(val)
-
-    @property
-    def russian_motion_control(self) -> Optional[str]:
-        """Russian Segment Motion Control Mode"""
-        val = self._get_value("russian_motion_control")
-        return None if val is None else str(val)
-
-    @property
-    def russian_free_drift_prep(self) -> Optional[bool]:
-        """Russian Segment Free Drift Preparation"""
-        val = self._get_value("russian_free_drift_prep")
-        return None if val is None else bool(val)
-
-    @property
-    def russian_thruster_terminated(self) -> Optional[bool]:
-        """Russian Segment Thruster Terminated Status"""
-        val = self._get_value("russian_thruster_terminated")
-        return None if val is None else bool(val)
-
-    @property
-    def russian_dynamic_mode(self) -> Optional[bool]:
-        """Russian Segment Dynamic Mode Status"""
-        val = self._get_value("russian_dynamic_mode")
-        return None if val is None else bool(val)
-
-    @property
-    def year(self) -> Optional[int]:
-        """Current Year"""
-        val = self._get_value("year")
-        return None if val is None else int(val)
-    
+    Has every ISS node property (iss.cabin_temperature, ...), each one read
+    lock-free and consistent. snapshot() copies the whole block at one
+    consistent point. Picklable as its name, so it can be handed to
+    multiprocessing workers.
+    """
+    _iss_node_catalog = ISS._iss_node_catalog
 
+    def __init__(self, name: str):
+        from multiprocessing.shared_memory import SharedMemory
+        try:
+            self._shm = SharedMemory(name=name, track=False)
+        except TypeError:
+            self._shm = SharedMemory(name=name)
+            # before 3.13 attaching also registers the block to be removed
+            # when this process's resource tracker exits, which would take it
+            # away from the publisher. Only the creating process keeps that
+            if name not in _shared_blocks:
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+        magic, count, crc, _, _ = _SHARED_HEADER.unpack_from(self._shm.buf)
+        if (magic, count, crc) != (_SHARED_MAGIC, len(ISS.node_names), _SharedLayout.catalog_crc()):
+            self._shm.close()
+            raise ValueError(f"{name} is not an ISS block published with this catalog")
+        self.name = name
+        self._layout = _SharedLayout(self._shm.buf)
+        self._types = [kind if kind in _DECODERS else int for kind in ISS._iss_slot_kinds]
+        self._columns = [ArrayStore._column_id(kind) for kind in ISS._iss_slot_kinds]
+        # snapshots are copies of this with the block's contents put in
+        self._empty = ArrayStore(ISS._iss_slot_items, ISS._iss_slot_kinds)
+        self._subscribed = b"\x01" * len(ISS.node_names)
+
+    def __reduce__(self):
+        return SharedISS, (self.name,)
+
+    def _consistent(self, read, *args):
+        """read(*args), retried until no write overlapped it"""
+        counters = self._layout.counters
+        while True:
+            version = counters[0]
+            if not version & 1:
+                result = read(*args)
+                if counters[0] == version:
+                    return result
+            sleep(0)
+
+    def _read(self, slot):
+        layout = self._layout
+        if not layout.valid[slot]:
+            return None
+        column = self._columns[slot]
+        if not column:
+            return self._types[slot](layout.values[slot])
+        if column == 1:
+            return layout.codes[slot]
+        offset = _SharedLayout.text_offsets[slot]
+        # a cut multi-byte character at the end is dropped
+        return bytes(layout.text[offset + 1:offset + 1 + layout.text[offset]]).decode(errors="ignore")
+
+    def _get_value(self, name):
+        return self._consistent(self._read, ISS._iss_node_slots[name])
+
+    def get(self, name: str):
+        """the same value the property of that name returns"""
+        return getattr(self, name)
+
+    @property
+    def seq(self) -> int:
+        """ISS.seq of the last update the publisher wrote"""
+        return self._layout.counters[1]
+
+    def age(self, name: str) -> Optional[float]:
+        stamp = self._layout.stamps[ISS._iss_node_slots[name]]
+        return None if stamp == _NEVER else monotonic() - stamp
+
+    def vector(self) -> memoryview:
+        """zero-copy view of every numeric value by slot, live rather than consistent"""
+        return self._layout.values
+
+    def _copy(self):
+        return bytes(self._shm.buf[:_SharedLayout.size])
+
+    def snapshot(self) -> ISSSnapshot:
+        """every node copied out of the block at one consistent point"""
+        raw = self._consistent(self._copy)
+        store = copy.copy(self._empty)
+        store.text = [None] * len(ISS.node_names)
+        store.values = array("d", raw[_SharedLayout.values_at:_SharedLayout.stamps_at])
+        store.stamps = array("d", raw[_SharedLayout.stamps_at:_SharedLayout.codes_at])
+        store.codes = array("i", raw[_SharedLayout.codes_at:_SharedLayout.valid_at])
+        store.valid = bytearray(raw[_SharedLayout.valid_at:_SharedLayout.text_at])
+        for slot, offset in _SharedLayout.text_offsets.items():
+            if store.valid[slot]:
+                start = _SharedLayout.text_at + offset
+                store.text[slot] = raw[start + 1:start + 1 + raw[start]].decode(errors="ignore")
+        store.seq = _SHARED_HEADER.unpack_from(raw)[4]
+        store._bind_columns()
+        store._load_objects()
+        return ISSSnapshot(store, self._subscribed)
+
+    def close(self):
+        if self._layout is not None:
+            self._layout.release()
+            self._layout = None
+            self._shm.close()
+
+    def __del__(self):
+        # the views have to go before SharedMemory's own cleanup closes the mapping
+        if getattr(self, "_layout", None) is not None:
+            self.close()
+
+
+_install_node_properties(SharedISS)
+
+
+class AsyncISS:
+    """asyncio front end for ISS.
+
+    Properties read straight through to the wrapped ISS. Updates reach the
+    event loop through one sink that wakes the loop once per burst, not
+    once per update.
+    """
+    def __init__(self, iss: Optional[ISS] = None, **kwargs):
+        self.iss = iss if iss is not None else ISS(**kwargs)
+        self._bridge = None
+        self._connected = None
+        # (slot mask or None for everything, buffer, event) per updates() iterator
+        self._streams = []
+        # slot -> futures waiting in next_value()
+        self._waiters = {}
+
+    def __getattr__(self, name):
+        return getattr(self.iss, name)
+
+    def _attach(self):
+        if self._bridge is None:
+            # asyncio is imported by the methods that need it, plain
+            # `import iss_wrapper` stays free of it
+            import asyncio
+            loop = asyncio.get_running_loop()
+            self._connected = asyncio.Event()
+            self._bridge = self.iss.add_sink(_LoopBridge(loop, self._deliver))
+            self.iss.add_status_listener(_StatusBridge(loop, self._connected))
+            if self.iss.is_connected:
+                self._connected.set()
+        return self._bridge
+
+    async def connect(self, *args, **kwargs):
+        """ISS.connect() with the same arguments, await connected() for the stream.
+
+        ISS.connect() blocks (for wait=True up to its timeout), so it runs in
+        the loop's default executor while the loop carries on.
+        """
+        bridge = self._attach()
+        await bridge.loop.run_in_executor(None, lambda: self.iss.connect(*args, **kwargs))
+        if self.iss.is_connected:
+            self._connected.set()
+
+    async def connected(self, timeout: Optional[float] = None):
+        """wait until the client is streaming"""
+        import asyncio
+        self._attach()
+        await asyncio.wait_for(self._connected.wait(), timeout)
+
+    def _deliver(self, batch):
+        for wanted, buffer, event in self._streams:
+            matched = [NodeUpdate(ISS.node_names[slot], _label(slot, value), stamp)
+                       for slot, value, stamp in batch if wanted is None or wanted[slot]]
+            if matched:
+                buffer.extend(matched)
+                event.set()
+        if self._waiters:
+            for slot, value, stamp in batch:
+                for future in self._waiters.pop(slot, ()):
+                    if not future.done():
+                        future.set_result(_label(slot, value))
+
+    async def updates(self, nodes=None, groups=None, maxlen: Optional[int] = None):
+        """async iterator of NodeUpdate for the named nodes and groups, or everything.
+
+        maxlen bounds the backlog kept for a slow consumer, dropping the oldest.
+        """
+        import asyncio
+        self._attach()
+        wanted = None
+        if nodes is not None or groups is not None:
+            wanted = bytearray(len(ISS.node_names))
+            for slot in ISS._select(nodes, groups):
+                wanted[slot] = 1
+        buffer = deque(maxlen=maxlen)
+        event = asyncio.Event()
+        stream = (wanted, buffer, event)
+        self._streams.append(stream)
+        try:
+            while True:
+                while buffer:
+                    yield buffer.popleft()
+                event.clear()
+                await event.wait()
+        finally:
+            self._streams.remove(stream)
+
+    async def next_value(self, name: str, timeout: Optional[float] = None):
+        """wait for the node's next update and return its value"""
+        import asyncio
+        bridge = self._attach()
+        slot = ISS._iss_node_slots[name]
+        future = bridge.loop.create_future()
+        self._waiters.setdefault(slot, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            # still listed when it timed out or was cancelled, an update pops the list
+            waiters = self._waiters.get(slot)
+            if waiters is not None and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._waiters[slot]
@@ -0,0 +1,617 @@
+import argparse
+import asyncio
+import functools
+import json
+import os
+import platform
+import sys
+import random
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+
+import iss_wrapper
+from iss_wrapper import _ReplayUpdate
+
+# a raw string the way the feed would send it for each declared type,
+# anything else is a StatusMap and gets a status code
+_SAMPLE_RAW = {float: "101.325", int: "1", bool: "1", str: "GMT 291/12:00:00"}
+
+
+def _ns(fn, number):
+    """best of five runs, in ns per call"""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def _feed(iss):
+    """push one update per node through the listener like lightstreamer would"""
+    listener = iss._listener
+    raw = {}
+    for name, (item, kind, _) in iss._iss_node_catalog.items():
+        raw[item] = _SAMPLE_RAW.get(kind, "1")
+        listener.onItemUpdate(_ReplayUpdate(item, raw[item]))
+    return raw
+
+
+_VIDEO_ITEMS = tuple(iss_wrapper.STATUS_MAPS["video_source"].codes().items())
+
+
+class _LegacyISS(iss_wrapper.ISS):
+    """the property shapes from before values were decoded at ingest"""
+    def __init__(self, raw):
+        super().__init__()
+        self._data = raw
+
+    def _get_value(self, name):
+        if name in self._iss_telemetry_nodes:
+            return self._data.get(self._iss_telemetry_nodes[name])
+        return None
+
+    @property
+    def lab_ppco2(self):
+        val = self._get_value("lab_ppco2")
+        return None if val is None else float(val)
+
+    @property
+    def video_downlink_1(self):
+        value = self._get_value("video_downlink_1")
+        # stands in for the 69 entry dict literal each read used to build
+        video_mapping = dict(_VIDEO_ITEMS)
+        try:
+            return video_mapping.get(int(value))
+        except (ValueError, TypeError):
+            return str(value)
+
+
+def bench_property_reads(number=200000):
+    """ns per property read, raw strings decoded per read vs decoded at ingest"""
+    iss = iss_wrapper.ISS()
+    raw = _feed(iss)
+    legacy = _LegacyISS(raw)
+
+    before = _ns(lambda: legacy.lab_ppco2, number)
+    after = _ns(lambda: iss.lab_ppco2, number)
+    print(f"float property read  before: {before:8.1f} ns  after: {after:8.1f} ns")
+
+
+def _bytes_per_read(read, number=1000):
+    tracemalloc.start()
+    try:
+        read()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        for _ in range(number):
+            read()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def bench_status_reads(number=200000):
+    """ns and peak bytes per status read, per-call dict literal vs shared StatusMap"""
+    iss = iss_wrapper.ISS()
+    raw = _feed(iss)
+    legacy = _LegacyISS(raw)
+
+    before = _ns(lambda: legacy.video_downlink_1, number)
+    after = _ns(lambda: iss.video_downlink_1, number)
+    print(f"status property read before: {before:8.1f} ns  after: {after:8.1f} ns")
+    print(f"status read peak alloc before: {_bytes_per_read(lambda: legacy.video_downlink_1):6d} B"
+          f"  after: {_bytes_per_read(lambda: iss.video_downlink_1):6d} B")
+
+
+def bench_stores(number=200000):
+    """ns per read from the dict store vs the array store, and one pass over all channels.
+
+    The array store is the default, its reads must not be slower than the dict store's.
+    """
+    stores = {}
+    for store in ("dict", "array"):
+        stores[store] = iss_wrapper.ISS(store=store)
+        _feed(stores[store])
+    slot = iss_wrapper.ISS._iss_node_slots["lab_ppco2"]
+    # alternated so a noisy stretch on the machine doesn't favour either store
+    gets = dict.fromkeys(stores, float("inf"))
+    for _ in range(3):
+        for store, iss in stores.items():
+            gets[store] = min(gets[store], _ns(lambda get=iss._store.get: get(slot), number))
+    for store, iss in stores.items():
+        read = _ns(lambda: iss.lab_ppco2, number)
+        check = _ns(lambda: sum(1 for value in iss.vector() if value > 100.0), number // 100)
+        print(f"{store:5s} store  get: {gets[store]:6.1f} ns  float property read: {read:8.1f} ns"
+              f"  all-channel check: {check / 1000:8.1f} us")
+    assert gets["array"] <= gets["dict"], "array store reads slower than dict store reads"
+
+
+def bench_staleness(number=20000):
+    """cost of age() for one node and stale() across the whole catalog"""
+    iss = iss_wrapper.ISS()
+    _feed(iss)
+    print(f"age(name): {_ns(lambda: iss.age('lab_ppco2'), number):8.1f} ns"
+          f"  stale(all nodes): {_ns(lambda: iss.stale(5.0), number // 10) / 1000:8.1f} us")
+
+
+def bench_snapshot_stress(readers=8, seconds=2.0):
+    """snapshots/s and updates/s with many threads snapshotting while one thread streams updates.
+
+    That no snapshot is torn is checked by tests/test_snapshot.py.
+    """
+    iss = iss_wrapper.ISS()
+    listener = iss._listener
+    float_slots = [slot for slot, kind in enumerate(iss._iss_slot_kinds) if kind is float]
+    items = [iss._iss_slot_items[slot] for slot in float_slots]
+    stop = threading.Event()
+    writes = [0]
+    reads = [0] * readers
+
+    def write():
+        i = 0
+        while not stop.is_set():
+            i += 1
+            listener.onItemUpdate(_ReplayUpdate(items[(i - 1) % len(items)], str(i)))
+        writes[0] = i
+
+    def read(index):
+        while not stop.is_set():
+            iss.snapshot()
+            reads[index] += 1
+
+    threads = [threading.Thread(target=write)]
+    threads += [threading.Thread(target=read, args=(index,)) for index in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print(f"snapshot stress, {readers} readers: {sum(reads) / seconds:10.0f} snapshots/s"
+          f"  {writes[0] / seconds:10.0f} updates/s")
+
+
+_NOISY = ("cmg_1_vibration", "attitude_roll_error", "ssrms_sr_joint", "ssrms_ep_joint")
+
+
+def _noisy_stream(updates=20000, seed=7):
+    """slow drift plus sensor jitter on a few analog channels, as (item, raw) pairs"""
+    rng = random.Random(seed)
+    items = [iss_wrapper.ISS._iss_telemetry_nodes[name] for name in _NOISY]
+    level = [0.0] * len(items)
+    stream = []
+    for i in range(updates):
+        index = i % len(items)
+        level[index] += rng.gauss(0.0, 0.002)
+        stream.append((items[index], repr(round(level[index] + rng.gauss(0.0, 0.01), 4))))
+    return stream
+
+
+def bench_deadband(updates=20000):
+    """callbacks dispatched for a noisy stream with and without deadbands"""
+    stream = _noisy_stream(updates)
+    for label, band in (("no deadband", None), ("deadband 0.05 + hysteresis 0.02", 0.05)):
+        iss = iss_wrapper.ISS()
+        listener = iss._listener
+        events = [0]
+
+        def count(name, value):
+            events[0] += 1
+
+        iss.on_change(list(_NOISY), count, deadband=band, hysteresis=0.02)
+        start = time.perf_counter()
+        for item, raw in stream:
+            listener.onItemUpdate(_ReplayUpdate(item, raw))
+        elapsed = time.perf_counter() - start
+        print(f"{label:32s} {events[0]:6d} of {len(stream)} updates dispatched"
+              f"  {len(stream) / elapsed:9.0f} updates/s")
+
+
+def bench_coalesce(updates=200000, window=0.05):
+    """downstream calls per update, one per update vs one per coalesced batch"""
+    iss = iss_wrapper.ISS()
+    items = iss._iss_slot_items
+    batches = []
+    dispatcher = iss.coalesce(batches.append, window=window)
+    start = time.perf_counter()
+    for i in range(updates):
+        iss._listener.onItemUpdate(_ReplayUpdate(items[i % len(items)], str(i)))
+    elapsed = time.perf_counter() - start
+    iss.remove_sink(dispatcher)
+    dispatcher.close()
+    delivered = sum(len(batch) for batch in batches)
+    print(f"coalesced {updates} updates in {elapsed:5.2f}s into {len(batches)} batches"
+          f" of {delivered / len(batches):5.0f} nodes ({updates / len(batches):7.0f} updates each)")
+
+
+def bench_async_bridge(updates=100000):
+    """loop wakeups needed to move a burst of updates from the ingest thread into asyncio"""
+    async def run():
+        aiss = iss_wrapper.AsyncISS()
+        stream = aiss.updates()
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        items = aiss.iss._iss_slot_items
+
+        def feed():
+            for i in range(updates):
+                aiss.iss._listener.onItemUpdate(_ReplayUpdate(items[i % len(items)], str(i)))
+
+        start = time.perf_counter()
+        thread = threading.Thread(target=feed)
+        thread.start()
+        await first
+        received = 1
+        while received < updates:
+            await stream.__anext__()
+            received += 1
+        elapsed = time.perf_counter() - start
+        thread.join()
+        await stream.aclose()
+        print(f"async bridge: {updates / elapsed:9.0f} updates/s into the loop"
+              f" with {aiss._bridge.wakeups} loop wakeups")
+
+    asyncio.run(run())
+
+
+def bench_history(capacity=3600, number=200000):
+    """ingest cost with history on, bytes allocated per append, and reading the last minute"""
+    items = iss_wrapper.ISS._iss_telemetry_nodes
+    update = _ReplayUpdate(items["lab_ppco2"], "2.5")
+    for label, enabled in (("history off", False), ("history on", True)):
+        iss = iss_wrapper.ISS()
+        if enabled:
+            iss.enable_history("lab_ppco2", capacity)
+        print(f"{label:12s} ingest: {_ns(lambda: iss._listener.onItemUpdate(update), number):8.1f} ns")
+    ring = iss_wrapper.NodeHistory(capacity)
+    ring.append(1.0, 1.0)
+    print(f"append peak alloc over 1000 appends: {_bytes_per_read(lambda: ring.append(2.5, 2.0)):6d} B")
+    since = time.monotonic() - 60
+    plain = list(zip(iss.history("lab_ppco2")[0], iss.history("lab_ppco2")[1]))
+    print(f"last minute of {capacity} entries  view: {_ns(lambda: iss.history('lab_ppco2', since), number // 10):8.1f} ns"
+          f"  list scan: {_ns(lambda: [pair for pair in plain if pair[0] >= since], number // 100):8.1f} ns")
+
+
+def bench_recorder(updates=500000):
+    """sustained updates/s through a recorder and disk bytes per update"""
+    iss = iss_wrapper.ISS()
+    items = iss._iss_slot_items
+    kinds = iss._iss_slot_kinds
+    raw = [_SAMPLE_RAW.get(kind, "1") for kind in kinds]
+    stream = [_ReplayUpdate(items[i % len(items)], raw[i % len(items)]) for i in range(updates)]
+    directory = tempfile.mkdtemp(prefix="iss-bench-")
+    try:
+        recorder = iss.record(directory, segment_bytes=64 << 20)
+        start = time.perf_counter()
+        for update in stream:
+            iss._listener.onItemUpdate(update)
+        ingested = time.perf_counter() - start
+        iss.stop_recording(recorder)
+        elapsed = time.perf_counter() - start
+        size = sum(os.path.getsize(path) for path in recorder.segments)
+        print(f"recorder: {updates / ingested:9.0f} updates/s ingested, {updates / elapsed:9.0f} updates/s on disk"
+              f"  {size / updates:5.1f} B/update over {len(recorder.segments)} segments")
+    finally:
+        shutil.rmtree(directory)
+
+
+def _record_stream(directory, updates):
+    """a recording of updates cycling through every node, changing each time"""
+    iss = iss_wrapper.ISS()
+    items = iss._iss_slot_items
+    kinds = iss._iss_slot_kinds
+    recorder = iss.record(directory)
+    for i in range(updates):
+        slot = i % len(items)
+        raw = str(i % 2) if kinds[slot] is not float else repr(i / 7)
+        iss._listener.onItemUpdate(_ReplayUpdate(items[slot], raw))
+    iss.stop_recording(recorder)
+    return recorder.segments
+
+
+def bench_replay(updates=300000):
+    """whole ingest pipeline throughput, replaying a recording as fast as possible"""
+    directory = tempfile.mkdtemp(prefix="iss-bench-")
+    try:
+        segments = _record_stream(directory, updates)
+        for label in ("store only", "callbacks + history + coalesce"):
+            iss = iss_wrapper.ISS()
+            dispatcher = None
+            if label != "store only":
+                iss.on_change(list(iss.node_groups["gnc"]), lambda name, value: None)
+                iss.enable_history()
+                dispatcher = iss.coalesce(lambda batch: None)
+            replay = iss.replay(segments, speed=None)
+            start = time.perf_counter()
+            replay.run()
+            elapsed = time.perf_counter() - start
+            if dispatcher is not None:
+                iss.remove_sink(dispatcher)
+                dispatcher.close()
+            print(f"replay {label:31s} {replay.replayed / elapsed:9.0f} updates/s")
+    finally:
+        shutil.rmtree(directory)
+
+
+def bench_saturation(rates=(10000, 100000, 1000000, None), seconds=1.0):
+    """updates/s the wrapper keeps up with from the synthetic feed at rising offered rates"""
+    for rate in rates:
+        iss = iss_wrapper.ISS(transport=functools.partial(iss_wrapper.SyntheticFeed, rate=rate))
+        iss.connect(wait=True, timeout=5)
+        iss.wait_for_initial_snapshot(timeout=5)
+        before = iss._store.seq
+        start = time.perf_counter()
+        time.sleep(seconds)
+        done = iss._store.seq - before
+        elapsed = time.perf_counter() - start
+        iss.disconnect()
+        offered = "unpaced" if rate is None else f"{rate:9d}/s"
+        print(f"synthetic feed offered {offered:>11s}  ingested {done / elapsed:9.0f} updates/s")
+
+
+def bench_initial_snapshot(spacing=0.0001):
+    """time until every node has its first value, waiting on the event vs a fixed sleep(2)"""
+    iss = iss_wrapper.ISS()
+    iss._connect_started = time.monotonic()
+    iss._listener.expect(range(len(iss.node_names)))
+
+    def feed():
+        for item in iss._iss_slot_items:
+            iss._listener.onItemUpdate(_ReplayUpdate(item, "1"))
+            time.sleep(spacing)
+
+    thread = threading.Thread(target=feed)
+    start = time.perf_counter()
+    thread.start()
+    iss.wait_for_initial_snapshot(timeout=10)
+    elapsed = time.perf_counter() - start
+    thread.join()
+    print(f"complete state after {elapsed * 1000:7.1f} ms waiting on first values"
+          f" (time_to_complete_state {iss.time_to_complete_state * 1000:7.1f} ms) vs 2000 ms sleeping")
+
+
+# one property per value type for the per-type read metrics
+_TYPED_PROPERTIES = {
+    "float": "lab_ppco2",
+    "int": "cmgs_online_count",
+    "bool": "attitude_maneuver_in_progress",
+    "status": "video_downlink_1",
+    "text": "gmt_time",
+}
+_PROPERTIES = [name for name, attr in vars(iss_wrapper.ISS).items() if isinstance(attr, property)
+               and name not in ("is_connected", "connection_status", "time_to_complete_state", "shards")]
+
+
+def measure_ingest(number=200000):
+    """updates/s through onItemUpdate cycling through every node, with stats off and on"""
+    metrics = {}
+    for metric, stats in (("ingest_updates_per_s", False), ("ingest_with_stats_updates_per_s", True)):
+        iss = iss_wrapper.ISS()
+        if stats:
+            iss.enable_stats()
+        stream = [_ReplayUpdate(item, _SAMPLE_RAW.get(kind, "1"))
+                  for item, kind in zip(iss._iss_slot_items, iss._iss_slot_kinds)]
+        stream = (stream * (number // len(stream) + 1))[:number]
+        deliver = iss._listener.onItemUpdate
+        best = min(timeit.repeat(lambda: [deliver(update) for update in stream], number=1, repeat=5))
+        metrics[metric] = number / best
+    return metrics
+
+
+def measure_reads(number=200000):
+    """ns per property read by value type, plus _get_value, _decode_status and every property once"""
+    iss = iss_wrapper.ISS()
+    _feed(iss)
+    metrics = {f"read_{kind}_ns": _ns(lambda name=name: getattr(iss, name), number)
+               for kind, name in _TYPED_PROPERTIES.items()}
+    metrics["get_value_ns"] = _ns(lambda: iss._get_value("lab_ppco2"), number)
+    table = iss_wrapper.STATUS_MAPS["video_source"]
+    metrics["decode_status_ns"] = _ns(lambda: iss._decode_status(3, table), number)
+    metrics["read_all_properties_ns"] = _ns(
+        lambda: [getattr(iss, name) for name in _PROPERTIES], number // 200)
+    cmg = iss.node_groups["cmg"]
+    metrics["read_cmg_properties_ns"] = _ns(lambda: {name: getattr(iss, name) for name in cmg}, number // 20)
+    metrics["read_cmg_get_group_ns"] = _ns(lambda: iss.get_group("cmg"), number // 20)
+    metrics["read_cmg_get_many_tuple_ns"] = _ns(lambda: iss.get_many(cmg), number // 20)
+    return metrics
+
+
+def measure_snapshot(number=20000):
+    """ns to take a full-state snapshot and to turn it into a dict"""
+    iss = iss_wrapper.ISS()
+    _feed(iss)
+    snap = iss.snapshot()
+    # an incremental sync after 10 updates, against diffing full state
+    listener = iss._listener
+    for item in list(iss._iss_item_routes)[:10]:
+        listener.onItemUpdate(_ReplayUpdate(item, "2"))
+    seq = iss.seq - 10
+    return {"snapshot_ns": _ns(iss.snapshot, number),
+            "snapshot_as_dict_ns": _ns(snap.as_dict, number // 20),
+            "changes_since_10_ns": _ns(lambda: iss.changes_since(seq), number)}
+
+
+def measure_memory():
+    """bytes allocated by one ISS object and its populated store, per catalog node"""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        iss = iss_wrapper.ISS()
+        _feed(iss)
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return {"memory_bytes_per_node": size / len(iss.node_names)}
+
+
+def measure_metrics(number=2000):
+    """ns per Prometheus scrape render, unchanged data (cached) vs after an update"""
+    iss = iss_wrapper.ISS()
+    _feed(iss)
+    exporter = iss_wrapper.MetricsExporter(iss, port=None)
+    update = _ReplayUpdate(iss._iss_telemetry_nodes["lab_ppco2"], "2.5")
+
+    def changed():
+        iss._listener.onItemUpdate(update)
+        exporter.render()
+
+    return {"metrics_render_cached_ns": _ns(exporter.render, number),
+            "metrics_render_changed_ns": _ns(changed, number // 10)}
+
+
+def measure_synthetic(seconds=0.5):
+    """updates/s the whole pipeline ingests from an unpaced local feed"""
+    iss = iss_wrapper.ISS(transport=functools.partial(iss_wrapper.SyntheticFeed, rate=None))
+    iss.connect(wait=True, timeout=5)
+    iss.wait_for_initial_snapshot(timeout=5)
+    before = iss._store.seq
+    start = time.perf_counter()
+    time.sleep(seconds)
+    done = iss._store.seq - before
+    elapsed = time.perf_counter() - start
+    iss.disconnect()
+    return {"synthetic_updates_per_s": done / elapsed}
+
+
+def measure_broadcast(seconds=0.5):
+    """updates/s a BroadcastFeed client takes in from a broadcaster over a Unix socket"""
+    directory = tempfile.mkdtemp()
+    address = os.path.join(directory, "iss.sock")
+    upstream = iss_wrapper.ISS(transport=functools.partial(iss_wrapper.SyntheticFeed, rate=None))
+    broadcaster = upstream.broadcast(address)
+    upstream.connect(wait=True, timeout=5)
+    iss = iss_wrapper.ISS(transport=functools.partial(iss_wrapper.BroadcastFeed, address=address))
+    iss.connect(wait=True, timeout=5)
+    iss.wait_for_initial_snapshot(timeout=5)
+    before = iss._store.seq
+    start = time.perf_counter()
+    time.sleep(seconds)
+    done = iss._store.seq - before
+    elapsed = time.perf_counter() - start
+    iss.disconnect()
+    upstream.stop_broadcast(broadcaster)
+    upstream.disconnect()
+    shutil.rmtree(directory)
+    return {"broadcast_updates_per_s": done / elapsed}
+
+
+def measure_shared(number=20000):
+    """ns for a SharedISS property read and snapshot, and for the publisher's write per update"""
+    iss = iss_wrapper.ISS()
+    _feed(iss)
+    publisher = iss.share()
+    reader = iss_wrapper.SharedISS(publisher.name)
+    slot = iss._iss_node_slots["lab_ppco2"]
+    result = {"shared_read_ns": _ns(lambda: reader.lab_ppco2, number * 10),
+              "shared_snapshot_ns": _ns(reader.snapshot, number),
+              "shared_write_ns": _ns(lambda: publisher.on_update(slot, 1.0, 0.0), number * 10)}
+    reader.close()
+    iss.stop_sharing(publisher)
+    return result
+
+
+_IMPORT_ALLOC = "import tracemalloc; tracemalloc.start(); import iss_wrapper; print(tracemalloc.get_traced_memory()[0])"
+
+
+def measure_startup(runs=5):
+    """cumulative -X importtime of a bare import iss_wrapper, and the bytes it allocates"""
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    here = os.path.dirname(os.path.abspath(iss_wrapper.__file__))
+
+    def python(*args):
+        return subprocess.run([sys.executable, *args], cwd=here, env=env,
+                              capture_output=True, text=True, check=True)
+
+    # the first run may have to write the bytecode cache
+    python("-c", "import iss_wrapper")
+    times = []
+    for _ in range(runs):
+        report = python("-X", "importtime", "-c", "import iss_wrapper").stderr
+        line = [line for line in report.splitlines() if line.rstrip().endswith("| iss_wrapper")][-1]
+        times.append(int(line.split("|")[1]))
+    return {"import_us": min(times),
+            "import_alloc_bytes": int(python("-c", _IMPORT_ALLOC).stdout)}
+
+
+SUITE = (measure_startup, measure_ingest, measure_reads, measure_snapshot, measure_memory,
+         measure_metrics, measure_synthetic, measure_broadcast, measure_shared)
+
+
+def run_suite():
+    """every SUITE metric plus where it ran, ready for json.dump"""
+    metrics = {}
+    for measure in SUITE:
+        metrics.update(measure())
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "time": time.time(),
+        "metrics": metrics,
+    }
+
+
+def _higher_is_better(metric):
+    return metric.endswith("_per_s")
+
+
+def compare(results, baseline, threshold=0.15):
+    """metrics more than threshold (a fraction) worse than baseline, as messages"""
+    regressions = []
+    for metric, value in results["metrics"].items():
+        old = baseline["metrics"].get(metric)
+        if not old:
+            continue
+        change = (old - value) / old if _higher_is_better(metric) else (value - old) / old
+        if change > threshold:
+            regressions.append(f"{metric}: {old:.1f} -> {value:.1f} ({change:+.0%} worse)")
+    return regressions
+
+
+def run_all():
+    """the before/after comparisons behind earlier changes, printed"""
+    bench_property_reads()
+    bench_status_reads()
+    bench_stores()
+    bench_staleness()
+    bench_snapshot_stress()
+    bench_deadband()
+    bench_coalesce()
+    bench_async_bridge()
+    bench_initial_snapshot()
+    bench_history()
+    bench_recorder()
+    bench_replay()
+    bench_saturation()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ISS wrapper benchmarks, no network needed")
+    parser.add_argument("--json", metavar="PATH", help="write the suite results here")
+    parser.add_argument("--baseline", metavar="PATH", help="results from an earlier --json run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="fraction a metric may get worse than the baseline (default 0.15)")
+    parser.add_argument("--all", action="store_true", help="also run the printed comparison benchmarks")
+    args = parser.parse_args(argv)
+
+    results = run_suite()
+    for metric, value in results["metrics"].items():
+        print(f"{metric:32s} {value:14.1f}")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.all:
+        run_all()
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,43 +2,42 @@ import iss_wrapper
 import time
 
 
+labels = {
+    "gmt_time": "GMT Time",
+    "cabin_pressure": "Cabin Pressure",
+    "cabin_temperature": "Cabin Temperature",
+    "solar_beta_angle": "Solar Beta Angle",
+    "cmgs_online_count": "CMGs Online",
+    "cmg_1_online": "CMG 1 Status",
+    "attitude_roll_error": "Attitude Roll Error",
+    "state_vector_x_pos": "X Position",
+    "state_vector_y_pos": "Y Position",
+    "state_vector_z_pos": "Z Position",
+    "lab_ppo2": "Lab O2 Pressure",
+    "lab_ppn2": "Lab N2 Pressure",
+    "lab_ppco2": "Lab CO2 Pressure",
+}
+
+
+def show(name, value):
+    print(f"{labels[name]}: {value}")
+
 
 iss = iss_wrapper.ISS()
-iss.connect()
-time.sleep(1) # this is required to allow time to connect
+try:
+    iss.connect(wait=True, timeout=10)
+    connected = True
+except TimeoutError:
+    connected = False
 
 
-if iss.is_connected:
+if connected:
+    # printed as each value changes, no need to poll them all
+    iss.on_change(list(labels), show)
     try:
         while True:
-            print(f"GMT Time: {iss.gmt_time}")
-
-            print(f"Cabin Pressure: {iss.cabin_pressure}")
-
-            print(f"Cabin Temperature: {iss.cabin_temperature}")
-
-            print(f"Solar Beta Angle: {iss.solar_beta_angle}")
-
-            print(f"CMGs Online: {iss.cmgs_online_count}")
-
-            print(f"CMG 1 Status: {iss.cmg_1_online}")
-
-            print(f"Attitude Roll Error: {iss.attitude_roll_error}")
-
-            print(f"X Position: {iss.state_vector_x_pos} meters")
-
-            print(f"Y Position: {iss.state_vector_y_pos} meters")
-
-            print(f"Z Position: {iss.state_vector_z_pos} meters")
-
-            print(f"Lab O2 Pressure: {iss.lab_ppo2}")
-
-            print(f"Lab N2 Pressure: {iss.lab_ppn2}")
-
-            print(f"Lab CO2 Pressure: {iss.lab_ppco2}")
-
-            time.sleep(5)  # Update every 5 seconds
+            time.sleep(1)
     except KeyboardInterrupt:
         print("Stopping...")
 else:
-    print("Failed to connect")
\ No newline at end of file
+    print("Failed to connect")
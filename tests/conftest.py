@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+
+import iss_wrapper
+
+
+@pytest.fixture
+def update():
+    """update(iss, name, raw) pushes one raw value through the listener like lightstreamer would"""
+    def update(iss, name, raw):
+        iss._listener.onItemUpdate(iss_wrapper._ReplayUpdate(iss._iss_telemetry_nodes[name], raw))
+    return update
+
+
+class FakeClient:
+    """a LightstreamerClient that only records what it is asked to do"""
+    Subscription = iss_wrapper._LocalSubscription
+
+    def __init__(self, server, adapter_set):
+        self.server = server
+        self.adapter_set = adapter_set
+        self.listeners = []
+        self.subscriptions = []
+        self.connected = False
+
+    def addListener(self, listener):
+        self.listeners.append(listener)
+
+    def removeListener(self, listener):
+        self.listeners.remove(listener)
+
+    def getStatus(self):
+        return "CONNECTED:WS-STREAMING" if self.connected else "DISCONNECTED"
+
+    def connect(self):
+        self.connected = True
+        for listener in self.listeners:
+            listener.onStatusChange("CONNECTED:WS-STREAMING")
+
+    def disconnect(self):
+        self.connected = False
+        for listener in self.listeners:
+            listener.onStatusChange("DISCONNECTED")
+
+    def subscribe(self, subscription):
+        self.subscriptions.append(subscription)
+
+    def unsubscribe(self, subscription):
+        self.subscriptions.remove(subscription)
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    """every client connect() makes, none of them reaches the network"""
+    made = []
+
+    def client(server, adapter_set):
+        made.append(FakeClient(server, adapter_set))
+        return made[-1]
+
+    monkeypatch.setattr(iss_wrapper, "_lightstreamer", lambda: SimpleNamespace(LightstreamerClient=client))
+    return made
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import iss_wrapper
+
+
+def test_updates_iterator_reads_updates_from_another_thread(update):
+    async def consume():
+        aiss = iss_wrapper.AsyncISS()
+        received = []
+        updates = aiss.updates(groups="lab_environment")
+        first = asyncio.ensure_future(updates.__anext__())
+        await asyncio.sleep(0)
+
+        def feed():
+            update(aiss.iss, "cmg_1_online", "1")
+            for value in range(5):
+                update(aiss.iss, "cabin_temperature", str(value))
+
+        threading.Thread(target=feed).start()
+        received.append(await asyncio.wait_for(first, 5))
+        while len(received) < 5:
+            received.append(await asyncio.wait_for(updates.__anext__(), 5))
+        await updates.aclose()
+        assert not aiss._streams
+        return received
+
+    received = asyncio.run(consume())
+    assert [(name, value) for name, value, _ in received] == [("cabin_temperature", float(value))
+                                                             for value in range(5)]
+
+
+def test_properties_read_through(update):
+    aiss = iss_wrapper.AsyncISS()
+    update(aiss.iss, "cabin_temperature", "21.5")
+    assert aiss.cabin_temperature == 21.5
+
+
+def test_next_value(update):
+    async def wait():
+        aiss = iss_wrapper.AsyncISS()
+        waiting = asyncio.ensure_future(aiss.next_value("cmg_1_online", timeout=5))
+        await asyncio.sleep(0)
+        threading.Thread(target=update, args=(aiss.iss, "cmg_1_online", "1")).start()
+        return await waiting
+
+    assert asyncio.run(wait()) == "IN USE"
+
+
+def test_connected_follows_the_client_status(clients):
+    async def connect():
+        aiss = iss_wrapper.AsyncISS()
+        await aiss.connect(groups="lab_environment")
+        for listener in clients[0].listeners:
+            threading.Thread(target=listener.onStatusChange, args=("CONNECTED:WS-STREAMING",)).start()
+        await aiss.connected(timeout=5)
+
+    asyncio.run(connect())
+
+
+def test_next_value_forgets_a_timed_out_wait():
+    async def wait():
+        aiss = iss_wrapper.AsyncISS()
+        try:
+            await aiss.next_value("cmg_1_online", timeout=0.01)
+        except asyncio.TimeoutError:
+            pass
+        return aiss._waiters
+
+    assert asyncio.run(wait()) == {}
+
+
+def test_connect_runs_off_the_event_loop(clients, monkeypatch):
+    # the stream never comes up on its own, connect(wait=True) blocks until the loop says so
+    monkeypatch.setattr(iss_wrapper.ISSStatusUpdater, "onStatusChange", lambda self, status: None)
+
+    async def connect():
+        aiss = iss_wrapper.AsyncISS()
+        waiting = asyncio.ensure_future(aiss.connect(groups="lab_environment", wait=True, timeout=5))
+        while not clients:
+            await asyncio.sleep(0.01)
+        assert not waiting.done()
+        aiss.iss._streaming.set()
+        await asyncio.wait_for(waiting, 5)
+
+    asyncio.run(connect())
@@ -0,0 +1,24 @@
+import iss_wrapper_bench as bench
+
+
+def _results(**metrics):
+    return {"metrics": metrics}
+
+
+def test_compare_flags_regressions_in_either_direction():
+    baseline = _results(ingest_updates_per_s=1000.0, read_float_ns=100.0, snapshot_ns=50.0)
+    results = _results(ingest_updates_per_s=800.0, read_float_ns=120.0, snapshot_ns=40.0)
+    regressions = bench.compare(results, baseline, threshold=0.15)
+    assert [message.split(":")[0] for message in regressions] == ["ingest_updates_per_s", "read_float_ns"]
+    assert bench.compare(results, baseline, threshold=0.25) == []
+
+
+def test_new_metrics_are_not_regressions():
+    assert bench.compare(_results(read_text_ns=100.0), _results()) == []
+
+
+def test_measures_run_offline():
+    metrics = bench.measure_reads(number=200)
+    metrics.update(bench.measure_snapshot(number=20))
+    assert set(metrics) >= {"read_float_ns", "read_status_ns", "snapshot_ns", "snapshot_as_dict_ns"}
+    assert all(value > 0 for value in metrics.values())
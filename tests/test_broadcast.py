@@ -0,0 +1,179 @@
+import functools
+import socket
+import struct
+import time
+
+import pytest
+
+import iss_wrapper
+
+
+def _wait(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _client(address, nodes):
+    iss = iss_wrapper.ISS(transport=functools.partial(iss_wrapper.BroadcastFeed, address=address))
+    iss.connect(nodes=nodes)
+    return iss
+
+
+@pytest.mark.parametrize("unix", [True, False])
+def test_clients_get_the_current_state_then_updates(update, tmp_path, unix):
+    upstream = iss_wrapper.ISS()
+    update(upstream, "cabin_temperature", "21.5")
+    update(upstream, "lab_ppco2", "3.1")
+    broadcaster = upstream.broadcast(str(tmp_path / "iss.sock") if unix else ("127.0.0.1", 0))
+    try:
+        iss = _client(broadcaster.address, ["cabin_temperature", "year"])
+        iss.wait_for_initial_snapshot(nodes=["cabin_temperature"], timeout=5)
+        assert iss.cabin_temperature == 21.5
+        assert iss.year is None
+        assert broadcaster.consumers == 1
+        update(upstream, "cabin_temperature", "22.0")
+        update(upstream, "year", "2026")
+        update(upstream, "lab_ppco2", "3.2")
+        _wait(lambda: iss.year == 2026)
+        assert iss.cabin_temperature == 22.0
+        # never subscribed, never sent
+        assert iss._store.get(iss._iss_node_slots["lab_ppco2"]) is None
+        iss.disconnect()
+    finally:
+        upstream.stop_broadcast(broadcaster)
+    if unix:
+        assert not (tmp_path / "iss.sock").exists()
+
+
+def test_upstream_status_is_relayed():
+    upstream = iss_wrapper.ISS()
+    broadcaster = upstream.broadcast(("127.0.0.1", 0))
+    try:
+        iss = _client(broadcaster.address, ["cabin_temperature"])
+        _wait(lambda: iss.connection_status == upstream.connection_status)
+        broadcaster.onStatusChange("CONNECTED:WS-STREAMING")
+        _wait(lambda: iss.connection_status == "CONNECTED:WS-STREAMING")
+        iss.disconnect()
+        assert iss.connection_status == "DISCONNECTED"
+    finally:
+        upstream.stop_broadcast(broadcaster)
+
+
+def test_lost_broadcaster_is_retried(update):
+    upstream = iss_wrapper.ISS()
+    broadcaster = upstream.broadcast(("127.0.0.1", 0))
+    address = broadcaster.address
+    iss = iss_wrapper.ISS(transport=functools.partial(
+        iss_wrapper.BroadcastFeed, address=address, retry=0.05))
+    iss.connect(nodes=["cabin_temperature"])
+    try:
+        _wait(lambda: broadcaster.consumers == 1)
+        upstream.stop_broadcast(broadcaster)
+        _wait(lambda: iss.connection_status == "DISCONNECTED:WILL-RETRY")
+        update(upstream, "cabin_temperature", "19.0")
+        broadcaster = upstream.broadcast(address)
+        # a new connection starts over with the full state
+        _wait(lambda: iss.cabin_temperature == 19.0)
+    finally:
+        iss.disconnect()
+        upstream.stop_broadcast(broadcaster)
+
+
+def test_refusals():
+    upstream = iss_wrapper.ISS()
+    with pytest.raises(ValueError):
+        upstream.broadcast(("127.0.0.1", 0), policy="newest")
+    with pytest.raises(ValueError):
+        iss_wrapper.BroadcastFeed()
+
+
+@pytest.mark.parametrize("body", [b"{x}", b"[]", b'{"items": 5}', b'{"items": [[1]]}'])
+def test_bad_frame_drops_only_that_client(update, body):
+    upstream = iss_wrapper.ISS()
+    broadcaster = upstream.broadcast(("127.0.0.1", 0))
+    try:
+        bad = socket.create_connection(broadcaster.address)
+        bad.sendall(iss_wrapper._BROADCAST_MAGIC + struct.pack("<I", len(body)) + body)
+        bad.settimeout(5)
+        # the broadcaster hangs up on it
+        while bad.recv(1 << 16):
+            pass
+        iss = _client(broadcaster.address, ["cabin_temperature"])
+        _wait(lambda: broadcaster.consumers == 1)
+        update(upstream, "cabin_temperature", "21.5")
+        iss.wait_for_initial_snapshot(timeout=5)
+        assert iss.cabin_temperature == 21.5
+        assert broadcaster._thread.is_alive()
+        iss.disconnect()
+        bad.close()
+    finally:
+        upstream.stop_broadcast(broadcaster)
+
+
+def test_a_client_that_breaks_the_broadcaster_is_dropped(update, monkeypatch):
+    upstream = iss_wrapper.ISS()
+    broadcaster = upstream.broadcast(("127.0.0.1", 0))
+    want = broadcaster._want
+    calls = []
+
+    def fail_once(consumer, items):
+        calls.append(consumer)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        want(consumer, items)
+
+    monkeypatch.setattr(broadcaster, "_want", fail_once)
+    try:
+        first = _client(broadcaster.address, ["cabin_temperature"])
+        _wait(lambda: calls and broadcaster.consumers == 0)
+        first.disconnect()
+        iss = _client(broadcaster.address, ["cabin_temperature"])
+        _wait(lambda: broadcaster.consumers == 1)
+        update(upstream, "cabin_temperature", "21.5")
+        _wait(lambda: iss.cabin_temperature == 21.5)
+        assert broadcaster.error is None
+        iss.disconnect()
+    finally:
+        upstream.stop_broadcast(broadcaster)
+
+
+def test_a_failing_broadcaster_stops_and_disconnects(update, monkeypatch):
+    upstream = iss_wrapper.ISS()
+    broadcaster = upstream.broadcast(("127.0.0.1", 0))
+    iss = iss_wrapper.ISS(transport=functools.partial(
+        iss_wrapper.BroadcastFeed, address=broadcaster.address, retry=0.05))
+    iss.connect(nodes=["cabin_temperature"])
+    try:
+        _wait(lambda: broadcaster.consumers == 1)
+        monkeypatch.setattr(broadcaster, "_fan_out", lambda: 1 / 0)
+        _wait(lambda: not broadcaster._thread.is_alive())
+        assert isinstance(broadcaster.error, ZeroDivisionError)
+        assert broadcaster.consumers == 0
+        assert broadcaster not in upstream._listener.taps
+        _wait(lambda: iss.connection_status == "DISCONNECTED:WILL-RETRY")
+    finally:
+        iss.disconnect()
+        upstream.stop_broadcast(broadcaster)
+
+
+def test_feed_hangs_up_on_an_unknown_node_index():
+    server = socket.create_server(("127.0.0.1", 0))
+    server.settimeout(5)
+    feed = iss_wrapper.BroadcastFeed(address=server.getsockname()[:2], retry=0.05)
+    feed.connect()
+    try:
+        for _ in range(2):
+            sock, _ = server.accept()
+            with sock:
+                sock.recv(1 << 16)
+                # one known item, then a record for the item at index 1
+                sock.sendall(iss_wrapper._BROADCAST_MAGIC + iss_wrapper._frame({"items": ["USLAB000059"]})
+                             + iss_wrapper._pack_record(1, 21.5, time.time()))
+                sock.settimeout(5)
+                # the feed closes the connection and comes back
+                assert sock.recv(1 << 16) == b""
+    finally:
+        feed.disconnect()
+        server.close()
@@ -0,0 +1,54 @@
+import math
+from array import array
+
+import pytest
+
+import iss_wrapper
+
+NAMES = ("cabin_temperature", "year", "sm_docking_flag", "cmg_1_online", "lab_ppco2")
+
+
+@pytest.mark.parametrize("store", ["array", "dict"])
+def test_get_many_matches_the_properties(update, store):
+    iss = iss_wrapper.ISS(store=store)
+    for name, raw in [("cabin_temperature", "21.5"), ("year", "2024"), ("sm_docking_flag", "1"),
+                      ("cmg_1_online", "1"), ("gmt_time", "291/10:00:00.000")]:
+        update(iss, name, raw)
+    expected = tuple(getattr(iss, name) for name in NAMES)
+    assert iss.get_many(NAMES) == expected == (21.5, 2024, True, "IN USE", None)
+    assert iss.get_many(NAMES, form="dict") == dict(zip(NAMES, expected))
+    values = iss.get_many(NAMES, form="array")
+    assert isinstance(values, array) and list(values[:4]) == [21.5, 2024.0, 1.0, 1.0]
+    assert math.isnan(values[4])
+    assert iss.get_many(["gmt_time"]) == ("291/10:00:00.000",)
+
+
+def test_get_group(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    group = iss.get_group("lab_environment")
+    assert list(group) == list(iss.node_groups["lab_environment"])
+    assert group["cabin_temperature"] == 21.5
+
+
+def test_refusals(clients):
+    iss = iss_wrapper.ISS()
+    with pytest.raises(ValueError):
+        iss.get_many(["cabin_temp"])
+    with pytest.raises(ValueError):
+        iss.get_many(NAMES, form="list")
+    with pytest.raises(ValueError):
+        iss.get_many(["gmt_time"], form="array")
+    with pytest.raises(ValueError):
+        iss.get_group("cabin")
+    iss.connect(nodes=["cabin_temperature"])
+    with pytest.raises(iss_wrapper.NodeNotSubscribedError):
+        iss.get_many(NAMES)
+
+
+@pytest.mark.parametrize("names", [[], ()])
+def test_get_many_of_nothing(names):
+    iss = iss_wrapper.ISS()
+    assert iss.get_many(names) == ()
+    assert iss.get_many(names, form="dict") == {}
+    assert iss.get_many(names, form="array") == array("d")
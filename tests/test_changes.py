@@ -0,0 +1,44 @@
+import iss_wrapper
+
+
+def test_changes_since(update):
+    iss = iss_wrapper.ISS()
+    assert iss.changes_since(0) == ({}, 0)
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "sm_docking_flag", "1")
+    changes, seq = iss.changes_since(0)
+    assert changes == {"cabin_temperature": 21.5, "sm_docking_flag": True}
+    assert seq == iss.seq == 2
+    assert iss.changes_since(seq) == ({}, 2)
+    update(iss, "cabin_temperature", "22.0")
+    update(iss, "cabin_temperature", "22.5")
+    assert iss.changes_since(seq) == ({"cabin_temperature": 22.5}, 4)
+    # a seq from another object starts over
+    assert iss.changes_since(100)[0].keys() == {"cabin_temperature", "sm_docking_flag"}
+
+
+def test_changes_past_the_log_and_across_its_wrap(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "year", "2025")
+    _, seq = iss.changes_since(0)
+    for n in range(iss_wrapper._CHANGE_LOG + 10):
+        update(iss, "cabin_temperature", str(n))
+    # older than the log, read from a scan of every node
+    changes, seq = iss.changes_since(seq)
+    assert changes == {"cabin_temperature": iss_wrapper._CHANGE_LOG + 9.0}
+    update(iss, "lab_ppco2", "3.1")
+    update(iss, "year", "2026")
+    assert iss.changes_since(seq) == ({"lab_ppco2": 3.1, "year": 2026}, seq + 2)
+    # a window that straddles the end of the ring
+    start = iss.seq - (iss.seq & (iss_wrapper._CHANGE_LOG - 1)) - 3
+    assert set(iss.changes_since(start)[0]) == {"cabin_temperature", "lab_ppco2", "year"}
+
+
+def test_changes_leave_out_removed_shards(clients, update):
+    iss = iss_wrapper.ISS()
+    iss.connect(nodes=["cabin_temperature"])
+    iss.add_shard("gnc", nodes=["year"])
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "year", "2026")
+    iss.remove_shard("gnc")
+    assert iss.changes_since(0) == ({"cabin_temperature": 21.5}, 2)
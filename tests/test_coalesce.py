@@ -0,0 +1,49 @@
+import threading
+
+import iss_wrapper
+
+
+def test_a_window_folds_updates_into_one_batch(update):
+    iss = iss_wrapper.ISS()
+    batches = []
+    dispatcher = iss.coalesce(batches.append, window=60)
+    for value in ("20.0", "20.5", "21.0"):
+        update(iss, "cabin_temperature", value)
+    update(iss, "cmg_1_online", "1")
+    assert dispatcher.pending == 2
+    dispatcher.flush()
+    assert batches == [{"cabin_temperature": 21.0, "cmg_1_online": "IN USE"}]
+    assert batches[0].updates == 4
+    dispatcher.flush()
+    assert len(batches) == 1
+    iss.remove_sink(dispatcher)
+    dispatcher.close()
+
+
+def test_max_count_delivers_early(update):
+    iss = iss_wrapper.ISS()
+    delivered = threading.Event()
+    batches = []
+
+    def receive(batch):
+        batches.append(batch)
+        delivered.set()
+
+    dispatcher = iss.coalesce(receive, window=60, max_count=2, names_or_groups="lab_environment")
+    update(iss, "cabin_temperature", "21.0")
+    update(iss, "cmg_1_online", "1")
+    update(iss, "lab_ppco2", "3.0")
+    assert delivered.wait(5)
+    assert batches == [{"cabin_temperature": 21.0, "lab_ppco2": 3.0}]
+    iss.remove_sink(dispatcher)
+    dispatcher.close()
+
+
+def test_close_delivers_what_is_pending(update):
+    iss = iss_wrapper.ISS()
+    batches = []
+    dispatcher = iss.coalesce(batches.append, window=60)
+    update(iss, "cabin_temperature", "21.0")
+    iss.remove_sink(dispatcher)
+    dispatcher.close()
+    assert batches == [{"cabin_temperature": 21.0}]
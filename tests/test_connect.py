@@ -0,0 +1,42 @@
+import threading
+
+import pytest
+
+import iss_wrapper
+
+
+def test_connect_waits_for_streaming(clients):
+    iss = iss_wrapper.ISS()
+    iss.connect(groups="lab_environment", wait=True, timeout=5)
+    assert iss._streaming.is_set()
+
+
+def test_connect_times_out(clients, monkeypatch):
+    monkeypatch.setattr(iss_wrapper.ISSStatusUpdater, "onStatusChange", lambda self, status: None)
+    with pytest.raises(TimeoutError):
+        iss_wrapper.ISS().connect(groups="lab_environment", wait=True, timeout=0.05)
+
+
+def test_initial_snapshot_waits_for_every_node(clients, update):
+    iss = iss_wrapper.ISS()
+    iss.connect(groups="state_vector")
+    assert iss.time_to_complete_state is None
+    names = iss.node_groups["state_vector"]
+
+    def feed():
+        for name in names:
+            update(iss, name, "1.0")
+
+    threading.Thread(target=feed).start()
+    snap = iss.wait_for_initial_snapshot(timeout=5)
+    assert all(snap.get(name) == 1.0 for name in names)
+    assert iss.time_to_complete_state >= 0
+
+
+def test_initial_snapshot_names_what_is_missing(clients, update):
+    iss = iss_wrapper.ISS()
+    iss.connect(nodes=["cabin_temperature", "lab_ppco2"])
+    update(iss, "cabin_temperature", "21.5")
+    assert iss.wait_for_initial_snapshot(nodes=["cabin_temperature"], timeout=0).cabin_temperature == 21.5
+    with pytest.raises(TimeoutError, match="lab_ppco2"):
+        iss.wait_for_initial_snapshot(timeout=0.05)
@@ -0,0 +1,68 @@
+import pytest
+
+import iss_wrapper
+from iss_wrapper import Deadband
+
+
+def _passed(band, values):
+    return [value for value in values if band.passes(value)]
+
+
+def test_absolute_and_relative_bands():
+    assert _passed(Deadband(absolute=0.5), [10.0, 10.4, 10.6, 10.2, 11.2]) == [10.0, 10.6, 11.2]
+    # 10% of the last value let through, the wider band wins
+    assert _passed(Deadband(absolute=0.5, relative=0.1), [10.0, 10.9, 11.1, 12.3]) == [10.0, 11.1, 12.3]
+
+
+def test_hysteresis_widens_the_band_on_reversal():
+    band = Deadband(absolute=1.0, hysteresis=1.0)
+    assert _passed(band, [0.0, 1.5, 0.0, -0.6, 3.0]) == [0.0, 1.5, -0.6, 3.0]
+
+
+def test_missing_values_pass_once():
+    assert _passed(Deadband(absolute=1.0), [None, None, 1.0, None]) == [1.0, None]
+
+
+def test_set_deadband_filters_callbacks(update):
+    iss = iss_wrapper.ISS()
+    seen = []
+    iss.set_deadband("cabin_temperature", 1.0)
+    iss.on_change("cabin_temperature", lambda name, value: seen.append(value))
+    for value in ("20.0", "20.5", "21.5", "21.0"):
+        update(iss, "cabin_temperature", value)
+    assert seen == [20.0, 21.5]
+    assert iss.cabin_temperature == 21.0
+    iss.set_deadband("cabin_temperature")
+    update(iss, "cabin_temperature", "21.2")
+    assert seen == [20.0, 21.5, 21.2]
+
+
+def test_deadbands_need_numeric_nodes():
+    with pytest.raises(ValueError):
+        iss_wrapper.ISS().set_deadband("cmg_1_online", 1.0)
+
+
+def test_on_change_deadband_belongs_to_its_callback(update):
+    iss = iss_wrapper.ISS()
+    coarse, fine, batches = [], [], []
+    iss.on_change("cabin_temperature", lambda name, value: coarse.append(value), deadband=1.0)
+    iss.on_change("cabin_temperature", lambda name, value: fine.append(value), deadband=0.1)
+    sink = iss.add_sink(type("Sink", (), {"on_update": lambda self, *args: batches.append(args)})())
+    for value in ("20.0", "20.5", "21.5"):
+        update(iss, "cabin_temperature", value)
+    assert coarse == [20.0, 21.5]
+    assert fine == [20.0, 20.5, 21.5]
+    assert len(batches) == 3
+    iss.remove_sink(sink)
+
+
+def test_remove_on_change_drops_its_band(update):
+    iss = iss_wrapper.ISS()
+    seen = []
+    callback = iss.on_change("cabin_temperature", lambda name, value: seen.append(value), deadband=1.0)
+    iss.remove_on_change(callback)
+    assert iss._listener.callback_deadbands[iss._iss_node_slots["cabin_temperature"]] is None
+    iss.on_change("cabin_temperature", callback)
+    for value in ("20.0", "20.5"):
+        update(iss, "cabin_temperature", value)
+    assert seen == [20.0, 20.5]
@@ -0,0 +1,34 @@
+import iss_wrapper
+
+
+def test_values_are_decoded_at_ingest(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "lab_ppco2", "3.25")
+    update(iss, "year", "2024.0")
+    assert iss._store.get(iss._iss_node_slots["lab_ppco2"]) == 3.25
+    assert iss.lab_ppco2 == 3.25
+    assert iss.year == 2024
+
+
+def test_flags_decode_numerically(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "sm_docking_flag", "0")
+    assert iss.sm_docking_flag is False
+    update(iss, "sm_docking_flag", "1.0")
+    assert iss.sm_docking_flag is True
+
+
+def test_unparsable_values_read_as_none(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "lab_ppco2", "N/A")
+    update(iss, "cmg_1_online", "N/A")
+    assert iss.lab_ppco2 is None
+    assert iss.cmg_1_online is None
+
+
+def test_status_codes_map_to_labels(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cmg_1_online", "1.0")
+    assert iss.cmg_1_online == "IN USE"
+    update(iss, "cmg_1_online", "7")
+    assert iss.cmg_1_online is None
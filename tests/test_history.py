@@ -0,0 +1,51 @@
+import math
+
+import pytest
+
+import iss_wrapper
+from iss_wrapper import NodeHistory
+
+
+def test_ring_keeps_the_last_capacity_entries_in_order():
+    history = NodeHistory(3)
+    for stamp in range(1, 6):
+        history.append(stamp * 10.0, float(stamp))
+    stamps, values = history.window()
+    assert list(stamps) == [3.0, 4.0, 5.0]
+    assert list(values) == [30.0, 40.0, 50.0]
+    stamps, values = history.window(since=3.5, until=4.0)
+    assert list(stamps) == [4.0] and list(values) == [40.0]
+
+
+def test_window_is_a_view():
+    history = NodeHistory(4)
+    history.append(1.0, 1.0)
+    stamps, values = history.window()
+    assert isinstance(values, memoryview) and values.obj is history.values
+    history.append(None, 2.0)
+    assert math.isnan(history.window()[1][-1])
+
+
+def test_history_of_nodes(update):
+    iss = iss_wrapper.ISS()
+    iss.enable_history(["cabin_temperature", "cmg_1_online"], capacity=8)
+    for value in ("20.0", "21.0"):
+        update(iss, "cabin_temperature", value)
+    update(iss, "cmg_1_online", "1")
+    stamps, values = iss.history("cabin_temperature")
+    assert list(values) == [20.0, 21.0]
+    assert stamps[0] <= stamps[1]
+    stamps, columns = iss.history_many(["cabin_temperature", "cmg_1_online"])
+    assert len(stamps) == 3
+    assert list(columns["cabin_temperature"]) == [20.0, 21.0, 21.0]
+    assert math.isnan(columns["cmg_1_online"][0]) and columns["cmg_1_online"][2] == 1.0
+    iss.disable_history("cabin_temperature")
+    with pytest.raises(LookupError):
+        iss.history("cabin_temperature")
+
+
+def test_text_nodes_have_no_history():
+    with pytest.raises(ValueError):
+        iss_wrapper.ISS().enable_history("gmt_time")
+    with pytest.raises(ValueError):
+        NodeHistory(0)
@@ -0,0 +1,42 @@
+import iss_wrapper
+
+
+def test_each_object_has_its_own_connection(clients):
+    first, second = iss_wrapper.ISS(), iss_wrapper.ISS()
+    first.connect(groups="lab_environment")
+    assert first.is_connected and not second.is_connected
+    second.connect(groups="cmg_control")
+    first.disconnect()
+    assert not first.is_connected and second.is_connected
+    assert first.connection_status == "DISCONNECTED"
+    assert len(clients) == 2 and not clients[0].connected and clients[1].connected
+
+
+def test_shared_client_is_counted(clients):
+    first = iss_wrapper.ISS(shared_client=True)
+    second = iss_wrapper.ISS(shared_client=True)
+    first.connect(groups="lab_environment")
+    second.connect(groups="cmg_control")
+    assert len(clients) == 1
+    client = clients[0]
+    assert second.is_connected
+    assert len(client.subscriptions) == 2
+    first.disconnect()
+    assert client.connected and len(client.subscriptions) == 1
+    second.disconnect()
+    assert not client.connected and not client.subscriptions
+    assert not iss_wrapper._shared_clients
+
+
+class _Statuses(list):
+    def onStatusChange(self, status):
+        self.append(status)
+
+
+def test_status_listeners_follow_reconnects(clients):
+    iss = iss_wrapper.ISS()
+    statuses = iss.add_status_listener(_Statuses())
+    iss.connect(groups="lab_environment")
+    iss.disconnect()
+    iss.connect(groups="lab_environment")
+    assert statuses == ["CONNECTED:WS-STREAMING", "DISCONNECTED", "CONNECTED:WS-STREAMING"]
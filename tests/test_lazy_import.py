@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+import typing
+
+from iss_wrapper import ISS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_loads_neither_lightstreamer_nor_asyncio():
+    check = ("import sys, iss_wrapper\n"
+             "print(sorted(name for name in ('lightstreamer', 'asyncio', 'json', 'random') if name in sys.modules))")
+    done = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert done.stdout.strip() == "[]"
+
+
+def test_every_catalog_node_has_a_property():
+    for name, (_, kind, doc) in ISS._iss_node_catalog.items():
+        prop = getattr(ISS, name)
+        assert isinstance(prop, property) and prop.__doc__ == doc
+    assert typing.get_type_hints(ISS.cabin_temperature.fget)["return"] == typing.Optional[float]
+    assert typing.get_type_hints(ISS.cmg_1_online.fget)["return"] == typing.Optional[str]
+
+
+def test_waste_water_tank_alias(update):
+    iss = ISS()
+    update(iss, "waste_water_tank_qty", "42.0")
+    assert iss.waste_water_tank == iss.waste_water_tank_qty == 42.0
@@ -0,0 +1,86 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+import iss_wrapper
+
+
+def test_node_series(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "cmg_1_online", "1")
+    text = iss_wrapper.MetricsExporter(iss, port=None).render()
+    assert 'iss_node_value{name="cabin_temperature",group="lab_environment"} 21.5' in text
+    assert 'iss_node_status_code{name="cmg_1_online",group="cmg_control"} 1' in text
+    assert 'iss_node_status{name="cmg_1_online",group="cmg_control",state="IN USE"} 1' in text
+    assert "lab_ppco2" not in text
+    assert "iss_connected 0" in text
+
+
+def test_node_block_is_cached_until_an_update(update):
+    iss = iss_wrapper.ISS()
+    exporter = iss_wrapper.MetricsExporter(iss, port=None)
+    update(iss, "cabin_temperature", "21.5")
+    exporter.render()
+    exporter.render()
+    assert exporter.renders == 1
+    update(iss, "cabin_temperature", "22.5")
+    assert "22.5" in exporter.render()
+    assert exporter.renders == 2
+
+
+def test_stats_series(update):
+    iss = iss_wrapper.ISS()
+    iss.enable_stats()
+    update(iss, "cabin_temperature", "21.5")
+    text = iss_wrapper.MetricsExporter(iss, port=None).render()
+    assert "iss_update_rate " in text
+    assert "# TYPE iss_callback_latency_microseconds histogram" in text
+
+
+def test_served_over_http(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    exporter = iss.serve_metrics(port=0)
+    try:
+        host, port = exporter.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert 'iss_node_value{name="cabin_temperature",group="lab_environment"} 21.5' in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://{host}:{port}/other", timeout=5)
+    finally:
+        exporter.close()
+
+
+def test_free_text_nodes_are_not_exported(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "gmt_time", "291/10:00:00.000")
+    update(iss, "cabin_temperature", "21.5")
+    text = iss_wrapper.MetricsExporter(iss, port=None).render()
+    assert 'iss_node_value{name="cabin_temperature",' in text
+    assert "gmt_time" not in text
+
+
+def test_callback_latency_histogram_has_a_sum(update):
+    iss = iss_wrapper.ISS()
+    iss.enable_stats()
+    iss.on_change("cabin_temperature", lambda name, value: None)
+    update(iss, "cabin_temperature", "21.5")
+    text = iss_wrapper.MetricsExporter(iss, port=None).render()
+    lines = dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+    assert lines["iss_callback_latency_microseconds_count"] == "1"
+    assert float(lines["iss_callback_latency_microseconds_sum"]) > 0
+
+
+def test_update_counts_add_up(update):
+    iss = iss_wrapper.ISS()
+    iss.enable_stats()
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "cmg_1_online", "1")
+    text = iss_wrapper.MetricsExporter(iss, port=None).render()
+    counts = [int(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+              if line.startswith("iss_updates_total{")]
+    assert sum(counts) == 2
+    assert 'iss_updates_total{group="cmg_control"} 1' in text
@@ -0,0 +1,42 @@
+import pytest
+
+import iss_wrapper
+
+
+def test_callbacks_fire_on_changes_only(update):
+    iss = iss_wrapper.ISS()
+    seen = []
+    iss.on_change(["cabin_temperature", "cmg_1_online"], lambda *change: seen.append(change))
+    for value in ("21.5", "21.5", "22.0"):
+        update(iss, "cabin_temperature", value)
+    update(iss, "cmg_1_online", "1")
+    update(iss, "lab_ppco2", "3.0")
+    assert seen == [("cabin_temperature", 21.5), ("cabin_temperature", 22.0), ("cmg_1_online", "IN USE")]
+
+
+def test_groups_and_removal(update):
+    iss = iss_wrapper.ISS()
+    seen = []
+    callback = iss.on_change("cmg_temperatures", lambda name, value: seen.append(name))
+    update(iss, "cmg_1_spin_motor_temp", "30.0")
+    iss.remove_on_change(callback, "cmg_1_spin_motor_temp")
+    update(iss, "cmg_1_spin_motor_temp", "31.0")
+    update(iss, "cmg_2_spin_motor_temp", "30.0")
+    iss.remove_on_change(callback)
+    update(iss, "cmg_2_spin_motor_temp", "31.0")
+    assert seen == ["cmg_1_spin_motor_temp", "cmg_2_spin_motor_temp"]
+
+
+def test_a_failing_callback_does_not_stop_the_others(update, capsys):
+    iss = iss_wrapper.ISS()
+    seen = []
+    iss.on_change("cabin_temperature", lambda name, value: 1 / 0)
+    iss.on_change("cabin_temperature", lambda name, value: seen.append(value))
+    update(iss, "cabin_temperature", "21.5")
+    assert seen == [21.5]
+    assert "ZeroDivisionError" in capsys.readouterr().out
+
+
+def test_unknown_names_are_refused():
+    with pytest.raises(ValueError):
+        iss_wrapper.ISS().on_change("cabin_temp", print)
@@ -0,0 +1,109 @@
+import json
+import os
+import struct
+
+import pytest
+
+import iss_wrapper
+
+
+def _values(paths):
+    return [(name, value) for path in paths for name, _, value in iss_wrapper.read_recording(path)]
+
+
+def test_round_trip(update, tmp_path):
+    iss = iss_wrapper.ISS()
+    iss.set_deadband("cabin_temperature", 10.0)
+    recorder = iss.record(str(tmp_path))
+    for name, raw in [("cabin_temperature", "21.5"), ("cabin_temperature", "21.6"), ("year", "2024"),
+                      ("sm_docking_flag", "1"), ("cmg_1_online", "1"), ("gmt_time", "291/10:00:00.000"),
+                      ("lab_ppco2", "N/A")]:
+        update(iss, name, raw)
+    iss.stop_recording(recorder)
+    assert recorder.records == 7
+    # deadbands don't apply to taps
+    assert _values(recorder.segments) == [
+        ("cabin_temperature", 21.5), ("cabin_temperature", 21.6), ("year", 2024), ("sm_docking_flag", True),
+        ("cmg_1_online", "IN USE"), ("gmt_time", "291/10:00:00.000"), ("lab_ppco2", None)]
+
+
+def test_records_split_across_reads(update, tmp_path, monkeypatch):
+    iss = iss_wrapper.ISS()
+    recorder = iss.record(str(tmp_path))
+    for value in ("Standby", "Attitude Hold é", "Free Drift"):
+        update(iss, "gnc_mode", value)
+        update(iss, "cabin_temperature", "21.5")
+    iss.stop_recording(recorder)
+    expected = _values(recorder.segments)
+    # smaller than one record, every record and text spans several reads
+    monkeypatch.setattr(iss_wrapper, "_READ_CHUNK", 7)
+    assert _values(recorder.segments) == expected
+    assert len(expected) == 6
+
+
+def test_segment_layout(update, tmp_path):
+    iss = iss_wrapper.ISS()
+    recorder = iss.record(str(tmp_path))
+    update(iss, "cabin_temperature", "21.5")
+    iss.stop_recording(recorder)
+    (path,) = recorder.segments
+    with open(path, "rb") as file:
+        data = file.read()
+    assert data.startswith(b"ISSREC1\n")
+    (length,) = struct.unpack_from("<I", data, 8)
+    header = json.loads(data[12:12 + length])
+    assert header["nodes"] == list(iss.node_names)
+    slot, tag, _, value = struct.unpack_from("<HBdd", data, 12 + length)
+    assert (slot, tag, value) == (iss._iss_node_slots["cabin_temperature"], 0, 21.5)
+    assert len(data) == 12 + length + 19
+
+
+def test_segments_rotate_by_size(update, tmp_path):
+    iss = iss_wrapper.ISS()
+    # the header takes about 7 KB, leaving room for some 70 records
+    recorder = iss.record(str(tmp_path), segment_bytes=1 << 13)
+    for value in range(1000):
+        update(iss, "cabin_temperature", str(value))
+    iss.stop_recording(recorder)
+    assert len(recorder.segments) > 1
+    assert all(os.path.getsize(path) < (1 << 13) + 19 for path in recorder.segments)
+    assert [value for _, value in _values(recorder.segments)] == [float(value) for value in range(1000)]
+
+
+def test_a_cut_off_record_ends_the_segment(update, tmp_path):
+    iss = iss_wrapper.ISS()
+    recorder = iss.record(str(tmp_path))
+    for value in ("21.5", "22.5"):
+        update(iss, "cabin_temperature", value)
+    iss.stop_recording(recorder)
+    (path,) = recorder.segments
+    os.truncate(path, os.path.getsize(path) - 5)
+    assert _values([path]) == [("cabin_temperature", 21.5)]
+
+
+@pytest.mark.parametrize("cut", [1, 3])
+def test_a_cut_off_text_record_ends_the_segment(update, tmp_path, cut):
+    iss = iss_wrapper.ISS()
+    recorder = iss.record(str(tmp_path))
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "gnc_mode", "Standby é")
+    iss.stop_recording(recorder)
+    (path,) = recorder.segments
+    # 1 leaves half of the é behind
+    os.truncate(path, os.path.getsize(path) - cut)
+    assert _values([path]) == [("cabin_temperature", 21.5)]
+
+
+def _record(iss, directory, value, update):
+    recorder = iss.record(str(directory))
+    update(iss, "cabin_temperature", value)
+    iss.stop_recording(recorder)
+    return recorder.segments
+
+
+def test_recorders_on_one_directory_never_share_a_segment(update, tmp_path):
+    iss = iss_wrapper.ISS()
+    first = _record(iss, tmp_path, "21.5", update)
+    second = _record(iss, tmp_path, "22.5", update)
+    assert set(first).isdisjoint(second)
+    assert [value for _, value in _values(sorted(first + second))] == [21.5, 22.5]
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+import iss_wrapper
+
+
+@pytest.fixture
+def recording(update, tmp_path):
+    """a segment of cabin_temperature 0.0 .. 9.0 and one status change, 10 ms apart"""
+    iss = iss_wrapper.ISS()
+    recorder = iss.record(str(tmp_path))
+    update(iss, "cmg_1_online", "1")
+    for value in range(10):
+        update(iss, "cabin_temperature", str(value))
+        time.sleep(0.01)
+    iss.stop_recording(recorder)
+    return recorder.segments
+
+
+def test_replay_drives_properties_and_callbacks(recording):
+    iss = iss_wrapper.ISS()
+    seen = []
+    iss.on_change("cabin_temperature", lambda name, value: seen.append(value), deadband=4.0)
+    replay = iss.replay(recording, speed=None)
+    replay.run()
+    assert replay.replayed == 11
+    assert iss.cmg_1_online == "IN USE"
+    assert iss.cabin_temperature == 9.0
+    assert seen == [0.0, 5.0]
+
+
+def test_replay_keeps_the_recorded_pacing(recording):
+    started = time.monotonic()
+    iss_wrapper.ISS().replay(recording, speed=2.0).run()
+    # 10 updates 10 ms apart at twice the speed
+    assert time.monotonic() - started >= 0.04
+
+
+def test_seek_delivers_everything_up_to_the_target(recording):
+    stamps = [stamp for _, stamp, _ in iss_wrapper.read_recording(recording[0])]
+    iss = iss_wrapper.ISS()
+    replay = iss.replay(recording, speed=1e-6)
+    replay.seek(stamps[4])
+    replay.start()
+    deadline = time.monotonic() + 5
+    while replay.replayed < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    replay.stop()
+    assert replay.replayed == 5
+    assert iss.cabin_temperature == 3.0
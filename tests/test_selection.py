@@ -0,0 +1,39 @@
+import pytest
+
+import iss_wrapper
+from iss_wrapper import ISS, NodeNotSubscribedError
+
+
+def test_umbrella_groups_join_sections():
+    groups = ISS.node_groups
+    assert groups["cmg"] == groups["cmg_control"] + groups["cmg_temperatures"] + groups["cmg_vibration"]
+    assert "cabin_temperature" in groups["lab_environment"]
+
+
+def test_connect_subscribes_to_the_selection(clients, update):
+    iss = ISS()
+    iss.connect(nodes=["cabin_temperature"], groups="cmg_temperatures")
+    names = ("cabin_temperature",) + ISS.node_groups["cmg_temperatures"]
+    items = [item for sub in clients[0].subscriptions for item in sub.getItems()]
+    assert sorted(items) == sorted(ISS._iss_telemetry_nodes[name] for name in names)
+    update(iss, "cabin_temperature", "21.5")
+    assert iss.cabin_temperature == 21.5
+    assert iss.cmg_1_spin_motor_temp is None
+    with pytest.raises(NodeNotSubscribedError):
+        iss.lab_ppco2
+    snap = iss.snapshot()
+    assert sorted(snap.as_dict()) == sorted(names)
+    with pytest.raises(LookupError):
+        snap.lab_ppco2
+    assert sorted(iss.stale(60)) == sorted(ISS.node_groups["cmg_temperatures"])
+
+
+@pytest.mark.parametrize("selection", [{"groups": "cmgs"}, {"nodes": ["cabin_temp"]}])
+def test_unknown_names_are_refused(clients, selection):
+    with pytest.raises(ValueError):
+        ISS().connect(**selection)
+    assert not clients
+
+
+def test_everything_reads_before_connect():
+    assert iss_wrapper.ISS().lab_ppco2 is None
@@ -0,0 +1,42 @@
+import pytest
+
+from iss_wrapper import ISS, NodeNotSubscribedError
+
+
+def _frequencies(client):
+    return {_section(sub): sub.getRequestedMaxFrequency() for sub in client.subscriptions}
+
+
+def test_one_shard_per_section(clients):
+    iss = ISS()
+    iss.connect(groups="gnc", max_frequency=1, frequencies={"state_vector": "unlimited"})
+    assert sorted(iss.shards) == ["attitude_quaternions", "cmg_control", "state_vector"]
+    assert _frequencies(clients[0]) == {"attitude_quaternions": "1", "cmg_control": "1",
+                                        "state_vector": "unlimited"}
+    for sub in clients[0].subscriptions:
+        assert sub.getItems() == [ISS._iss_telemetry_nodes[name] for name in iss.shards[_section(sub)]]
+
+
+def _section(sub):
+    return ISS._iss_slot_sections[ISS._iss_item_routes[sub.getItems()[0]][0]]
+
+
+def test_shards_come_and_go_on_the_live_client(clients):
+    iss = ISS()
+    iss.connect(groups="lab_environment")
+    iss.add_shard("temps", groups="cmg_temperatures", max_frequency=0.5)
+    assert iss.cmg_1_spin_motor_temp is None
+    assert _frequencies(clients[0])["cmg_temperatures"] == "0.5"
+    iss.set_shard_frequency("temps", 2)
+    assert _frequencies(clients[0])["cmg_temperatures"] == "2"
+    with pytest.raises(ValueError):
+        iss.add_shard("again", nodes=["cabin_temperature"])
+    iss.remove_shard("temps")
+    assert len(clients[0].subscriptions) == 1
+    with pytest.raises(NodeNotSubscribedError):
+        iss.cmg_1_spin_motor_temp
+
+
+def test_add_shard_needs_a_connection():
+    with pytest.raises(RuntimeError):
+        ISS().add_shard("temps", groups="cmg_temperatures")
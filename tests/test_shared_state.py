@@ -0,0 +1,122 @@
+import os
+import pickle
+import subprocess
+import sys
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+import iss_wrapper
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def shared(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    publisher = iss.share()
+    state = iss_wrapper.SharedISS(publisher.name)
+    yield iss, state
+    state.close()
+    iss.stop_sharing(publisher)
+
+
+def test_reads_like_iss(shared, update):
+    iss, state = shared
+    # written by the initial fill
+    assert state.cabin_temperature == 21.5
+    update(iss, "year", "2026")
+    update(iss, "sm_docking_flag", "1")
+    update(iss, "cmg_1_online", "1")
+    update(iss, "gnc_mode", "Standby")
+    update(iss, "lab_ppco2", "bad")
+    for name in ("cabin_temperature", "year", "sm_docking_flag", "cmg_1_online", "gnc_mode",
+                 "lab_ppco2", "lab_ppo2"):
+        assert getattr(state, name) == getattr(iss, name)
+    assert state.seq == iss.seq
+    assert state.age("year") < 60
+    assert state.age("lab_ppo2") is None
+    assert state.vector()[iss_wrapper.ISS._iss_node_slots["cabin_temperature"]] == 21.5
+
+
+def test_snapshot(shared, update):
+    iss, state = shared
+    update(iss, "gnc_mode", "Standby")
+    update(iss, "cmg_1_online", "1")
+    snapshot = state.snapshot()
+    update(iss, "cabin_temperature", "22.0")
+    assert snapshot.cabin_temperature == 21.5
+    assert snapshot.as_dict() == iss.snapshot().as_dict() | {"cabin_temperature": 21.5}
+    assert snapshot.seq == iss.seq - 1
+
+
+def test_long_text_keeps_its_first_bytes(shared, update):
+    iss, state = shared
+    update(iss, "gnc_mode", "é" * 40)
+    # 63 bytes cut the last two-byte character in half, it is dropped
+    assert state.gnc_mode == "é" * 31
+    assert state.snapshot().gnc_mode == "é" * 31
+
+
+def test_pickles_as_its_name(shared):
+    _, state = shared
+    copy = pickle.loads(pickle.dumps(state))
+    assert copy.name == state.name
+    assert copy.cabin_temperature == 21.5
+    copy.close()
+
+
+def test_refuses_other_blocks():
+    block = SharedMemory(create=True, size=iss_wrapper._SharedLayout.size)
+    try:
+        with pytest.raises(ValueError):
+            iss_wrapper.SharedISS(block.name)
+    finally:
+        block.close()
+        block.unlink()
+
+
+# another process whose spawn pool workers attach to the block and exit
+_READERS = """
+import sys
+from multiprocessing import get_context
+import iss_wrapper
+
+def read(state):
+    return state.cabin_temperature
+
+if __name__ == "__main__":
+    state = iss_wrapper.SharedISS(sys.argv[1])
+    with get_context("spawn").Pool(2) as pool:
+        print(pool.map(read, [state] * 4))
+    state.close()
+"""
+
+
+def test_block_outlives_readers_in_another_process(update, tmp_path):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    publisher = iss.share()
+    script = tmp_path / "readers.py"
+    script.write_text(_READERS)
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    done = subprocess.run([sys.executable, str(script), publisher.name], env=env,
+                          capture_output=True, text=True, timeout=60)
+    assert done.returncode == 0, done.stderr
+    assert done.stdout.strip() == "[21.5, 21.5, 21.5, 21.5]"
+    assert "leaked shared_memory" not in done.stderr
+    # the readers' resource tracker exits after them, give it the chance to unlink
+    time.sleep(0.5)
+    state = iss_wrapper.SharedISS(publisher.name)
+    assert state.cabin_temperature == 21.5
+    state.close()
+    iss.stop_sharing(publisher)
+
+
+def test_close_tolerates_a_removed_block():
+    iss = iss_wrapper.ISS()
+    publisher = iss.share()
+    publisher._shm.unlink()
+    iss.stop_sharing(publisher)
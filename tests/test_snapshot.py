@@ -0,0 +1,98 @@
+import sys
+import threading
+
+import pytest
+
+import iss_wrapper
+
+
+def test_snapshot_reads_like_iss(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "cmg_1_online", "1")
+    snap = iss.snapshot()
+    update(iss, "cabin_temperature", "22.5")
+    assert snap.cabin_temperature == snap.get("cabin_temperature") == 21.5
+    assert snap.cmg_1_online == "IN USE"
+    assert snap.seq == 2
+    assert snap.as_dict()["cabin_temperature"] == 21.5
+    assert iss.cabin_temperature == 22.5
+    with pytest.raises(AttributeError):
+        snap.cabin_temperature = 0.0
+
+
+def test_a_write_in_the_middle_of_a_copy_is_retried(update, monkeypatch):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    copy_stamps = iss_wrapper._NodeStore._copy
+    interrupted = []
+
+    def copy_then_write(store):
+        frozen = copy_stamps(store)
+        if not interrupted:
+            # the ingest thread gets in after the stamps, before the values
+            interrupted.append(store.seq)
+            update(iss, "cabin_temperature", "22.5")
+        return frozen
+
+    monkeypatch.setattr(iss_wrapper._NodeStore, "_copy", copy_then_write)
+    snap = iss.snapshot()
+    assert interrupted == [1]
+    assert snap.seq == 2
+    assert snap.cabin_temperature == 22.5
+    assert snap.age("cabin_temperature") is not None
+
+
+def _torn(snap, float_slots):
+    """True unless every float node holds exactly what update seq left it with.
+
+    The writer sends update i to float_slots[(i - 1) % len] with value i.
+    """
+    values = snap._store.vector()
+    seq = snap.seq
+    count = len(float_slots)
+    for position, slot in enumerate(float_slots):
+        if seq <= position:
+            expected = None
+        else:
+            expected = position + 1 + count * ((seq - position - 1) // count)
+        got = values[slot] if snap._store.valid[slot] else None
+        if got != expected or (expected and snap._store.seqs[slot] != expected):
+            return True
+    return False
+
+
+def test_snapshots_are_never_torn(update, readers=4, snapshots=500):
+    iss = iss_wrapper.ISS()
+    float_slots = [slot for slot, kind in enumerate(iss._iss_slot_kinds) if kind is float]
+    names = [iss.node_names[slot] for slot in float_slots]
+    done = threading.Event()
+    torn = []
+
+    def write():
+        i = 0
+        while not done.is_set():
+            i += 1
+            update(iss, names[(i - 1) % len(names)], str(i))
+
+    def read():
+        torn.extend(snap.seq for snap in (iss.snapshot() for _ in range(snapshots))
+                    if _torn(snap, float_slots))
+
+    writer = threading.Thread(target=write)
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    # switch threads often so writes land in the middle of copies
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writer.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        done.set()
+        writer.join()
+        sys.setswitchinterval(interval)
+    assert iss._store.seq > 0
+    assert torn == []
@@ -0,0 +1,74 @@
+import iss_wrapper
+
+
+class _Handler:
+    def cb(self, name, value):
+        pass
+
+
+def test_stats_need_enabling(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    stats = iss.stats()
+    assert stats["status"] == "DISCONNECTED"
+    assert stats["updates"] is None and stats["callbacks"] is None
+
+
+def test_update_counts_and_callback_latency(update):
+    iss = iss_wrapper.ISS()
+    iss.enable_stats()
+    iss.on_change("cabin_temperature", lambda name, value: None)
+    for value in range(5):
+        update(iss, "cabin_temperature", str(value))
+    update(iss, "cmg_1_online", "1")
+    stats = iss.stats()
+    assert stats["updates"] == 6
+    assert stats["updates_per_node"] == {"cabin_temperature": 5, "cmg_1_online": 1}
+    assert stats["updates_per_group"]["lab_environment"] == 5
+    assert stats["updates_per_group"]["cmg"] == 1
+    assert stats["updates_per_section"]["cmg_control"] == 1
+    assert sum(stats["updates_per_section"].values()) == 6
+    assert sum(stats["callback_latency_us"].values()) == 5
+    assert [timing["calls"] for timing in stats["callbacks"].values()] == [5]
+    assert stats["rate_per_s"] >= 0
+
+
+def test_disable_stats_stops_timing_callbacks(update):
+    iss = iss_wrapper.ISS()
+    stats = iss.enable_stats()
+    iss.on_change("cabin_temperature", lambda name, value: None)
+    iss.disable_stats()
+    update(iss, "cabin_temperature", "21.5")
+    assert iss._listener.callback_timer is None
+    assert not stats.callback_times
+    assert not iss._listener.taps
+    assert iss.stats()["updates"] is None
+
+
+def test_queue_depths_and_reconnects(clients, update):
+    iss = iss_wrapper.ISS()
+    dispatcher = iss.coalesce(lambda batch: None, window=60)
+    update(iss, "cabin_temperature", "21.5")
+    assert iss.stats()["queues"] == {"CoalescingDispatcher#0": 1}
+    for _ in range(3):
+        iss.connect(groups="lab_environment")
+    stats = iss.stats()
+    assert stats["reconnects"] == 2
+    assert stats["status_seconds"]["DISCONNECTED"] > 0
+    iss.remove_sink(dispatcher)
+    dispatcher.close()
+
+
+def test_callback_timings_per_subscriber(update):
+    iss = iss_wrapper.ISS()
+    iss.enable_stats()
+    first, second = _Handler(), _Handler()
+    iss.on_change("cabin_temperature", first.cb)
+    iss.on_change("cabin_temperature", second.cb)
+    iss.on_change("cabin_temperature", lambda name, value: None)
+    iss.on_change("cabin_temperature", lambda name, value: None)
+    for value in range(5):
+        update(iss, "cabin_temperature", str(value))
+    callbacks = iss.stats()["callbacks"]
+    assert len(callbacks) == 4
+    assert [timing["calls"] for timing in callbacks.values()] == [5] * 4
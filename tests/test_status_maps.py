@@ -0,0 +1,21 @@
+import pickle
+
+import iss_wrapper
+from iss_wrapper import STATUS_MAPS, StatusMap
+
+
+def test_get_follows_dict_get():
+    table = StatusMap({0: "Lee A", 5: "Lee B"})
+    assert table.get(0) == "Lee A"
+    assert table.get(5) == "Lee B"
+    for code in (None, -1, 3, 6):
+        assert table.get(code) is None
+    assert table.codes() == {0: "Lee A", 5: "Lee B"}
+
+
+def test_tables_are_shared_and_picklable():
+    table = STATUS_MAPS["operating_base"]
+    copy = pickle.loads(pickle.dumps(table))
+    assert copy == table and isinstance(copy, StatusMap)
+    assert STATUS_MAPS["cmg_online"] is iss_wrapper._CMG_ONLINE
+
@@ -0,0 +1,56 @@
+import math
+
+import pytest
+
+import iss_wrapper
+
+
+@pytest.mark.parametrize("store", ["array", "dict"])
+def test_stores_read_back_the_same_values(update, store):
+    iss = iss_wrapper.ISS(store=store)
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "year", "2024")
+    update(iss, "sm_docking_flag", "1")
+    update(iss, "cmg_1_online", "1")
+    update(iss, "gmt_time", "291/10:00:00.000")
+    assert iss.cabin_temperature == 21.5
+    assert iss.year == 2024
+    assert iss.sm_docking_flag is True
+    assert iss.cmg_1_online == "IN USE"
+    assert iss.gmt_time == "291/10:00:00.000"
+    assert iss.lab_ppco2 is None
+
+
+@pytest.mark.parametrize("store", ["array", "dict"])
+def test_vectors_by_slot(update, store):
+    iss = iss_wrapper.ISS(store=store)
+    update(iss, "cabin_temperature", "21.5")
+    update(iss, "cmg_1_online", "1")
+    slot = iss._iss_node_slots["cabin_temperature"]
+    status = iss._iss_node_slots["cmg_1_online"]
+    vector = iss.vector()
+    assert vector[slot] == 21.5
+    assert math.isnan(vector[iss._iss_node_slots["lab_ppco2"]])
+    assert iss.status_codes()[status] == 1
+    assert iss.valid_mask()[slot] == 1
+    assert iss.valid_mask()[iss._iss_node_slots["lab_ppco2"]] == 0
+
+
+def test_array_vector_is_a_live_view(update):
+    iss = iss_wrapper.ISS()
+    vector = iss.vector()
+    update(iss, "cabin_temperature", "21.5")
+    assert vector[iss._iss_node_slots["cabin_temperature"]] == 21.5
+
+
+def test_a_status_code_too_large_for_int32_is_invalid(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cmg_1_online", "1")
+    update(iss, "cmg_1_online", str(1 << 40))
+    assert iss.cmg_1_online is None
+    assert iss.valid_mask()[iss._iss_node_slots["cmg_1_online"]] == 0
+
+
+def test_unknown_store():
+    with pytest.raises(ValueError):
+        iss_wrapper.ISS(store="numpy")
@@ -0,0 +1,51 @@
+import functools
+import random
+
+import iss_wrapper
+from iss_wrapper import ISS, SyntheticFeed
+
+
+def test_synthetic_feed_drives_an_iss():
+    iss = ISS(transport=functools.partial(SyntheticFeed, rate=None))
+    iss.connect(groups=["lab_environment", "cmg_control"], wait=True, timeout=5)
+    snap = iss.wait_for_initial_snapshot(timeout=5)
+    iss.disconnect()
+    assert not iss.is_connected
+    assert isinstance(snap.cabin_temperature, float)
+    assert snap.cmg_1_online in ("NOT IN USE", "IN USE")
+    assert isinstance(snap.cmgs_online_count, int)
+    assert isinstance(snap.gnc_mode, str)
+
+
+def test_the_same_seed_gives_the_same_stream():
+    for name in ("cabin_temperature", "cmg_1_online", "sm_docking_flag", "gmt_time"):
+        slot = ISS._iss_node_slots[name]
+        item, kind = ISS._iss_slot_items[slot], ISS._iss_slot_kinds[slot]
+        first = iss_wrapper._synthetic_values(kind, item, random.Random(1), 64)
+        assert first == iss_wrapper._synthetic_values(kind, item, random.Random(1), 64)
+        assert len(first) == 64
+
+
+def test_floats_stay_within_each_node_range():
+    rng = random.Random(3)
+    for slot, kind in enumerate(ISS._iss_slot_kinds):
+        if kind is float:
+            item = ISS._iss_slot_items[slot]
+            low, high = iss_wrapper._synthetic_range(item)
+            values = [float(raw) for raw in iss_wrapper._synthetic_values(kind, item, rng, 64)]
+            assert low <= min(values) and max(values) <= high, ISS.node_names[slot]
+    mass = ISS._iss_node_catalog["iss_total_mass"][0]
+    assert iss_wrapper._synthetic_range(mass)[0] > 400000
+
+
+def test_shared_clients_are_per_transport():
+    first = ISS(shared_client=True, transport=SyntheticFeed)
+    second = ISS(shared_client=True, transport=SyntheticFeed)
+    other = ISS(shared_client=True, transport=functools.partial(SyntheticFeed, seed=1))
+    for iss in (first, second, other):
+        iss.connect(groups="lab_environment")
+    assert first._client is second._client
+    assert other._client is not first._client
+    for iss in (first, second, other):
+        iss.disconnect()
+    assert not iss_wrapper._shared_clients
@@ -0,0 +1,32 @@
+import time
+
+import iss_wrapper
+
+
+def test_age_of_a_node(update):
+    iss = iss_wrapper.ISS()
+    assert iss.age("cabin_temperature") is None
+    update(iss, "cabin_temperature", "21.5")
+    assert 0 <= iss.age("cabin_temperature") < 1
+
+
+def test_sequence_numbers_count_every_update(update):
+    iss = iss_wrapper.ISS()
+    for value in ("21.5", "21.6"):
+        update(iss, "cabin_temperature", value)
+    update(iss, "lab_ppco2", "3.0")
+    seqs = iss._store.seqs
+    assert iss._store.seq == 3
+    assert seqs[iss._iss_node_slots["cabin_temperature"]] == 2
+    assert seqs[iss._iss_node_slots["lab_ppco2"]] == 3
+
+
+def test_stale_lists_old_and_missing_nodes(update):
+    iss = iss_wrapper.ISS()
+    update(iss, "cabin_temperature", "21.5")
+    stale = iss.stale(60)
+    assert "cabin_temperature" not in stale
+    assert "lab_ppco2" in stale
+    assert len(stale) == len(iss.node_names) - 1
+    time.sleep(0.02)
+    assert "cabin_temperature" in iss.stale(0.01)